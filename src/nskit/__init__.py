@@ -46,8 +46,18 @@ def __get_version() -> str:
     return version
 
 
-__version__ = __get_version()
+# The version and exports are resolved on first access (PEP 562), so e.g. importing nskit.common.io doesn't
+# import the mixer, recipes or vcs (or the package metadata)
+from nskit.common.lazy import LazyAttributes  # noqa: E402
 
-from nskit.mixer import CodeRecipe, Recipe  # noqa: F401, E402
-from nskit.recipes.python import PyRecipe, PyRepoMetadata  # noqa: F401, E402
-from nskit.vcs import Repo  # noqa: F401, E402
+_lazy = LazyAttributes(__name__)
+__getattr__ = _lazy.__getattr__
+__dir__ = _lazy.__dir__
+
+_lazy.register(__get_version, name="__version__")
+
+_lazy.alias("CodeRecipe", "nskit.mixer")
+_lazy.alias("Recipe", "nskit.mixer")
+_lazy.alias("PyRecipe", "nskit.recipes.python")
+_lazy.alias("PyRepoMetadata", "nskit.recipes.python")
+_lazy.alias("Repo", "nskit.vcs")
@@ -1,13 +1,11 @@
 """Generic CLI for nskit recipes."""
 
-import json
 import os
 from pathlib import Path
 from typing import Annotated, Optional, Union
 
 import questionary
 import typer
-import yaml
 from rich import print as rich_print
 from rich.console import Console
 from rich.table import Table
@@ -23,6 +21,7 @@ from nskit.client.env_resolver import EnvVarResolver
 from nskit.client.field_parser import FieldParser
 from nskit.client.models import RecipeInfo
 from nskit.client.utils import get_required_fields_as_dict
+from nskit.common.io import json, yaml
 from nskit.common.models.diff import DiffMode
 from nskit.mixer.components.recipe import Recipe
 
@@ -31,6 +30,14 @@ logger = logger_factory.get_logger(__name__)
 TREE_IGNORE = {".git", "__pycache__", ".venv", "node_modules"}
 
 
+def _has_commits(project_path: Path) -> bool:
+    """Check if the repo at ``project_path`` has any commits."""
+    from nskit.common import process
+
+    head = process.run(["git", "rev-parse", "--verify", "--quiet", "HEAD"], cwd=project_path, capture_output=True)
+    return head.returncode == 0
+
+
 def _commit_and_maybe_push(
     project_path: Path,
     repo_name: str,
@@ -39,9 +46,13 @@ def _commit_and_maybe_push(
     vcs_client,
     console: Console,
     default_branch: str = "main",
+    rendered: Optional[dict] = None,
 ) -> None:
     """Commit generated files and optionally create a remote repo and push.
 
+    If the ``rendered`` content (from ``Recipe.create``) is provided, the initial commit is streamed from it using
+    the ``GitInitialCommit`` hook, rather than ``git add`` re-reading and hashing the generated files.
+
     Args:
         project_path: Path to the generated project.
         repo_name: Repository name.
@@ -50,12 +61,20 @@ def _commit_and_maybe_push(
         vcs_client: Detected VCS repo client (or ``None``).
         console: Rich console for output.
         default_branch: Branch to apply provider configuration/protection to.
+        rendered: The rendered ``{project_path: contents}`` tree to create the initial commit from.
     """
-    import subprocess  # nosec B404
+    from nskit.common import process
 
     if not (project_path / ".git").is_dir():
         return
 
+    if rendered and not _has_commits(project_path):
+        from nskit.mixer.hooks.git import GitInitialCommit
+
+        # Files written after rendering (e.g. the recipe config) are read from disk, so the tree is left clean
+        GitInitialCommit(include_untracked=True)(project_path, {}, rendered=rendered)
+        console.print("[green]✓ Committed initial files[/green]")
+
     env = {
         **os.environ,
         "GIT_AUTHOR_NAME": "nskit",
@@ -63,20 +82,20 @@ def _commit_and_maybe_push(
         "GIT_COMMITTER_NAME": "nskit",
         "GIT_COMMITTER_EMAIL": "nskit@noreply",
     }
-    subprocess.run(  # nosec B603, B607
+    process.run(
         ["git", "add", "."],
         cwd=project_path,
         capture_output=True,
         check=True,
     )
-    # Skip commit if nothing staged (e.g. Docker engine already committed)
-    status = subprocess.run(  # nosec B603, B607
+    # Skip commit if nothing staged (e.g. Docker engine or the fast commit already committed)
+    status = process.run(
         ["git", "diff", "--cached", "--quiet"],
         cwd=project_path,
         capture_output=True,
     )
     if status.returncode != 0:
-        subprocess.run(  # nosec B603, B607
+        process.run(
             ["git", "commit", "-m", "Initial commit from recipe", "--no-verify"],
             cwd=project_path,
             capture_output=True,
@@ -154,8 +173,6 @@ def create_cli(
         json_output: Annotated[bool, typer.Option("--json", help="Output as JSON array of recipe names.")] = False,
     ):
         """List available recipes from backend or installed entry points."""
-        import json as json_mod
-
         if client:
             recipes = client.list_recipes()
         else:
@@ -166,7 +183,7 @@ def create_cli(
             recipes = [RecipeInfo(name=n, versions=["local"]) for n in names]
 
         if json_output:
-            print(json_mod.dumps(sorted(r.name for r in recipes)))
+            typer.echo(json.dumps_bytes(sorted(r.name for r in recipes)))
             return
 
         if not recipes:
@@ -204,6 +221,21 @@ def create_cli(
             bool,
             typer.Option("--local", help="Use locally installed packages instead of Docker (development mode)."),
         ] = False,
+        bundle: Annotated[
+            Optional[Path],
+            typer.Option(
+                help="Render from a recipe bundle (built with 'bundle build') instead of the installed recipe. "
+                "The bundle must be for --recipe."
+            ),
+        ] = None,
+        fast_commit: Annotated[
+            bool,
+            typer.Option(
+                "--fast-commit",
+                help="Create the initial commit from the rendered files with git fast-import, instead of git add. "
+                "Only used when rendering locally (without a backend) or from a bundle.",
+            ),
+        ] = False,
     ):
         """Initialize a recipe from the configured entrypoint."""
         if input_yaml_path is not None:
@@ -299,8 +331,8 @@ def create_cli(
         else:
             Console().print("[dim]No VCS provider detected — skipping repository creation[/dim]")
 
-        # Use client if available
-        if client:
+        # Use client if available (bundles are always rendered locally)
+        if client and bundle is None:
             # Override engine based on --local flag
             if local:
                 client.engine = LocalEngine()
@@ -338,8 +370,20 @@ def create_cli(
         else:
             # Fallback: no backend, use Recipe.load directly
             try:
-                r = Recipe.load(recipe, entrypoint=recipe_entrypoint, **input_data)
-                result = r.create(base_path=output_base_path, override_path=output_override_path)
+                if bundle is not None:
+                    from nskit.mixer.bundle import load_bundle
+
+                    with load_bundle(bundle) as recipe_bundle:
+                        if recipe_bundle.name != recipe:
+                            typer.echo(
+                                f"Error: bundle {bundle} is for recipe {recipe_bundle.name}, not {recipe}", err=True
+                            )
+                            raise typer.Exit(1)
+                        r = recipe_bundle.recipe(**input_data)
+                        result = r.create(base_path=output_base_path, override_path=output_override_path)
+                else:
+                    r = Recipe.load(recipe, entrypoint=recipe_entrypoint, **input_data)
+                    result = r.create(base_path=output_base_path, override_path=output_override_path)
                 project_path = next(iter(result.keys())) if result else (output_base_path or Path.cwd())
 
                 # Save recipe config for future updates
@@ -359,7 +403,13 @@ def create_cli(
                 _print_tree(Path(project_path), console)
                 console.print()
                 _commit_and_maybe_push(
-                    Path(project_path), recipe, input_data.get("description", ""), create_repo, vcs_client, console
+                    Path(project_path),
+                    recipe,
+                    input_data.get("description", ""),
+                    create_repo,
+                    vcs_client,
+                    console,
+                    rendered=result if fast_commit else None,
                 )
             except Exception as exc:
                 # Format validation errors nicely
@@ -386,7 +436,61 @@ def create_cli(
         """Get required fields for a recipe as JSON."""
 
         r = Recipe.load(recipe, entrypoint=recipe_entrypoint, initialize=False)
-        print(json.dumps(get_required_fields_as_dict(r)))
+        typer.echo(json.dumps_bytes(get_required_fields_as_dict(r)))
+
+    bundle_app = typer.Typer(help="Build self-contained recipe bundles.", no_args_is_help=True)
+    app.add_typer(bundle_app, name="bundle")
+
+    @bundle_app.command(name="build", help="Package a recipe into a single bundle file.")
+    def bundle_build(
+        recipe: Annotated[str, typer.Option(help="The name of the recipe to bundle.")],
+        output: Annotated[
+            Optional[Path], typer.Option(help="Output bundle path. Defaults to <recipe>.nskit-bundle.")
+        ] = None,
+    ):
+        """Build a recipe bundle with precompiled templates."""
+        from nskit.mixer.bundle import BundleError, build_bundle
+
+        if output is None:
+            output = Path(f"{recipe}.nskit-bundle")
+        try:
+            path = build_bundle(recipe, output, entrypoint=recipe_entrypoint)
+        except BundleError as exc:
+            typer.echo(f"Error: {exc}", err=True)
+            raise typer.Exit(1) from None
+        rich_print(f"[green bold]✓ Built bundle[/green bold] for {recipe} at [cyan]{path}[/cyan]")
+
+    dev_app = typer.Typer(help="Tools for recipe authors.", no_args_is_help=True)
+    app.add_typer(dev_app, name="dev")
+
+    @dev_app.command(name="watch", help="Render a recipe and keep it in sync while editing it.")
+    def dev_watch(
+        recipe: Annotated[str, typer.Option(help="The name of the recipe to render.")],
+        out: Annotated[Path, typer.Option(help="The rendered project directory.")],
+        inputs: Annotated[Optional[Path], typer.Option(help="Path to the input YAML file for the recipe.")] = None,
+        watch: Annotated[
+            Optional[list[Path]],
+            typer.Option(help="Additional files or directories to watch (the recipe package is always watched)."),
+        ] = None,
+        interval: Annotated[float, typer.Option(help="Polling interval in seconds.")] = 0.5,
+    ):
+        """Re-render the files affected by template, module or input changes (hooks are not run)."""
+        from nskit.mixer.watch import RecipeWatcher
+
+        console = Console()
+
+        def report(update):
+            for path in update.written:
+                console.print(f"[green]updated[/green] {path.relative_to(watcher.output)}")
+            for path in update.removed:
+                console.print(f"[yellow]removed[/yellow] {path.relative_to(watcher.output)}")
+
+        watcher = RecipeWatcher(recipe, out, inputs, entrypoint=recipe_entrypoint, watch_paths=watch, interval=interval)
+        console.print(f"Watching [bold]{recipe}[/bold], rendering to [cyan]{watcher.output}[/cyan] (Ctrl+C to stop)")
+        try:
+            watcher.run(callback=report)
+        except KeyboardInterrupt:
+            console.print("Stopped watching")
 
     # Add backend-dependent commands
     if client:
@@ -5,10 +5,33 @@ from pathlib import Path
 from typing import Any
 
 from nskit.client.models import RecipeInfo
+from nskit.common.instrumentation import traced
+
+_TRACED_METHODS = (
+    "list_recipes",
+    "get_recipe_versions",
+    "fetch_recipe",
+    "get_recipe_metadata",
+    "get_image_url",
+    "pull_image",
+)
 
 
 class RecipeBackend(ABC):
-    """Abstract interface for recipe backends."""
+    """Abstract interface for recipe backends.
+
+    The backend operations implemented by subclasses are traced (``nskit.backend.<method>`` spans).
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        """Trace the backend operations implemented by the subclass."""
+        super().__init_subclass__(**kwargs)
+        for method in _TRACED_METHODS:
+            if method in cls.__dict__:
+                wrapper = traced(
+                    f"nskit.backend.{method}", arguments=("recipe", "version", "image_url"), backend=cls.__name__
+                )
+                setattr(cls, method, wrapper(cls.__dict__[method]))
 
     @property
     @abstractmethod
@@ -15,8 +15,6 @@ from __future__ import annotations
 
 from pathlib import Path
 
-import yaml
-
 from nskit._logging import logger_factory
 from nskit.client.backends.base import RecipeBackend
 from nskit.client.backends.docker import DockerBackend
@@ -24,6 +22,7 @@ from nskit.client.backends.github import GitHubBackend
 from nskit.client.backends.local import LocalBackend
 from nskit.client.backends.settings import DockerBackendConfig, GitHubBackendConfig, LocalBackendConfig
 from nskit.common.extensions import get_extensions
+from nskit.common.io import yaml
 from nskit.constants import BACKENDS_ENTRYPOINT
 
 logger = logger_factory.get_logger(__name__)
@@ -12,6 +12,7 @@ from nskit.client.backends.base import RecipeBackend
 from nskit.client.backends.settings import DockerTimeouts
 from nskit.client.models import RecipeInfo
 from nskit.client.validation import validate_image_url, validate_recipe_name, validate_version
+from nskit.common import process
 from nskit.constants import RECIPE_ENTRYPOINT
 
 logger = logger_factory.get_logger(__name__)
@@ -52,7 +53,7 @@ class DockerBackend(RecipeBackend):
     def _check_docker(self) -> None:
         """Check if Docker is installed and running."""
         try:
-            subprocess.run(["docker", "info"], check=True, capture_output=True, timeout=5)  # nosec B603, B607
+            process.run(["docker", "info"], check=True, capture_output=True, timeout=5)
         except FileNotFoundError:
             raise RuntimeError("Docker not found. Please install Docker: https://docs.docker.com/get-docker/") from None
         except subprocess.CalledProcessError:
@@ -80,7 +81,7 @@ class DockerBackend(RecipeBackend):
         """Authenticate with Docker registry if token provided."""
         if not self._auth_token:
             return
-        subprocess.run(  # nosec B603, B607
+        process.run(
             ["docker", "login", self.registry_url, "-u", "token", "--password-stdin"],
             input=self._auth_token.get_secret_value(),
             text=True,
@@ -118,23 +119,21 @@ class DockerBackend(RecipeBackend):
         self._authenticate()
         image_url = self._build_image_url(recipe_name, version)
 
-        subprocess.run(["docker", "pull", image_url], check=True, capture_output=True, timeout=self.timeouts.pull)  # nosec B603, B607
+        process.run(["docker", "pull", image_url], check=True, capture_output=True, timeout=self.timeouts.pull)
 
-        result = subprocess.run(  # nosec B603, B607
+        result = process.run(
             ["docker", "create", image_url], check=True, capture_output=True, text=True, timeout=self.timeouts.cmd
         )
         container_id = result.stdout.strip()
 
         try:
-            subprocess.run(  # nosec B603, B607
+            process.run(
                 ["docker", "cp", f"{container_id}:/app/recipes/", str(target_path)],
                 check=True,
                 timeout=self.timeouts.file_copy,
             )
         finally:
-            subprocess.run(  # nosec B603, B607
-                ["docker", "rm", container_id], check=True, capture_output=True, timeout=self.timeouts.cmd
-            )
+            process.run(["docker", "rm", container_id], check=True, capture_output=True, timeout=self.timeouts.cmd)
 
         return target_path / recipe_name
 
@@ -158,6 +157,4 @@ class DockerBackend(RecipeBackend):
         """
         validate_image_url(image_url)
         self._authenticate()
-        subprocess.run(  # nosec B603, B607
-            ["docker", "pull", image_url], check=True, capture_output=True, timeout=self.timeouts.pull
-        )
+        process.run(["docker", "pull", image_url], check=True, capture_output=True, timeout=self.timeouts.pull)
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import subprocess  # nosec B404
+from nskit.common import process
 
 LABEL_RECIPE = "nskit.recipe"
 LABEL_RECIPE_NAME = "nskit.recipe.name"
@@ -15,7 +15,7 @@ def get_recipe_name_from_image(image_url: str) -> str | None:
     Returns ``None`` if the image isn't available or has no label.
     """
     try:
-        result = subprocess.run(  # nosec B603, B607
+        result = process.run(
             ["docker", "inspect", image_url, "--format", f'{{{{index .Config.Labels "{LABEL_RECIPE_NAME}"}}}}'],
             capture_output=True,
             text=True,
@@ -33,7 +33,7 @@ def get_recipe_name_from_image(image_url: str) -> str | None:
 def is_nskit_recipe_image(image_url: str) -> bool:
     """Check if a Docker image has the ``nskit.recipe=true`` label."""
     try:
-        result = subprocess.run(  # nosec B603, B607
+        result = process.run(
             ["docker", "inspect", image_url, "--format", f'{{{{index .Config.Labels "{LABEL_RECIPE}"}}}}'],
             capture_output=True,
             text=True,
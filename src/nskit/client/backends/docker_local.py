@@ -12,11 +12,11 @@ Build recipe images with these labels:
 
 from __future__ import annotations
 
-import subprocess  # nosec B404
 from pathlib import Path
 
 from nskit.client.backends.base import RecipeBackend
 from nskit.client.models import RecipeInfo
+from nskit.common import process
 from nskit.constants import RECIPE_ENTRYPOINT
 
 LABEL_PREFIX = "nskit.recipe"
@@ -55,7 +55,7 @@ class DockerLocalBackend(RecipeBackend):
         """
         from nskit.client.backends.image_labels import get_recipe_name, read_local_labels
 
-        result = subprocess.run(  # nosec B603, B607
+        result = process.run(
             [
                 "docker",
                 "images",
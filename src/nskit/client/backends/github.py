@@ -9,6 +9,8 @@ from pathlib import Path
 
 from pydantic import SecretStr
 
+from nskit.common import process
+
 try:
     from ghapi.core import GhApi
 except ImportError:
@@ -67,9 +69,7 @@ class GitHubBackend(RecipeBackend):
         if self._token:
             return self._token.get_secret_value()
         try:
-            result = subprocess.run(  # nosec B603, B607
-                ["gh", "auth", "token"], check=True, capture_output=True, text=True
-            )
+            result = process.run(["gh", "auth", "token"], check=True, capture_output=True, text=True)
             self._token = SecretStr(result.stdout.strip())
             return self._token.get_secret_value()
         except FileNotFoundError:
@@ -167,9 +167,7 @@ class GitHubBackend(RecipeBackend):
         archive_url = f"https://github.com/{self.org}/{repo_name}/archive/refs/tags/{version}.zip"
 
         with tempfile.NamedTemporaryFile(suffix=".zip", delete=False) as tmp:
-            subprocess.run(  # nosec B603, B607
-                ["curl", "-L", "-o", tmp.name, archive_url], check=True, capture_output=True
-            )
+            process.run(["curl", "-L", "-o", tmp.name, archive_url], check=True, capture_output=True)
             # Extract archive (with zip-slip protection)
             with zipfile.ZipFile(tmp.name, "r") as zip_ref:
                 for member in zip_ref.namelist():
@@ -206,11 +204,11 @@ class GitHubBackend(RecipeBackend):
         """
         validate_image_url(image_url)
         token = self._get_token()
-        subprocess.run(  # nosec B603, B607
+        process.run(
             ["docker", "login", "ghcr.io", "-u", "token", "--password-stdin"],
             input=token,
             text=True,
             check=True,
             capture_output=True,
         )
-        subprocess.run(["docker", "pull", image_url], check=True, capture_output=True)  # nosec B603, B607
+        process.run(["docker", "pull", image_url], check=True, capture_output=True)
@@ -9,10 +9,10 @@ from __future__ import annotations
 
 import json
 import ssl
-import subprocess  # nosec B404
 from urllib.request import Request, urlopen
 
 from nskit._logging import logger_factory
+from nskit.common import process
 
 logger = logger_factory.get_logger(__name__)
 
@@ -50,7 +50,7 @@ def read_local_labels(image_url: str) -> dict[str, str]:
         Dict of labels, or empty dict if image not found.
     """
     try:
-        result = subprocess.run(  # nosec B603, B607
+        result = process.run(
             ["docker", "inspect", image_url, "--format", "{{json .Config.Labels}}"],
             capture_output=True,
             text=True,
@@ -7,10 +7,10 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-import yaml
 from pydantic import BaseModel, Field
 
 from nskit.client.exceptions import InvalidConfigError, ProjectNotRecipeBasedError
+from nskit.common.io import yaml
 
 
 class RecipeMetadata(BaseModel):
@@ -80,7 +80,7 @@ class ConfigManager:
 
         raw = self.config_path.read_text(encoding="utf-8")
         try:
-            data = yaml.safe_load(raw)
+            data = yaml.safe_loads(raw)
         except yaml.YAMLError as exc:
             raise InvalidConfigError([str(exc)]) from exc
 
@@ -106,8 +106,7 @@ class ConfigManager:
         """
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
         data = config.model_dump(mode="json")
-        content = yaml.dump(data, default_flow_style=False, sort_keys=False)
-        self.config_path.write_text(content, encoding="utf-8")
+        yaml.safe_dump_to_path(data, self.config_path)
 
     def update_config_version(self, new_version: str, recipe_name: str) -> None:
         """Update the Docker image version and timestamp in the config.
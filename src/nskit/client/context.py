@@ -4,10 +4,11 @@ from __future__ import annotations
 
 import getpass
 import socket
-import subprocess  # nosec B404
 from datetime import datetime, timezone
 from typing import Any
 
+from nskit.common import process
+
 
 class ContextProvider:
     """Provides built-in context values for field default resolution.
@@ -80,7 +81,7 @@ class ContextProvider:
             The config value, or an empty string on failure.
         """
         try:
-            result = subprocess.run(  # nosec B603, B607
+            result = process.run(
                 ["git", "config", "--global", key],
                 capture_output=True,
                 text=True,
@@ -1,11 +1,11 @@
 """Diff engine for recipe updates."""
 
-import subprocess  # nosec B404
 from pathlib import Path
 from typing import Optional
 
 from nskit._logging import logger_factory
 from nskit.client.diff.file_discovery import FileDiscovery
+from nskit.common import process
 from nskit.common.models.diff import DiffMode, DiffResult, DiffType, FileDiff
 
 logger = logger_factory.get_logger(__name__)
@@ -122,7 +122,7 @@ class DiffEngine:
         """Check if two files differ."""
         try:
             # Use git diff for comparison
-            result = subprocess.run(  # nosec B603, B607
+            result = process.run(
                 ["git", "diff", "--no-index", "--quiet", str(file1), str(file2)],
                 capture_output=True,
             )
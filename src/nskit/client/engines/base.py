@@ -5,10 +5,21 @@ from pathlib import Path
 from typing import Any
 
 from nskit.client.models import RecipeResult
+from nskit.common.instrumentation import traced
 
 
 class RecipeEngine(ABC):
-    """Abstract interface for recipe execution engines."""
+    """Abstract interface for recipe execution engines.
+
+    ``execute`` is traced (``nskit.engine.execute`` spans) for subclasses.
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        """Trace the execution implemented by the subclass."""
+        super().__init_subclass__(**kwargs)
+        if "execute" in cls.__dict__:
+            wrapper = traced("nskit.engine.execute", arguments=("recipe", "version"), engine=cls.__name__)
+            cls.execute = wrapper(cls.__dict__["execute"])
 
     @abstractmethod
     def execute(
@@ -9,12 +9,13 @@ import tempfile
 from pathlib import Path
 from typing import Any
 
-import yaml as pyyaml
-
 from nskit.client.backends.settings import EngineTimeouts
 from nskit.client.engines.base import RecipeEngine
 from nskit.client.models import RecipeResult
 from nskit.client.validation import validate_image_url, validate_recipe_name
+from nskit.common import process
+from nskit.common.instrumentation import span
+from nskit.common.io import yaml
 
 
 class DockerEngine(RecipeEngine):
@@ -69,12 +70,13 @@ class DockerEngine(RecipeEngine):
 
         try:
             if not self.skip_pull:
-                subprocess.run(  # nosec B603, B607
-                    ["docker", "pull", image_url],
-                    check=True,
-                    capture_output=True,
-                    timeout=self.timeouts.pull,
-                )
+                with span("nskit.docker.pull", image_url=image_url):
+                    process.run(
+                        ["docker", "pull", image_url],
+                        check=True,
+                        capture_output=True,
+                        timeout=self.timeouts.pull,
+                    )
 
             # Write parameters as YAML (matches CLI --input-yaml-path).
             #
@@ -90,7 +92,7 @@ class DockerEngine(RecipeEngine):
             output_dir.mkdir(parents=True, exist_ok=True)
             staging_dir = Path(tempfile.mkdtemp(prefix=".nskit-input-", dir=output_dir.parent))
             input_file = staging_dir / "input.yml"
-            input_file.write_text(pyyaml.safe_dump(parameters, default_flow_style=False), encoding="utf-8")
+            yaml.safe_dump_to_path(parameters, input_file)
             input_file.chmod(0o644)
 
             try:
@@ -123,7 +125,8 @@ class DockerEngine(RecipeEngine):
                     "/app/output",
                 ]
 
-                result = subprocess.run(cmd, capture_output=True, text=True, check=True, timeout=self.timeouts.run)  # nosec B603, B607
+                with span("nskit.docker.run", image_url=image_url, recipe=recipe):
+                    result = process.run(cmd, capture_output=True, text=True, check=True, timeout=self.timeouts.run)
 
                 if result.stderr:
                     warnings.append(result.stderr.strip())
@@ -5,8 +5,6 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from nskit.client.backends.base import RecipeBackend
 from nskit.client.config import ConfigManager, RecipeConfig, RecipeMetadata
 from nskit.client.engines.base import RecipeEngine
@@ -15,6 +13,7 @@ from nskit.client.interactive import InteractiveHandler
 from nskit.client.models import RecipeResult
 from nskit.client.recipes import RecipeClient
 from nskit.client.version_resolver import VersionResolver
+from nskit.common.io import yaml
 
 
 class InitManager:
@@ -150,7 +149,7 @@ class InitManager:
             raise InitError(f"Input YAML file not found: {path}")
         try:
             raw = path.read_text(encoding="utf-8")
-            data = yaml.safe_load(raw)
+            data = yaml.safe_loads(raw)
             if not isinstance(data, dict):
                 raise InitError(f"Expected a mapping in {path}, got {type(data).__name__}")
             return data
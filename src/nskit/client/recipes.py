@@ -8,6 +8,7 @@ from typing import Any
 from nskit.client.backends.base import RecipeBackend
 from nskit.client.engines import DockerEngine, RecipeEngine
 from nskit.client.models import RecipeInfo, RecipeResult
+from nskit.common.instrumentation import traced
 
 
 def _read_recipe_label(image_url: str) -> str | None:
@@ -46,6 +47,7 @@ class RecipeClient:
             engine = DockerEngine(skip_pull=isinstance(backend, DockerLocalBackend))
         self.engine = engine
 
+    @traced("nskit.client.list_recipes")
     def list_recipes(self) -> list[RecipeInfo]:
         """List all available recipes from the backend.
 
@@ -54,6 +56,7 @@ class RecipeClient:
         """
         return self.backend.list_recipes()
 
+    @traced("nskit.client.get_recipe_versions", arguments=("recipe",))
     def get_recipe_versions(self, recipe: str) -> list[str]:
         """Get available versions for a specific recipe.
 
@@ -65,6 +68,7 @@ class RecipeClient:
         """
         return self.backend.get_recipe_versions(recipe)
 
+    @traced("nskit.client.initialize_recipe", arguments=("recipe", "version"))
     def initialize_recipe(
         self,
         recipe: str,
@@ -131,6 +135,7 @@ class RecipeClient:
                 errors=errors,
             )
 
+    @traced("nskit.client.create_repository", arguments=("repo_name",))
     def create_repository(
         self,
         repo_name: str,
@@ -15,6 +15,7 @@ from nskit.client.models import UpdateResult
 from nskit.client.project_generator import ProjectGenerator
 from nskit.client.utils.git import GitUtils
 from nskit.client.version_resolver import VersionResolver
+from nskit.common.instrumentation import traced
 from nskit.common.models.diff import DiffMode, MergeResult
 
 logger = logger_factory.get_logger(__name__)
@@ -42,6 +43,7 @@ class UpdateClient:
         self.config_dir = config_dir
         self.config_filename = config_filename
 
+    @traced("nskit.client.check_update_available")
     def check_update_available(self, project_path: Path) -> str | None:
         """Check if an update is available for the project.
 
@@ -74,6 +76,7 @@ class UpdateClient:
 
         return None
 
+    @traced("nskit.client.update_project", arguments=("target_version", "dry_run"))
     def update_project(
         self,
         project_path: Path,
@@ -202,6 +205,7 @@ class UpdateClient:
                     dry_run,
                     three_way=True,
                 )
+                logger.debug("Merged file", path=rel, result=result)
                 if result == "clean":
                     clean_merges.append(rel)
                 elif result == "conflict":
@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Optional
 
 from nskit.client.exceptions import GitStatusError
+from nskit.common import process
 
 __all__ = ["GitStatusError", "GitUtils"]
 
@@ -19,7 +20,7 @@ class GitUtils:
     def is_git_repository(self) -> bool:
         """Check if directory is a Git repository."""
         try:
-            result = subprocess.run(  # nosec B603, B607
+            result = process.run(
                 ["git", "rev-parse", "--git-dir"],
                 cwd=self.project_path,
                 capture_output=True,
@@ -36,7 +37,7 @@ class GitUtils:
             return False
 
         try:
-            result = subprocess.run(  # nosec B603, B607
+            result = process.run(
                 ["git", "status", "--porcelain"],
                 cwd=self.project_path,
                 capture_output=True,
@@ -50,7 +51,7 @@ class GitUtils:
     def get_current_commit(self) -> Optional[str]:
         """Get current commit hash."""
         try:
-            result = subprocess.run(  # nosec B603, B607
+            result = process.run(
                 ["git", "rev-parse", "HEAD"],
                 cwd=self.project_path,
                 capture_output=True,
@@ -97,7 +98,7 @@ class GitUtils:
 
             try:
                 # Run git merge-file
-                result = subprocess.run(  # nosec B603, B607
+                result = process.run(
                     [
                         "git",
                         "merge-file",
@@ -135,7 +136,7 @@ class GitUtils:
             Diff output
         """
         try:
-            result = subprocess.run(  # nosec B603, B607
+            result = process.run(
                 [
                     "git",
                     "diff",
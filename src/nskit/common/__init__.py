@@ -3,8 +3,12 @@
 # Lazy imports
 from . import lazy as __lazy
 
+cache = __lazy.lazy_import("nskit.common.cache")
 configuration = __lazy.lazy_import("nskit.common.configuration")
 contextmanagers = __lazy.lazy_import("nskit.common.contextmanagers")
 extensions = __lazy.lazy_import("nskit.common.extensions")
+instrumentation = __lazy.lazy_import("nskit.common.instrumentation")
 io = __lazy.lazy_import("nskit.common.io")
 logging = __lazy.lazy_import("nskit.common.logging")
+# process is imported on demand (``from nskit.common import process``) rather than lazily, as it is used from
+# threads and concurrent first access to a lazy module can see it partially initialised
@@ -0,0 +1,513 @@
+"""Shared caches.
+
+``Cache`` is a thread-safe in-memory LRU cache with an optional time-to-live, and an optional disk tier (``disk=True``)
+shared between processes (e.g. concurrent CLI invocations). Disk entries are written atomically (write then rename),
+and ``Cache.get_or_set`` holds a per-key file lock while computing a missing value, so concurrent processes compute it
+once. Disk values must be JSON serialisable.
+
+Caches are registered by name (``get_cache``), so hit/miss statistics can be reported for all of them
+(``cache_stats``), and the ``cached`` decorator memoises a function in a named cache.
+
+Set ``NSKIT_CACHE_DIR`` to change where the disk tier is kept (by default ``$XDG_CACHE_HOME/nskit``, or
+``~/.cache/nskit``), and ``NSKIT_CACHE=0`` to disable caching (every lookup is a miss).
+"""
+
+from __future__ import annotations
+
+import datetime
+import functools
+import hashlib
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Mapping
+from dataclasses import dataclass
+from decimal import Decimal
+from enum import Enum
+from pathlib import Path, PurePath
+from typing import Any, Callable, Optional
+from uuid import UUID
+
+import orjson
+from pydantic import BaseModel
+from pydantic_core import MultiHostUrl, Url
+
+try:
+    from pydantic.networks import _BaseMultiHostUrl, _BaseUrl
+except ImportError:  # pragma: no cover
+    # Before pydantic 2.10 the URL types (e.g. HttpUrl) are pydantic_core.Url subclasses
+    _PYDANTIC_URL_TYPES: tuple[type, ...] = ()
+else:
+    _PYDANTIC_URL_TYPES = (_BaseUrl, _BaseMultiHostUrl)
+
+from nskit._logging import logger_factory
+
+if sys.platform == "win32":  # pragma: no cover
+    import msvcrt
+
+    # Each msvcrt.locking call retries for ~10s before raising, so this waits for ~5 minutes in total
+    _LOCK_ATTEMPTS = 30
+
+    def _lock(fd: int):
+        for _ in range(_LOCK_ATTEMPTS - 1):
+            try:
+                msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                continue
+        # Raises OSError if the lock is still held
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+    def _unlock(fd: int):
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+else:
+    import fcntl
+
+    def _lock(fd: int):
+        fcntl.flock(fd, fcntl.LOCK_EX)
+
+    def _unlock(fd: int):
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+CACHE_ENV_VAR = "NSKIT_CACHE"
+CACHE_DIR_ENV_VAR = "NSKIT_CACHE_DIR"
+_DISK_VERSION = 1
+_MISSING = object()
+
+
+logger = logger_factory.get_logger(__name__)
+
+
+def caching_enabled() -> bool:
+    """Check whether caching is enabled (``NSKIT_CACHE`` isn't set to ``0``/``false``/``no``/``off``)."""
+    return os.environ.get(CACHE_ENV_VAR, "1").lower() not in ("0", "false", "no", "off")
+
+
+def cache_dir() -> Path:
+    """Get the root directory for the disk caches."""
+    if os.environ.get(CACHE_DIR_ENV_VAR):
+        return Path(os.environ[CACHE_DIR_ENV_VAR])
+    if os.environ.get("XDG_CACHE_HOME"):
+        return Path(os.environ["XDG_CACHE_HOME"]) / "nskit"
+    if sys.platform == "win32" and os.environ.get("LOCALAPPDATA"):  # pragma: no cover
+        return Path(os.environ["LOCALAPPDATA"]) / "nskit" / "cache"
+    return Path.home() / ".cache" / "nskit"
+
+
+# Value types with a faithful string form
+_STRING_VALUE_TYPES = (PurePath, Decimal, Url, MultiHostUrl, *_PYDANTIC_URL_TYPES, UUID, datetime.date, datetime.time)
+
+
+def key_value(value: Any) -> Any:
+    """Convert a value to JSON native data for a cache key, keeping its type.
+
+    Containers and non JSON native values are tagged with their type, so e.g. ``(1, 2)`` and ``[1, 2]``, or
+    ``Path("a")`` and ``"a"`` give different keys. Anything else (callables, arbitrary objects) raises ``TypeError``,
+    as there is no stable representation of it.
+    """
+    value_type = type(value)
+    if value is None or value_type in (str, int, float, bool):
+        return value
+    if value_type is list:
+        return {"list": [key_value(item) for item in value]}
+    if value_type is dict:
+        items = [(orjson.dumps(key_value(key)).decode(), key_value(item)) for key, item in value.items()]
+        return {"dict": sorted(items, key=lambda item: item[0])}
+    name = f"{value_type.__module__}.{value_type.__qualname__}"
+    if isinstance(value, Enum):
+        return {"object": [name, key_value(value.value)]}
+    if isinstance(value, BaseModel):
+        return {"object": [name, key_value(value.model_dump())]}
+    if isinstance(value, _STRING_VALUE_TYPES):
+        return {"object": [name, str(value)]}
+    if isinstance(value, (tuple, list)):
+        return {"object": [name, [key_value(item) for item in value]]}
+    if isinstance(value, (set, frozenset)):
+        return {"object": [name, sorted(orjson.dumps(key_value(item)).decode() for item in value)]}
+    if isinstance(value, Mapping):
+        return {"object": [name, key_value(dict(value))]}
+    for base in (str, int, float):
+        if isinstance(value, base):
+            # Subclasses of the JSON native types (e.g. Resource)
+            return {"object": [name, base(value)]}
+    raise TypeError(f"Type {value_type} cannot be used in a cache key")
+
+
+def make_key(*args, **kwargs) -> str:
+    """Make a (stable) cache key from the arguments.
+
+    The arguments are converted with ``key_value``, so they must be JSON native, or e.g. paths, enums, pydantic
+    models or containers of them (other types raise ``TypeError``).
+    """
+    data = orjson.dumps([[key_value(arg) for arg in args], key_value(kwargs)])
+    return hashlib.sha256(data).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    """Cache hit/miss statistics."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expired: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Get the fraction of lookups that were hits."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class FileLock:
+    """Exclusive (blocking) lock on a file, shared between processes."""
+
+    def __init__(self, path: Path):
+        """Initialise the lock."""
+        self.path = Path(path)
+        self._fd: Optional[int] = None
+
+    def acquire(self):
+        """Acquire the lock, waiting for other holders to release it (on Windows, raises OSError after ~5 minutes)."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            _lock(fd)
+        except BaseException:
+            os.close(fd)
+            raise
+        self._fd = fd
+
+    def release(self):
+        """Release the lock."""
+        if self._fd is not None:
+            fd, self._fd = self._fd, None
+            try:
+                _unlock(fd)
+            finally:
+                os.close(fd)
+
+    def __enter__(self):
+        """Acquire the lock."""
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Release the lock."""
+        self.release()
+
+
+class MemoryCache:
+    """Thread-safe in-memory LRU cache, with an optional time-to-live (seconds)."""
+
+    def __init__(self, maxsize: Optional[int] = 128, ttl: Optional[float] = None):
+        """Initialise the cache."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._entries: OrderedDict[Any, tuple[Optional[float], Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Get the number of entries (including any expired ones not yet removed)."""
+        return len(self._entries)
+
+    def __contains__(self, key):
+        """Check if there is a current entry for the key (doesn't affect the statistics)."""
+        return self._read(key) is not _MISSING
+
+    def _read(self, key) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+            expires, value = entry
+            if expires is not None and expires <= time.monotonic():
+                del self._entries[key]
+                self.stats.expired += 1
+                return _MISSING
+            self._entries.move_to_end(key)
+            return value
+
+    def get(self, key, default: Any = None) -> Any:
+        """Get the value for the key, or the default if it isn't cached (or has expired)."""
+        value = self._read(key)
+        with self._lock:
+            if value is _MISSING:
+                self.stats.misses += 1
+                return default
+            self.stats.hits += 1
+        return value
+
+    def set(self, key, value: Any):
+        """Set the value for the key."""
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while self.maxsize is not None and len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def delete(self, key):
+        """Remove the entry for the key (if there is one)."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove all the entries and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.stats = CacheStats()
+
+
+class DiskCache:
+    """Cache of JSON serialisable values in a directory, shared between processes.
+
+    Entries are written atomically, so readers never see a partial entry, and ``lock`` gives a per-key lock to
+    coordinate computing values between processes. Errors reading or writing entries are treated as misses.
+    """
+
+    def __init__(self, directory: Path, ttl: Optional[float] = None):
+        """Initialise the cache."""
+        self.directory = Path(directory)
+        self.ttl = ttl
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+
+    def _path(self, key: str, suffix: str = ".json") -> Path:
+        return self.directory / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}{suffix}"
+
+    def _read(self, key: str) -> Any:
+        path = self._path(key)
+        try:
+            entry = orjson.loads(path.read_bytes())
+        except FileNotFoundError:
+            return _MISSING
+        except (OSError, orjson.JSONDecodeError):
+            logger.debug(f"Unable to read cache entry {path}", exc_info=True)
+            return _MISSING
+        if not isinstance(entry, dict) or entry.get("version") != _DISK_VERSION or entry.get("key") != key:
+            return _MISSING
+        if entry["expires"] is not None and entry["expires"] <= time.time():
+            with self._lock:
+                self.stats.expired += 1
+            self._remove(path)
+            return _MISSING
+        return entry["value"]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get the value for the key, or the default if it isn't cached (or has expired)."""
+        value = self._read(key)
+        with self._lock:
+            if value is _MISSING:
+                self.stats.misses += 1
+                return default
+            self.stats.hits += 1
+        return value
+
+    def set(self, key: str, value: Any):
+        """Set the value for the key."""
+        expires = time.time() + self.ttl if self.ttl is not None else None
+        entry = {"version": _DISK_VERSION, "key": key, "expires": expires, "value": value}
+        path = self._path(key)
+        try:
+            data = orjson.dumps(entry)
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Write then rename, so concurrent processes don't read a partial entry
+            fd, temp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{path.name}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                os.replace(temp_path, path)
+            except BaseException:
+                self._remove(Path(temp_path))
+                raise
+        except (OSError, TypeError):
+            logger.debug(f"Unable to write cache entry {path}", exc_info=True)
+
+    def delete(self, key: str):
+        """Remove the entry for the key (if there is one)."""
+        self._remove(self._path(key))
+
+    def clear(self):
+        """Remove all the entries and reset the statistics."""
+        if self.directory.is_dir():
+            for path in self.directory.glob("*.json"):
+                self._remove(path)
+        with self._lock:
+            self.stats = CacheStats()
+
+    def lock(self, key: str) -> FileLock:
+        """Get a lock for the key, shared between processes."""
+        return FileLock(self._path(key, ".lock"))
+
+    @staticmethod
+    def _remove(path: Path):
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        except OSError:
+            logger.debug(f"Unable to remove cache entry {path}", exc_info=True)
+
+
+class Cache:
+    """In-memory LRU/TTL cache, with an optional disk tier shared between processes."""
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: Optional[int] = 128,
+        ttl: Optional[float] = None,
+        disk: bool = False,
+        directory: Optional[Path] = None,
+    ):
+        """Initialise the cache.
+
+        The disk tier is kept in ``directory`` (by default a folder for the cache name under ``cache_dir()``), and
+        uses the same time-to-live as the in-memory tier.
+        """
+        self.name = name
+        self.enabled = caching_enabled()
+        self.stats = CacheStats()
+        self.memory = MemoryCache(maxsize=maxsize, ttl=ttl)
+        self.disk: Optional[DiskCache] = None
+        if disk:
+            if directory is None:
+                directory = cache_dir() / re.sub(r"[^A-Za-z0-9._-]", "_", name)
+            self.disk = DiskCache(directory, ttl=ttl)
+        self._lock = threading.Lock()
+
+    def _record(self, hit: bool):
+        with self._lock:
+            if hit:
+                self.stats.hits += 1
+            else:
+                self.stats.misses += 1
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Get the value for the key from the in-memory, then disk tier, or the default if it isn't cached."""
+        if not self.enabled:
+            self._record(False)
+            return default
+        value = self.memory.get(key, _MISSING)
+        if value is _MISSING and self.disk is not None:
+            value = self.disk.get(key, _MISSING)
+            if value is not _MISSING:
+                self.memory.set(key, value)
+        self._record(value is not _MISSING)
+        return default if value is _MISSING else value
+
+    def set(self, key: str, value: Any):
+        """Set the value for the key in all the tiers."""
+        if not self.enabled:
+            return
+        self.memory.set(key, value)
+        if self.disk is not None:
+            self.disk.set(key, value)
+
+    def get_or_set(self, key: str, func: Callable[[], Any]) -> Any:
+        """Get the value for the key, or compute it with ``func`` (once across processes for the disk tier) and cache it."""
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        if not self.enabled:
+            return func()
+        if self.disk is None:
+            value = func()
+        else:
+            with self.disk.lock(key):
+                # Another process may have computed it while we were waiting
+                value = self.disk._read(key)
+                if value is _MISSING:
+                    value = func()
+                    self.disk.set(key, value)
+        self.memory.set(key, value)
+        return value
+
+    def delete(self, key: str):
+        """Remove the entry for the key from all the tiers."""
+        self.memory.delete(key)
+        if self.disk is not None:
+            self.disk.delete(key)
+
+    def clear(self, disk: bool = True):
+        """Remove all the entries (optionally keeping the disk tier) and reset the statistics."""
+        self.memory.clear()
+        if disk and self.disk is not None:
+            self.disk.clear()
+        with self._lock:
+            self.stats = CacheStats()
+
+
+_CACHES: dict[str, Cache] = {}
+_CACHES_LOCK = threading.Lock()
+
+
+def get_cache(
+    name: str, maxsize: Optional[int] = 128, ttl: Optional[float] = None, disk: bool = False, **kwargs
+) -> Cache:
+    """Get the named cache, creating it with the given settings if it doesn't exist yet."""
+    with _CACHES_LOCK:
+        cache = _CACHES.get(name)
+        if cache is None:
+            cache = _CACHES[name] = Cache(name, maxsize=maxsize, ttl=ttl, disk=disk, **kwargs)
+        return cache
+
+
+def cache_stats() -> dict[str, CacheStats]:
+    """Get the statistics for the named caches."""
+    with _CACHES_LOCK:
+        return {name: cache.stats for name, cache in _CACHES.items()}
+
+
+def clear_caches(disk: bool = False):
+    """Clear all the named caches (by default keeping their disk tiers)."""
+    with _CACHES_LOCK:
+        caches = list(_CACHES.values())
+    for cache in caches:
+        cache.clear(disk=disk)
+
+
+def cached(
+    name: Optional[str] = None,
+    *,
+    maxsize: Optional[int] = 128,
+    ttl: Optional[float] = None,
+    disk: bool = False,
+    key: Optional[Callable[..., str]] = None,
+):
+    """Memoise a function in a named cache (by default named after the function).
+
+    The cache key is built from the arguments with ``make_key``, functions taking other argument types need an
+    explicit ``key`` function. With ``disk=True`` the return values must be JSON serialisable. The wrapper has
+    ``cache`` and ``cache_clear`` attributes.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        cache = get_cache(name or f"{func.__module__}.{func.__qualname__}", maxsize=maxsize, ttl=ttl, disk=disk)
+
+        def key_func(*args, **kwargs) -> str:
+            if key is not None:
+                return key(*args, **kwargs)
+            try:
+                return make_key(*args, **kwargs)
+            except TypeError as e:
+                raise TypeError(f"Unable to make a cache key for {func.__qualname__} ({e}), pass key= to cached") from e
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            return cache.get_or_set(key_func(*args, **kwargs), lambda: func(*args, **kwargs))
+
+        wrapper.cache = cache
+        wrapper.cache_clear = cache.clear
+        return wrapper
+
+    return decorator
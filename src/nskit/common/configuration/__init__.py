@@ -17,14 +17,14 @@ from pydantic_settings import PydanticBaseSettingsSource as _PydanticBaseSetting
 from pydantic_settings import SettingsConfigDict as _SettingsConfigDict
 from pydantic_settings.sources import PathType
 
-from nskit.common.configuration.mixins import PropertyDumpMixin
+from nskit.common.configuration.mixins import MemoisedProperty, PropertyDumpMixin, memoised_property  # noqa: F401
 from nskit.common.configuration.sources import (
     DotEnvSettingsSource,
     JsonConfigSettingsSource,
     TomlConfigSettingsSource,
     YamlConfigSettingsSource,
 )
-from nskit.common.io import json, toml, yaml
+from nskit.common.io import toml, yaml
 
 
 class SettingsConfigDict(_SettingsConfigDict):
@@ -99,6 +99,34 @@ class BaseConfiguration(PropertyDumpMixin, _BaseSettings):
             file_secret_settings,
         )
 
+    def _model_dump_plain(
+        self,
+        *,
+        include: Any = None,
+        exclude: Any = None,
+        by_alias: bool = False,
+        exclude_unset: bool = False,
+        exclude_defaults: bool = False,
+        exclude_none: bool = False,
+        round_trip: bool = False,
+        warnings: bool = True,
+    ) -> dict[str, Any]:
+        """Dump the model to JSON compatible python types, to pass straight to the YAML/TOML emitters.
+
+        As with ``model_dump_json``, non-finite floats are dumped as ``None`` (see ``ser_json_inf_nan``).
+        """
+        return self.model_dump(
+            mode="json",
+            include=include,
+            exclude=exclude,
+            by_alias=by_alias,
+            exclude_unset=exclude_unset,
+            exclude_defaults=exclude_defaults,
+            exclude_none=exclude_none,
+            round_trip=round_trip,
+            warnings=warnings,
+        )
+
     def model_dump_toml(
         self,
         *,
@@ -112,21 +140,20 @@ class BaseConfiguration(PropertyDumpMixin, _BaseSettings):
         round_trip: bool = False,
         warnings: bool = True,
     ):
-        """Dump model to TOML."""
-        # We go via JSON to include indent etc.
+        """Dump model to TOML.
+
+        ``indent`` is accepted for consistency with ``model_dump_json``, but has no effect on the output.
+        """
         return toml.dumps(
-            json.loads(
-                self.model_dump_json(
-                    indent=indent,
-                    include=include,
-                    exclude=exclude,
-                    by_alias=by_alias,
-                    exclude_unset=exclude_unset,
-                    exclude_defaults=exclude_defaults,
-                    exclude_none=exclude_none,
-                    round_trip=round_trip,
-                    warnings=warnings,
-                )
+            self._model_dump_plain(
+                include=include,
+                exclude=exclude,
+                by_alias=by_alias,
+                exclude_unset=exclude_unset,
+                exclude_defaults=exclude_defaults,
+                exclude_none=exclude_none,
+                round_trip=round_trip,
+                warnings=warnings,
             )
         )
 
@@ -143,20 +170,19 @@ class BaseConfiguration(PropertyDumpMixin, _BaseSettings):
         round_trip: bool = False,
         warnings: bool = True,
     ):
-        """Dump model to YAML."""
-        # We go via JSON to include indent etc.
+        """Dump model to YAML.
+
+        ``indent`` is accepted for consistency with ``model_dump_json``, but has no effect on the output.
+        """
         return yaml.dumps(
-            json.loads(
-                self.model_dump_json(
-                    indent=indent,
-                    include=include,
-                    exclude=exclude,
-                    by_alias=by_alias,
-                    exclude_unset=exclude_unset,
-                    exclude_defaults=exclude_defaults,
-                    exclude_none=exclude_none,
-                    round_trip=round_trip,
-                    warnings=warnings,
-                )
+            self._model_dump_plain(
+                include=include,
+                exclude=exclude,
+                by_alias=by_alias,
+                exclude_unset=exclude_unset,
+                exclude_defaults=exclude_defaults,
+                exclude_none=exclude_none,
+                round_trip=round_trip,
+                warnings=warnings,
             )
         )
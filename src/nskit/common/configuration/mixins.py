@@ -1,11 +1,78 @@
 """Configuration Mixins."""
 
 import inspect
-from typing import Any, Callable
+from collections.abc import Iterable
+from typing import Any, Callable, Optional
+from weakref import WeakKeyDictionary
 
 from pydantic import BaseModel, SerializationInfo, model_serializer
 from pydantic_settings import BaseSettings
 
+_PROPERTY_NAMES: WeakKeyDictionary = WeakKeyDictionary()
+
+
+class MemoisedProperty(property):
+    """A read-only property that caches its value on the instance.
+
+    The cached value is reused until one of the ``depends_on`` attributes changes (compared by equality), so
+    dependencies should be fields (or properties) with immutable values. As a ``property``, it is included in
+    ``PropertyDumpMixin`` model dumps.
+    """
+
+    def __init__(self, fget: Callable, depends_on: Iterable[str] = ()):
+        """Initialise the property."""
+        super().__init__(fget)
+        # Set explicitly, as the class docstring takes precedence for property subclasses
+        self.__doc__ = fget.__doc__
+        self.depends_on = tuple(depends_on)
+        self._cache_name = f"__memoised_{fget.__name__}"
+
+    def __get__(self, instance, owner=None):
+        """Get the cached value, computing it if the dependencies have changed."""
+        if instance is None:
+            return self
+        key = tuple(getattr(instance, name) for name in self.depends_on)
+        cached = instance.__dict__.get(self._cache_name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        value = self.fget(instance)
+        # Stored outside the model fields, so it isn't validated, dumped or compared
+        instance.__dict__[self._cache_name] = (key, value)
+        return value
+
+
+def memoised_property(func: Optional[Callable] = None, *, depends_on: Iterable[str] = ()):
+    """Decorator for a ``MemoisedProperty``.
+
+    Used as ``@memoised_property(depends_on=("name",))``, or without arguments for a value that never changes.
+    """
+
+    def decorator(fget: Callable) -> MemoisedProperty:
+        return MemoisedProperty(fget, depends_on=depends_on)
+
+    if func is None:
+        return decorator
+    return decorator(func)
+
+
+def _model_property_names(cls: type) -> list[str]:
+    """Get the public properties defined on a model class (cached per class)."""
+    try:
+        return _PROPERTY_NAMES[cls]
+    except KeyError:
+        pass
+    properties = inspect.getmembers(cls, lambda o: isinstance(o, property))
+    # Based on object -> BaseModel -> BaseSettings
+    standard_settings_properties = inspect.getmembers(BaseSettings, lambda o: isinstance(o, property))
+    standard_model_properties = inspect.getmembers(BaseModel, lambda o: isinstance(o, property))
+    property_names = [
+        u[0]
+        for u in properties
+        if u not in standard_settings_properties + standard_model_properties and not u[0].startswith("_")
+    ]
+    _PROPERTY_NAMES[cls] = property_names
+    return property_names
+
 
 class PropertyDumpMixin:
     """Mixin to dump properties when doing model_dump."""
@@ -24,17 +91,7 @@ class PropertyDumpMixin:
         return value
 
     def __get_defined_model_properties(self):
-
-        properties = inspect.getmembers(self.__class__, lambda o: isinstance(o, property))
-        # Based on object -> BaseModel -> BaseSettings
-        standard_settings_properties = inspect.getmembers(BaseSettings, lambda o: isinstance(o, property))
-        standard_model_properties = inspect.getmembers(BaseModel, lambda o: isinstance(o, property))
-        property_names = [
-            u[0]
-            for u in properties
-            if u not in standard_settings_properties + standard_model_properties and not u[0].startswith("_")
-        ]
-        return property_names
+        return _model_property_names(self.__class__)
 
     def __get_properties(self, include=None, exclude=None):
         property_names = self.__get_defined_model_properties()
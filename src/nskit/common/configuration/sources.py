@@ -2,8 +2,10 @@
 
 from __future__ import annotations as _annotations
 
+import copy
+import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 from pydantic.config import ExtraValues
 from pydantic_settings import BaseSettings
@@ -27,13 +29,47 @@ from pydantic_settings.sources import (
 from nskit.common.io import json, toml, yaml
 
 
+class ParseCache:
+    """Thread-safe cache of parsed config files, keyed on the file path, modification time and size.
+
+    The settings sources are rebuilt for every model instantiation (including nested models), so this means a file is
+    only parsed again once it changes. Callers get a copy of the parsed data, so can't modify the cached value.
+    """
+
+    def __init__(self):
+        """Initialise the cache."""
+        self._lock = threading.Lock()
+        self._cache: dict[tuple, tuple[tuple[int, int], Any]] = {}
+
+    def clear(self):
+        """Empty the cache."""
+        with self._lock:
+            self._cache.clear()
+
+    def get(self, file_path: Path, loads: Callable[[str], Any], encoding: str | None = None) -> Any:
+        """Get the parsed contents of ``file_path``, only reading and parsing it if it has changed."""
+        file_path = Path(file_path).resolve()
+        stat = file_path.stat()
+        key = (file_path, loads, encoding)
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is None or cached[0] != version:
+            cached = (version, loads(file_path.read_text(encoding)))
+            with self._lock:
+                self._cache[key] = cached
+        return copy.deepcopy(cached[1])
+
+
+PARSE_CACHE = ParseCache()
+
+
 class JsonConfigSettingsSource(_JsonConfigSettingsSource):
     """Use the nskit.common.io.json loading to load settings from a json file."""
 
     def _read_file(self, file_path: Path) -> dict[str, Any]:
         encoding = self.json_file_encoding or "utf-8"
-        file_contents = file_path.read_text(encoding)
-        return json.loads(file_contents)
+        return PARSE_CACHE.get(file_path, json.loads, encoding)
 
     def __call__(self):
         """Make the file reading at the source instantiation."""
@@ -42,11 +78,11 @@ class JsonConfigSettingsSource(_JsonConfigSettingsSource):
 
 
 class TomlConfigSettingsSource(_TomlConfigSettingsSource):
-    """Use the nskit.common.io.toml loading to load settings from a toml file."""
+    """Use the nskit.common.io.toml (read-only) loading to load settings from a toml file."""
 
     def _read_file(self, file_path: Path) -> dict[str, Any]:
-        file_contents = file_path.read_text()
-        return toml.loads(file_contents)
+        # TOML files are always UTF-8 (rather than the locale encoding)
+        return PARSE_CACHE.get(file_path, toml.plain_loads, "utf-8")
 
     def __call__(self):
         """Make the file reading at the source instantiation."""
@@ -59,8 +95,7 @@ class YamlConfigSettingsSource(_YamlConfigSettingsSource):
 
     def _read_file(self, file_path: Path) -> dict[str, Any]:
         encoding = self.yaml_file_encoding or "utf-8"
-        file_contents = file_path.read_text(encoding)
-        return yaml.loads(file_contents)
+        return PARSE_CACHE.get(file_path, yaml.loads, encoding)
 
     def __call__(self):
         """Make the file reading at the source instantiation."""
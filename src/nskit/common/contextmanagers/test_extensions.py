@@ -14,6 +14,7 @@ else:
     from importlib.metadata import EntryPoint
 
 from nskit._logging import logger_factory
+from nskit.common.extensions import invalidate_extensions_cache
 
 
 class _TestEntrypoint(EntryPoint):
@@ -38,9 +39,11 @@ class _TestEntrypoint(EntryPoint):
             nested[0]._entrypoints.append(self)
         else:
             sys.meta_path.append(_TestExtensionFinder(self))
+        invalidate_extensions_cache()
 
     def stop(self):
         sys.meta_path = self._sys_meta_path[:]
+        invalidate_extensions_cache()
 
 
 class _DummyDistribution(Distribution):
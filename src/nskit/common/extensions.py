@@ -1,38 +1,166 @@
-"""Common extension helpers."""
+"""Common extension helpers.
 
+Installed entry points are scanned once and indexed by group, so repeated discovery is a dict lookup.
+The index is rebuilt when ``sys.path`` or ``sys.meta_path`` change (or ``invalidate_extensions_cache`` is called).
+Set ``NSKIT_ENTRY_POINTS_INDEX`` to a file path to also keep the index on disk between processes, it is
+invalidated when the ``sys.path`` entries or installed distributions (``.dist-info``/``.egg-info``) change.
+"""
+
+import hashlib
+import os
 import sys
+import threading
 from enum import Enum
+from importlib.machinery import PathFinder
+from importlib.metadata import EntryPoint
+from itertools import chain
+from pathlib import Path
+from typing import Optional
 
 if sys.version_info.major >= 3 and sys.version_info.minor >= 10:
     from importlib.metadata import entry_points
 else:
     from backports.entry_points_selectable import entry_points
 
+import orjson
 from aenum import extend_enum
 
 from nskit._logging import logger_factory
 
+INDEX_ENV_VAR = "NSKIT_ENTRY_POINTS_INDEX"
+_INDEX_VERSION = 1
+_DISTRIBUTION_SUFFIXES = (".dist-info", ".egg-info")
+
+
+def _scan() -> dict[str, tuple[EntryPoint, ...]]:
+    """Scan the installed distributions for entry points."""
+    eps = entry_points()
+    if isinstance(eps, dict):
+        # SelectableGroups (before Python 3.12) maps the groups to their entry points
+        eps = chain.from_iterable(dict.values(eps))
+    groups = {}
+    for ep in eps:
+        groups.setdefault(ep.group, []).append(ep)
+    return {group: tuple(eps) for group, eps in groups.items()}
+
+
+def _standard_finders() -> bool:
+    """Check that only the standard path based finder provides distributions (e.g. no ``TestExtension``)."""
+    return all(finder is PathFinder or not hasattr(finder, "find_distributions") for finder in sys.meta_path)
+
+
+def _fingerprint() -> str:
+    """Fingerprint the ``sys.path`` entries and the installed distribution metadata in them."""
+    state = [_INDEX_VERSION, sys.version]
+    for entry in sys.path:
+        try:
+            with os.scandir(entry or ".") as it:
+                distributions = sorted(
+                    (item.name, item.stat().st_mtime_ns) for item in it if item.name.endswith(_DISTRIBUTION_SUFFIXES)
+                )
+            state.append([entry, os.stat(entry or ".").st_mtime_ns, distributions])
+        except OSError:
+            # Missing paths, or zip files
+            state.append([entry, None])
+    return hashlib.sha256(orjson.dumps(state)).hexdigest()
+
+
+def _read_index(path: Path, fingerprint: str) -> Optional[dict[str, tuple[EntryPoint, ...]]]:
+    try:
+        index = orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if not isinstance(index, dict) or index.get("fingerprint") != fingerprint:
+        return None
+    return {
+        group: tuple(EntryPoint(name, value, group) for name, value in eps) for group, eps in index["groups"].items()
+    }
+
+
+def _write_index(path: Path, fingerprint: str, groups: dict[str, tuple[EntryPoint, ...]]):
+    index = {
+        "fingerprint": fingerprint,
+        "groups": {group: [[ep.name, ep.value] for ep in eps] for group, eps in groups.items()},
+    }
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so concurrent processes don't read a partial index
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        temp_path.write_bytes(orjson.dumps(index))
+        os.replace(temp_path, path)
+    except OSError:
+        logger_factory.get_logger(__name__).debug(f"Unable to write the entry points index to {path}", exc_info=True)
+
+
+class _EntryPointIndex:
+    """In-process index of the installed entry points by group."""
+
+    def __init__(self):
+        """Initialise the (empty) index."""
+        self._lock = threading.Lock()
+        self._key = None
+        self._groups: Optional[dict[str, tuple[EntryPoint, ...]]] = None
+
+    @staticmethod
+    def _current_key():
+        return tuple(sys.path), tuple(id(finder) for finder in sys.meta_path)
+
+    def invalidate(self):
+        """Clear the index, so the next lookup scans again."""
+        with self._lock:
+            self._key = None
+            self._groups = None
+
+    def select(self, group: str) -> tuple[EntryPoint, ...]:
+        """Get the entry points in a group."""
+        key = self._current_key()
+        with self._lock:
+            if self._groups is None or self._key != key:
+                self._groups = self._load()
+                self._key = key
+            return self._groups.get(group, ())
+
+    @staticmethod
+    def _load() -> dict[str, tuple[EntryPoint, ...]]:
+        index_path = os.environ.get(INDEX_ENV_VAR)
+        if not index_path or not _standard_finders():
+            return _scan()
+        index_path = Path(index_path)
+        fingerprint = _fingerprint()
+        groups = _read_index(index_path, fingerprint)
+        if groups is None:
+            groups = _scan()
+            _write_index(index_path, fingerprint, groups)
+        return groups
+
+
+_INDEX = _EntryPointIndex()
+
+
+def invalidate_extensions_cache():
+    """Clear the entry points index (e.g. after installing a package in the running process)."""
+    _INDEX.invalidate()
+
 
 def get_extension_names(entrypoint: str):
     """Get all installed extension names for a given entrypoint."""
-    extensions = []
-    for ep in entry_points().select(group=entrypoint):
-        extensions.append(ep.name)
+    extensions = [ep.name for ep in _INDEX.select(entrypoint)]
     logger_factory.get_logger(__name__).debug(f"Identified extensions {extensions} for entrypoint {entrypoint}")
     return extensions
 
 
 def load_extension(entrypoint: str, extension: str):
     """Load a given extension for a given entrypoint."""
-    for ep in entry_points().select(group=entrypoint, name=extension):
-        return ep.load()
+    for ep in _INDEX.select(entrypoint):
+        if ep.name == extension:
+            return ep.load()
     logger_factory.get_logger(__name__).warning(f"Entrypoint {extension} not found for {entrypoint}")
 
 
 def get_extensions(entrypoint: str):
     """Load all extensions for a given entrypoint."""
     extensions = {}
-    for ep in entry_points().select(group=entrypoint):
+    for ep in _INDEX.select(entrypoint):
         extensions[ep.name] = ep
     logger_factory.get_logger(__name__).debug(f"Identified extensions {extensions} for entrypoint {entrypoint}")
     return extensions
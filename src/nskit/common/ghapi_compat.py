@@ -20,6 +20,9 @@ Pagination needs the same treatment separately: on 2.x ``ghapi.all.paged`` is an
 async generator function *regardless* of the client's transport, so iterating it
 raises ``'async_generator' object is not iterable`` even against a sync client.
 2.x exports ``sync_paged`` for that; see :func:`paged`.
+
+Raw JSON payloads differ too: 2.x sends ``bytes`` bodies as-is, while 1.x always
+JSON encodes the payload itself; see :func:`json_request`.
 """
 
 from __future__ import annotations
@@ -28,6 +31,8 @@ import inspect
 from functools import lru_cache
 from typing import Any
 
+from nskit.common.io import json
+
 
 @lru_cache(maxsize=1)
 def supports_sync_flag() -> bool:
@@ -82,3 +87,24 @@ def paged(oper: Any, *args: Any, **kwargs: Any) -> Any:
         An iterator over pages of results.
     """
     return _pager()(oper, *args, **kwargs)
+
+
+def json_request(api: Any, path: str, verb: str, payload: Any) -> Any:
+    """Call a fully specified GitHub API ``path`` with a JSON ``payload``.
+
+    On 2.x the payload is serialised straight to UTF-8 bytes with orjson and
+    sent as the body. 1.x JSON encodes the payload itself (and can't send
+    pre-encoded bodies), so there it is passed through unchanged.
+
+    Args:
+        api: The ``GhApi`` client.
+        path: The API path, e.g. ``/orgs/{org}/properties/values``.
+        verb: The HTTP verb.
+        payload: The JSON serialisable payload.
+
+    Returns:
+        The API response.
+    """
+    if supports_sync_flag():
+        return api(path, verb, headers={"Content-Type": "application/json"}, data=json.dumps_bytes(payload))
+    return api(path, verb, data=payload)
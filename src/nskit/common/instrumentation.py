@@ -0,0 +1,274 @@
+"""Library instrumentation (tracing spans and counters).
+
+nskit wraps its slow operations (backend queries, engine runs, docker and git invocations, VCS provider calls,
+recipe creation and hooks) in spans, and counts e.g. template renders. By default this is a no-op. To report them,
+either:
+
+- set ``NSKIT_INSTRUMENTATION=opentelemetry`` (requires ``opentelemetry-api``) to use the globally configured
+  OpenTelemetry tracer and meter providers, or
+- call ``set_instrumentation`` with an ``Instrumentation``, e.g. ``OpenTelemetryInstrumentation`` with a specific
+  tracer/meter, or ``InMemoryInstrumentation`` to check them in tests.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import os
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import AbstractContextManager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from nskit._logging import logger_factory
+
+INSTRUMENTATION_ENV_VAR = "NSKIT_INSTRUMENTATION"
+
+
+logger = logger_factory.get_logger(__name__)
+
+
+class Span:
+    """A span, that attributes and exceptions can be recorded on (a no-op here)."""
+
+    def set_attribute(self, key: str, value: Any):
+        """Set an attribute on the span."""
+
+    def record_exception(self, exception: BaseException):
+        """Record an exception on the span."""
+
+
+class _NoOpSpanContext:
+    """Re-usable (stateless) context manager for the no-op span."""
+
+    _span = Span()
+
+    def __enter__(self) -> Span:
+        return self._span
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NOOP_SPAN_CONTEXT = _NoOpSpanContext()
+
+
+class Instrumentation:
+    """No-op instrumentation (the default), subclass this to report spans and counters."""
+
+    enabled = False
+
+    def span(self, name: str, attributes: dict[str, Any]) -> AbstractContextManager[Span]:
+        """Get a context manager for a span around an operation."""
+        return _NOOP_SPAN_CONTEXT
+
+    def add(self, name: str, value: float, attributes: dict[str, Any]):
+        """Add to a counter."""
+
+
+@dataclass
+class SpanRecord(Span):
+    """A span recorded by ``InMemoryInstrumentation``."""
+
+    name: str
+    attributes: dict[str, Any]
+    parent: Optional[SpanRecord] = field(default=None, repr=False)
+    start: float = field(default_factory=time.perf_counter)
+    end: Optional[float] = None
+    exception: Optional[BaseException] = None
+
+    @property
+    def duration(self) -> Optional[float]:
+        """Get the duration (seconds) of the span, if it has finished."""
+        return None if self.end is None else self.end - self.start
+
+    def set_attribute(self, key: str, value: Any):
+        """Set an attribute on the span."""
+        self.attributes[key] = value
+
+    def record_exception(self, exception: BaseException):
+        """Record an exception on the span."""
+        self.exception = exception
+
+
+@dataclass
+class CounterRecord:
+    """A counter increment recorded by ``InMemoryInstrumentation``."""
+
+    name: str
+    value: float
+    attributes: dict[str, Any]
+
+
+class InMemoryInstrumentation(Instrumentation):
+    """Record spans and counters in memory (e.g. for tests)."""
+
+    enabled = True
+
+    def __init__(self):
+        """Initialise the (empty) records."""
+        self.spans: list[SpanRecord] = []
+        self.counters: list[CounterRecord] = []
+        self._current: ContextVar[Optional[SpanRecord]] = ContextVar(f"nskit_span_{id(self)}", default=None)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name: str, attributes: dict[str, Any]) -> Iterator[SpanRecord]:
+        """Record a span around an operation."""
+        record = SpanRecord(name, dict(attributes), parent=self._current.get())
+        with self._lock:
+            self.spans.append(record)
+        token = self._current.set(record)
+        try:
+            yield record
+        except BaseException as e:
+            record.record_exception(e)
+            raise
+        finally:
+            self._current.reset(token)
+            record.end = time.perf_counter()
+
+    def add(self, name: str, value: float, attributes: dict[str, Any]):
+        """Record a counter increment."""
+        with self._lock:
+            self.counters.append(CounterRecord(name, value, dict(attributes)))
+
+    def find(self, name: str) -> list[SpanRecord]:
+        """Get the spans with the given name."""
+        return [record for record in self.spans if record.name == name]
+
+    def counter(self, name: str, **attributes) -> float:
+        """Get the total of a counter, optionally only for increments with the given attributes."""
+        return sum(
+            record.value
+            for record in self.counters
+            if record.name == name and all(record.attributes.get(k) == v for k, v in attributes.items())
+        )
+
+    def clear(self):
+        """Clear the recorded spans and counters."""
+        with self._lock:
+            self.spans.clear()
+            self.counters.clear()
+
+
+def _otel_value(value: Any) -> Any:
+    if isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, (list, tuple)) and all(isinstance(item, (str, bool, int, float)) for item in value):
+        return list(value)
+    return str(value)
+
+
+def _otel_attributes(attributes: dict[str, Any]) -> dict[str, Any]:
+    """Convert attributes to the types OpenTelemetry supports (dropping ``None`` values)."""
+    return {key: _otel_value(value) for key, value in attributes.items() if value is not None}
+
+
+class OpenTelemetryInstrumentation(Instrumentation):
+    """Report spans and counters with OpenTelemetry.
+
+    Uses the given tracer and meter, or the ``nskit`` tracer and meter from the global providers.
+    """
+
+    enabled = True
+
+    def __init__(self, tracer: Any = None, meter: Any = None):
+        """Initialise the tracer and meter."""
+        if tracer is None or meter is None:
+            try:
+                from opentelemetry import metrics, trace
+            except ImportError as e:
+                raise ImportError(
+                    "OpenTelemetry instrumentation requires opentelemetry-api. Install with: pip install nskit[otel]"
+                ) from e
+            tracer = tracer or trace.get_tracer("nskit")
+            meter = meter or metrics.get_meter("nskit")
+        self.tracer = tracer
+        self.meter = meter
+        self._counters: dict[str, Any] = {}
+        self._lock = threading.Lock()
+
+    def span(self, name: str, attributes: dict[str, Any]) -> AbstractContextManager[Span]:
+        """Start an OpenTelemetry span (as the current span) around an operation."""
+        return self.tracer.start_as_current_span(name, attributes=_otel_attributes(attributes))
+
+    def add(self, name: str, value: float, attributes: dict[str, Any]):
+        """Add to an OpenTelemetry counter."""
+        counter = self._counters.get(name)
+        if counter is None:
+            with self._lock:
+                counter = self._counters.get(name)
+                if counter is None:
+                    counter = self._counters[name] = self.meter.create_counter(name)
+        counter.add(value, attributes=_otel_attributes(attributes))
+
+
+_instrumentation: Optional[Instrumentation] = None
+
+
+def _from_environment() -> Instrumentation:
+    value = os.environ.get(INSTRUMENTATION_ENV_VAR, "").lower()
+    if value in ("opentelemetry", "otel"):
+        try:
+            return OpenTelemetryInstrumentation()
+        except ImportError:
+            logger.warning(f"{INSTRUMENTATION_ENV_VAR}={value} but opentelemetry-api is not installed")
+    elif value not in ("", "0", "false", "no", "off", "none"):
+        logger.warning(f"Unknown {INSTRUMENTATION_ENV_VAR} value {value!r}, instrumentation is disabled")
+    return Instrumentation()
+
+
+def get_instrumentation() -> Instrumentation:
+    """Get the current instrumentation (configured from ``NSKIT_INSTRUMENTATION`` on first use)."""
+    global _instrumentation
+    if _instrumentation is None:
+        _instrumentation = _from_environment()
+    return _instrumentation
+
+
+def set_instrumentation(instrumentation: Optional[Instrumentation]):
+    """Set the instrumentation (``None`` re-configures it from the environment on next use)."""
+    global _instrumentation
+    _instrumentation = instrumentation
+
+
+def span(name: str, **attributes) -> AbstractContextManager[Span]:
+    """Get a context manager for a span around an operation."""
+    return get_instrumentation().span(name, attributes)
+
+
+def count(name: str, value: float = 1, **attributes):
+    """Add to a counter."""
+    get_instrumentation().add(name, value, attributes)
+
+
+def traced(name: Optional[str] = None, arguments: Iterable[str] = (), **attributes):
+    """Wrap calls to a function in a span (by default named after the function).
+
+    The values of the named ``arguments`` are added as attributes, along with any static ``attributes``.
+    """
+    arguments = tuple(arguments)
+
+    def decorator(func: Callable) -> Callable:
+        span_name = name or f"{func.__module__}.{func.__qualname__}"
+        signature = inspect.signature(func) if arguments else None
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            instrumentation = get_instrumentation()
+            if not instrumentation.enabled:
+                return func(*args, **kwargs)
+            span_attributes = dict(attributes)
+            if signature is not None:
+                bound = signature.bind_partial(*args, **kwargs)
+                span_attributes.update({arg: bound.arguments[arg] for arg in arguments if arg in bound.arguments})
+            with instrumentation.span(span_name, span_attributes):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
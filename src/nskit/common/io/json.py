@@ -1,27 +1,42 @@
-"""Provide a JSON Load/Dump API consistent with stdlib JSON."""
+"""Provide a JSON Load/Dump API consistent with stdlib JSON.
 
-from typing import Any, Optional, TextIO
+orjson works in UTF-8 bytes, so where the result is going to a file, stream or socket anyway, use ``dumps_bytes`` or
+``dump_to_path`` (and pass bytes or binary files to ``loads``/``load``) to avoid decoding to and encoding from ``str``.
+"""
+
+from pathlib import Path
+from typing import Any, BinaryIO, Optional, TextIO, Union
 
 import orjson
 
 # orjson is significantly faster than standard JSON library
 
 
-def loads(s: str, **kwargs):
-    """Load JSON from string."""
+def loads(s: Union[str, bytes, bytearray, memoryview], **kwargs):
+    """Load JSON from string or bytes."""
     return orjson.loads(s, **kwargs)
 
 
 def dumps(data: Any, /, default: Optional[Any] = None, option: Optional[int] = None, **kwargs):
     """Dump JSON to string."""
-    return orjson.dumps(data, default=default, option=option, **kwargs).decode()
+    return dumps_bytes(data, default=default, option=option, **kwargs).decode()
+
+
+def dumps_bytes(data: Any, /, default: Optional[Any] = None, option: Optional[int] = None, **kwargs) -> bytes:
+    """Dump JSON to (UTF-8 encoded) bytes."""
+    return orjson.dumps(data, default=default, option=option, **kwargs)
 
 
-def load(fp: TextIO, **kwargs):
-    """Load JSON from file."""
+def load(fp: Union[TextIO, BinaryIO], **kwargs):
+    """Load JSON from (text or binary) file."""
     return loads(fp.read(), **kwargs)
 
 
 def dump(data: Any, f: TextIO, /, default: Optional[Any] = None, option: Optional[int] = None, **kwargs):
     """Dump JSON to file."""
     f.write(dumps(data, default=default, option=option, **kwargs))
+
+
+def dump_to_path(data: Any, path: Path, /, default: Optional[Any] = None, option: Optional[int] = None, **kwargs):
+    """Dump JSON to the file at ``path`` (UTF-8 encoded)."""
+    Path(path).write_bytes(dumps_bytes(data, default=default, option=option, **kwargs))
@@ -1,11 +1,26 @@
-"""Provide a TOML Load/Dump API consistent with JSON."""
+"""Provide a TOML Load/Dump API consistent with JSON.
 
+The ``loads``/``load``/``dumps``/``dump`` functions use tomlkit, so a loaded document keeps its comments and
+formatting when edited and dumped again.
+
+For read-only paths, ``plain_loads``/``plain_load`` parse to plain python types using ``tomllib`` (or ``tomli`` on
+older python versions), which is much faster.
+"""
+
+import sys
 from collections.abc import Mapping
-from typing import TextIO
+from typing import Any, BinaryIO, TextIO, Union
 
 import tomlkit
 
-# tomllib only provides load/loads
+# tomllib (tomli before python 3.11) only parses, so it is used for the read-only plain_loads/plain_load
+if sys.version_info >= (3, 11):
+    import tomllib as _tomllib
+else:  # pragma: no cover
+    try:
+        import tomli as _tomllib
+    except ImportError:
+        _tomllib = None
 
 
 def loads(s: str, **kwargs):
@@ -26,3 +41,18 @@ def load(fp: TextIO, **kwargs):
 def dump(data: Mapping, fp: TextIO, sort_keys: bool = False, **kwargs):
     """Load TOML to file/stream."""
     return tomlkit.dump(data, fp, sort_keys=sort_keys, **kwargs)
+
+
+def plain_loads(s: str) -> dict[str, Any]:
+    """Load TOML from string to plain python types (read-only)."""
+    if _tomllib is None:  # pragma: no cover
+        return tomlkit.loads(s).unwrap()
+    return _tomllib.loads(s)
+
+
+def plain_load(fp: Union[TextIO, BinaryIO]) -> dict[str, Any]:
+    """Load TOML from file/stream (text or binary) to plain python types (read-only)."""
+    s = fp.read()
+    if isinstance(s, bytes):
+        s = s.decode("utf-8")
+    return plain_loads(s)
@@ -1,14 +1,44 @@
-"""Provide a YAML 1.2 Load/Dump API consistent with JSON."""
+"""Provide a YAML 1.2 Load/Dump API consistent with JSON.
 
+The ``loads``/``load``/``dumps``/``dump`` functions use ruamel.yaml (YAML 1.2), in round-trip mode by default, so
+comments and ordering survive a load/dump cycle.
+
+For read-only paths (and plain data dumps) where comments don't matter, ``safe_loads``/``safe_load`` and
+``safe_dumps``/``safe_dump``/``safe_dump_to_path`` use PyYAML's libyaml backed ``CSafeLoader``/``CSafeDumper`` when
+available, falling back to the pure Python ``SafeLoader``/``SafeDumper``. These follow PyYAML's YAML 1.1 semantics (so ``a: NO`` ->
+``{"a": False}``), and raise ``YAMLError``.
+"""
+
+import threading
 from io import StringIO
+from pathlib import Path
 from typing import Any, TextIO
 
+import yaml as _pyyaml
 from ruamel.yaml import YAML as _YAML
+from yaml import YAMLError  # noqa: F401
 
 # PyYAML only supports YAML 1.1 (so a: NO -> {"a": False})
 # Instead want to use YAML 1.2 (so a: NO -> {"a": "NO"})
 # StrictYAML is an alternative, but it is difficult as it casts everything to strings, so needs a schema.
 
+_SafeLoader = getattr(_pyyaml, "CSafeLoader", _pyyaml.SafeLoader)
+_SafeDumper = getattr(_pyyaml, "CSafeDumper", _pyyaml.SafeDumper)
+
+# ruamel.yaml.YAML instances hold parser/emitter state, so can't be shared between threads
+_instances = threading.local()
+
+
+def _yaml(typ: str) -> _YAML:
+    """Get the (cached) ruamel.yaml.YAML instance for ``typ`` for the current thread."""
+    instances = getattr(_instances, "instances", None)
+    if instances is None:
+        instances = _instances.instances = {}
+    instance = instances.get(typ)
+    if instance is None:
+        instance = instances[typ] = _YAML(typ=typ)
+    return instance
+
 
 def loads(s: str, *, typ: str = "rt", **kwargs):
     """Load YAML from string."""
@@ -24,12 +54,63 @@ def dumps(data: Any, *, typ: str = "rt", **kwargs):
 
 def load(stream: TextIO, *, typ: str = "rt", **kwargs):
     """Load YAML from file/stream."""
-    return _YAML(typ=typ).load(stream, **kwargs)
+    return _yaml(typ).load(stream, **kwargs)
 
 
 def dump(data: Any, stream: TextIO, *, typ: str = "rt", **kwargs):
     """Dump YAML to file/stream."""
-    return _YAML(typ=typ).dump(data, stream=stream, **kwargs)
+    return _yaml(typ).dump(data, stream=stream, **kwargs)
+
+
+def safe_loads(s: str):
+    """Load plain (YAML 1.1) data from a string, using libyaml if available."""
+    return _pyyaml.load(s, Loader=_SafeLoader)  # nosec B506
+
+
+def safe_load(stream: TextIO):
+    """Load plain (YAML 1.1) data from a file/stream, using libyaml if available."""
+    return _pyyaml.load(stream, Loader=_SafeLoader)  # nosec B506
+
+
+def safe_dumps(
+    data: Any, *, default_flow_style: bool = False, sort_keys: bool = False, allow_unicode: bool = True, **kwargs
+) -> str:
+    """Dump plain data to a string, using libyaml if available."""
+    return _pyyaml.dump(
+        data,
+        Dumper=_SafeDumper,
+        default_flow_style=default_flow_style,
+        sort_keys=sort_keys,
+        allow_unicode=allow_unicode,
+        **kwargs,
+    )
+
+
+def safe_dump(
+    data: Any,
+    stream: TextIO,
+    *,
+    default_flow_style: bool = False,
+    sort_keys: bool = False,
+    allow_unicode: bool = True,
+    **kwargs,
+):
+    """Dump plain data to a file/stream, using libyaml if available."""
+    return _pyyaml.dump(
+        data,
+        stream,
+        Dumper=_SafeDumper,
+        default_flow_style=default_flow_style,
+        sort_keys=sort_keys,
+        allow_unicode=allow_unicode,
+        **kwargs,
+    )
+
+
+def safe_dump_to_path(data: Any, path: Path, **kwargs):
+    """Dump plain data to the file at ``path`` (UTF-8 encoded), using libyaml if available."""
+    with Path(path).open("wb") as f:
+        safe_dump(data, f, encoding="utf-8", **kwargs)
 
 
 # TODO: Add !include and !env tag handling
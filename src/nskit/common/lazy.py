@@ -1,7 +1,9 @@
 """Lazy import handlers."""
 
+import importlib
 import importlib.util
 import sys
+import threading
 
 
 def lazy_import(name):
@@ -13,3 +15,81 @@ def lazy_import(name):
     sys.modules[name] = module
     loader.exec_module(module)
     return module
+
+
+class LazyAttributes:
+    """Module attributes that are only built on first access.
+
+    Register factories on a module level instance and assign its ``__getattr__`` (and ``__dir__``)
+    to the module (PEP 562). The first access calls the factory and stores the result on the module,
+    so later accesses are plain attribute lookups::
+
+        _lazy = LazyAttributes(__name__)
+        __getattr__ = _lazy.__getattr__
+        __dir__ = _lazy.__dir__
+
+
+        @_lazy.register
+        def _gitignore():
+            return File(name=".gitignore", content=ref(__name__, "gitignore.jinja"))
+    """
+
+    def __init__(self, module_name: str):
+        """Initialise the registry for the module."""
+        self._module_name = module_name
+        self._factories = {}
+        self._lock = threading.RLock()
+
+    def register(self, factory=None, *, name=None):
+        """Register a factory for an attribute.
+
+        The attribute is named after the factory without the leading underscore by default (the factory
+        name needs to be private, otherwise it would shadow the lazy attribute on the module).
+        """
+
+        def decorator(func):
+            attribute = name or func.__name__.lstrip("_")
+            self._factories[attribute] = func
+            module = sys.modules.get(self._module_name)
+            if module is not None:
+                # Drop any value built before the module was reloaded
+                vars(module).pop(attribute, None)
+            return func
+
+        if factory is None:
+            return decorator
+        return decorator(factory)
+
+    def alias(self, name, module_name, attribute=None):
+        """Register an attribute as a (lazy) reference to an attribute on another module."""
+
+        def factory():
+            return getattr(importlib.import_module(module_name), attribute or name)
+
+        self.register(factory, name=name)
+
+    def submodule(self, name):
+        """Register a submodule to import on first access."""
+
+        def factory():
+            return importlib.import_module(f"{self._module_name}.{name}")
+
+        self.register(factory, name=name)
+
+    def materialised(self, name) -> bool:
+        """Check if an attribute has been built."""
+        return name in vars(sys.modules[self._module_name])
+
+    def __getattr__(self, name):
+        """Build and store the attribute on the module."""
+        if name not in self._factories:
+            raise AttributeError(f"module {self._module_name!r} has no attribute {name!r}")
+        module = sys.modules[self._module_name]
+        with self._lock:
+            if name not in vars(module):
+                setattr(module, name, self._factories[name]())
+        return vars(module)[name]
+
+    def __dir__(self):
+        """List the module attributes, including the unbuilt ones."""
+        return sorted(set(vars(sys.modules[self._module_name])) | set(self._factories))
@@ -4,7 +4,7 @@ from functools import wraps
 
 from .config import LoggingConfig  # noqa: F401
 from .library import LibraryLoggerFactory, get_library_logger  # noqa: F401
-from .logger import Logger, get_logger  # noqa: F401
+from .logger import LOGGER_REGISTRY, Logger, LoggerRegistry, get_logger  # noqa: F401
 
 
 @wraps(get_logger)
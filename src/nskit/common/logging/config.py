@@ -1,17 +1,19 @@
 """Manage logging config."""
 
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Literal, Optional
 
 from pydantic import AliasChoices, Field
 
 from nskit.common.configuration import BaseConfiguration
-from nskit.common.logging.formatter import BASE_FORMAT_STR, LoggingFormatter
+from nskit.common.logging.formatter import BASE_FORMAT_STR, JsonLogFormatter, LoggingFormatter
 
 JSON_ENV_VAR = "LOG_JSON"
 LOGLEVEL_ENV_VAR = "LOGLEVEL"
 LOGFILE_ENV_VAR = "LOGFILE"
 LOGFORMATSTRING_ENV_VAR = "LOG_FORMAT"
+JSON_FORMATTER_ENV_VAR = "LOG_JSON_FORMATTER"
+QUEUE_ENV_VAR = "LOG_QUEUE"
 DEFAULT_LOGLEVEL = "INFO"
 
 
@@ -38,9 +40,21 @@ class LoggingConfig(BaseConfiguration):
         serialization_alias="json",
         description="Output JSON Logs",
     )
+    json_formatter: Literal["logzero", "orjson"] = Field(
+        "logzero",
+        validation_alias=AliasChoices("json_formatter", JSON_FORMATTER_ENV_VAR),
+        description="The JSON formatter to use, logzero (python-json-logger) or orjson",
+    )
+    queue: bool = Field(
+        False,
+        validation_alias=AliasChoices("queue", QUEUE_ENV_VAR),
+        description="Hand records to a background thread to format and write them, so logging doesn't block on I/O",
+    )
     extra: dict[str, Any] = Field(default_factory=dict, description="Extra kwargs")
 
     @property
     def formatter(self):
-        """Return the logging formatter for the format string."""
+        """Return the logging formatter for the format string (or the orjson formatter)."""
+        if self.json_format and self.json_formatter == "orjson":
+            return JsonLogFormatter()
         return LoggingFormatter(self.format_string)
@@ -1,7 +1,11 @@
 """LoggingFormatter with extra."""
 
+import logging
+
 from logzero import LogFormatter as _LogFormatter
 
+from nskit.common.io import json
+
 BASE_FORMAT_STR = "%(color)s%(levelname)s: %(name)s - %(message)s%(end_color)s"
 
 
@@ -14,6 +18,42 @@ class LoggingFormatter(_LogFormatter):
         return super().format(record)
 
 
+class JsonLogFormatter(logging.Formatter):
+    """Format records as JSON lines with orjson (via nskit.common.io.json).
+
+    Includes the same record attributes as the logzero JSON formatter, and the extra attribute.
+    """
+
+    FIELDS = (
+        "filename",
+        "funcName",
+        "levelname",
+        "lineno",
+        "module",
+        "name",
+        "pathname",
+        "process",
+        "processName",
+        "threadName",
+    )
+
+    def format(self, record):
+        """Format the record as JSON."""
+        data = {"asctime": self.formatTime(record, self.datefmt), "message": record.getMessage()}
+        for field in self.FIELDS:
+            data[field] = getattr(record, field, None)
+        extra = getattr(record, "extra", None)
+        if extra:
+            data["extra"] = extra
+        if record.exc_info:
+            data["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            data["exc_info"] = record.exc_text
+        if record.stack_info:
+            data["stack_info"] = self.formatStack(record.stack_info)
+        return json.dumps(data, default=str)
+
+
 def get_library_log_format_string(library, version):
     """Get a log format string including the library name and version."""
     return BASE_FORMAT_STR.replace("%(name)s", f"{library}:{version} - %(name)s")
@@ -4,7 +4,7 @@ from typing import Any, Optional, Union
 
 from nskit.common.logging.config import LoggingConfig
 from nskit.common.logging.formatter import get_library_log_format_string
-from nskit.common.logging.logger import get_logger
+from nskit.common.logging.logger import LOGGER_REGISTRY, get_logger
 
 
 def get_library_logger(
@@ -20,7 +20,7 @@ def get_library_logger(
     config["format_string"] = formatstr
     config["extra"] = config.get("extra", {})
     config["extra"].update(kwargs.pop("extra", {}))
-    config = LoggingConfig(**config)
+    config = LOGGER_REGISTRY.get_config(config)
     if config.json_format:
         config.extra["library"] = library
     return get_logger(name, config, **kwargs)
@@ -1,9 +1,19 @@
 """Logger Adaptor with JSON and extra handling."""
 
+import atexit
+import copy
+import logging
+import os
+import queue
+import threading
 from functools import wraps
 from logging import LoggerAdapter
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Optional
 
+import orjson
 from logzero import setup_logger
+from pydantic import AliasChoices
 
 from .config import DEFAULT_LOGLEVEL
 
@@ -61,20 +71,181 @@ class Logger(LoggerAdapter):
         return wrapper_factory
 
 
+def _freeze(value: Any):
+    """Get a hashable key for a (JSON-like) value."""
+    return orjson.dumps(value, default=repr, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+
+
+class LoggerRegistry:
+    """Process level registry of logging configs and configured loggers.
+
+    ``LoggingConfig`` reads the environment, and ``setup_logger`` replaces the logger handlers and formatters,
+    so both are cached. A config is only rebuilt when its inputs or the logging environment variables change,
+    and a logger is only set up again when its config changes (or its handlers were changed elsewhere).
+
+    With ``queue`` set in the config, the logger only puts records on a queue, and a single background
+    ``QueueListener`` thread passes them to the logger's (formatting and writing) handlers.
+    """
+
+    def __init__(self):
+        """Initialise the (empty) registry."""
+        self._lock = threading.RLock()
+        self._env_names = None
+        self._configs = {}
+        self._loggers = {}
+        self._dispatcher = _LogDispatcher()
+        self._listener = None
+
+    def clear(self):
+        """Clear the cached configs and loggers (the loggers are set up again on next use)."""
+        with self._lock:
+            self._configs.clear()
+            self._loggers.clear()
+
+    def _environment(self, config_cls) -> tuple[Optional[str], ...]:
+        """Get the environment variables the config can be read from."""
+        if self._env_names is None:
+            names = set()
+            for name, field in config_cls.model_fields.items():
+                names.add(name)
+                if isinstance(field.validation_alias, AliasChoices):
+                    names.update(choice for choice in field.validation_alias.choices if isinstance(choice, str))
+                elif isinstance(field.validation_alias, str):
+                    names.add(field.validation_alias)
+            # Environment variable names are case-insensitive for the config, check the usual spellings
+            self._env_names = tuple(sorted({variant for name in names for variant in (name.lower(), name.upper())}))
+        return tuple(os.environ.get(name) for name in self._env_names)
+
+    def get_config(self, config: dict[str, Any]):
+        """Get the ``LoggingConfig`` for the config values (a copy, so it can be modified)."""
+        from .config import LoggingConfig
+
+        key = (_freeze(config), self._environment(LoggingConfig))
+        with self._lock:
+            logging_config = self._configs.get(key)
+            if logging_config is None:
+                logging_config = LoggingConfig(**config)
+                self._configs[key] = logging_config
+        return logging_config.model_copy(deep=True)
+
+    def setup_logger(self, name: str, logging_config, **kwargs):
+        """Get the logger with the handlers and formatter for the config."""
+        settings = logging_config.model_dump(
+            by_alias=True, exclude={"format_string", "extra", "json_formatter", "queue"}
+        )
+        # The formatter is rebuilt on each dump, so use its format string in the key
+        key = _freeze(
+            [
+                {**settings, "formatter": logging_config.format_string},
+                logging_config.json_formatter,
+                logging_config.queue,
+                kwargs,
+            ]
+        )
+        with self._lock:
+            cached = self._loggers.get(name)
+            if cached is not None:
+                cached_key, logger, handlers = cached
+                if cached_key == key and logger.handlers == handlers:
+                    return logger
+            queued_handlers = self._dispatcher.handlers.pop(name, None)
+            if queued_handlers is not None:
+                # Restore the handlers, so setup_logger reconfigures rather than duplicates them
+                logging.getLogger(name).handlers = queued_handlers
+            if settings["json"] and logging_config.json_formatter == "orjson":
+                # The orjson formatter is passed as the formatter (logzero would use its own for json)
+                settings["json"] = False
+            logger = setup_logger(name, **settings, **kwargs)
+            if logging_config.queue:
+                self._dispatcher.handlers[name] = list(logger.handlers)
+                logger.handlers = [_QueueHandler(self._get_queue())]
+            self._loggers[name] = (key, logger, list(logger.handlers))
+        return logger
+
+    def _get_queue(self) -> queue.SimpleQueue:
+        """Get the queue for queued loggers, starting the listener thread if needed."""
+        if self._listener is None:
+            self._listener = QueueListener(queue.SimpleQueue(), self._dispatcher)
+            self._listener.start()
+            atexit.register(self.stop_queue)
+        return self._listener.queue
+
+    def stop_queue(self):
+        """Stop the listener thread, after handling the queued records.
+
+        The queued loggers get their handlers back, so loggers already held (e.g. module level loggers) keep
+        logging (unqueued), and they start a new listener when next set up.
+        """
+        with self._lock:
+            listener = self._listener
+            self._listener = None
+            queued = dict(self._dispatcher.handlers)
+            for name, handlers in queued.items():
+                logging.getLogger(name).handlers = list(handlers)
+                self._loggers.pop(name, None)
+        if listener is not None:
+            # Handles the records already queued
+            listener.stop()
+        with self._lock:
+            for name, handlers in queued.items():
+                if self._dispatcher.handlers.get(name) is handlers:
+                    del self._dispatcher.handlers[name]
+
+
+class _LogDispatcher(logging.Handler):
+    """Handle queued records with the handlers of the logger they were logged to."""
+
+    def __init__(self):
+        """Initialise the dispatcher."""
+        super().__init__()
+        self.handlers: dict[str, list[logging.Handler]] = {}
+
+    def handle(self, record):
+        """Pass the record to the logger handlers."""
+        for handler in self.handlers.get(record.name, ()):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+        return True
+
+    def emit(self, record):
+        """Records are passed on in handle."""
+
+
+class _QueueHandler(QueueHandler):
+    """Put records on the queue as the logger's handlers would see them."""
+
+    _exception_formatter = logging.Formatter()
+
+    def prepare(self, record):
+        """Copy the record, merging the arguments into the message and rendering any exception.
+
+        ``QueueHandler.prepare`` formats the whole record (including the traceback) into the message, so the
+        queued handlers' formatters would give different output to unqueued logging (e.g. no ``exc_info`` key).
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self._exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+LOGGER_REGISTRY = LoggerRegistry()
+
+
 def get_logger(name, config=None, **kwargs):
     """Get the logger object.
 
     You can set the json flag for json logging (or this can be set globally for all logs if required, using the LOG_JSON env var.).
+    Loggers are only (re)configured when their config changes (see ``LoggerRegistry``).
     """
     if config is None:
         config = {}
     if isinstance(config, dict):
-        from .config import LoggingConfig
-
-        logging_config = LoggingConfig(**config)
+        logging_config = LOGGER_REGISTRY.get_config(config)
     else:
         logging_config = config
-    logger = setup_logger(
-        name, **logging_config.model_dump(by_alias=True, exclude={"format_string", "extra"}), **kwargs
-    )
+    logger = LOGGER_REGISTRY.setup_logger(name, logging_config, **kwargs)
     return Logger(logger, extra=logging_config.extra)
@@ -0,0 +1,394 @@
+"""Central runner for external commands (``git``, ``docker``, ``pip``, ``pre_commit``, ...).
+
+``run``, ``call``, ``check_call``, ``check_output`` and ``popen`` wrap the ``subprocess`` functions of the same name,
+and record every invocation (operation, duration, exit status and whether it timed out) in ``PROCESS_STATS``, in a
+``nskit.subprocess`` span, and in the ``nskit.subprocess.invocations`` counter (see ``nskit.common.instrumentation``).
+
+The operation is e.g. ``git commit`` or ``docker pull`` (see ``operation_name``), so tests can assert on the number of
+processes spawned, e.g.::
+
+    with process.recording() as stats:
+        update_project(...)
+    assert stats.invocations("git") <= 5
+
+Calls without an explicit ``timeout`` use ``NSKIT_SUBPROCESS_TIMEOUT`` (seconds, ``0`` for no limit) if it is set,
+otherwise the timeout for their operation in ``PROCESS_TIMEOUTS``: short for queries (``git``, ``gh``, ``docker``),
+and no limit for long running operations (``git commit`` with hooks, ``pip install``, ``pre_commit install``,
+``docker pull``, ...). ``cached_output`` reuses the output of side-effect free queries (e.g. ``git version``) for the life of
+the process.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess  # nosec B404
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager, suppress
+from dataclasses import dataclass
+from pathlib import Path
+from subprocess import CalledProcessError, TimeoutExpired  # nosec B404
+from typing import Any, Callable, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from nskit._logging import logger_factory
+from nskit.common.cache import caching_enabled
+from nskit.common.instrumentation import count, span
+
+TIMEOUT_ENV_VAR = "NSKIT_SUBPROCESS_TIMEOUT"
+# Options that take a value before the sub-command, e.g. git -C <path> status
+_VALUE_OPTIONS = frozenset({"-C", "-c", "--git-dir", "--work-tree", "-H", "--host", "--config", "--context"})
+# Programs whose first positional argument is a sub-command (other programs take e.g. paths or URLs)
+_SUBCOMMAND_PROGRAMS = frozenset({"git", "docker", "gh", "pip", "uv", "pre_commit", "pre-commit"})
+# Default timeouts (seconds) by operation prefix, None for no limit
+_OPERATION_TIMEOUTS: dict[str, Optional[float]] = {
+    "git": 60,
+    # Can run pre-commit hooks (which install their environments on first use), or stage a large generated tree
+    "git add": None,
+    "git commit": None,
+    "git clone": 600,
+    "git fetch": 600,
+    "git pull": 600,
+    "git push": 600,
+    "git fast-import": 600,
+    "gh": 120,
+    "docker": 60,
+    "docker build": None,
+    "docker pull": None,
+    "docker push": None,
+    "docker run": None,
+    "curl": 600,
+    "pip": 60,
+    "pip install": None,
+    "uv": None,
+    "pre_commit": None,
+    "pre-commit": None,
+}
+
+
+logger = logger_factory.get_logger(__name__)
+
+Args = Sequence[Union[str, os.PathLike]]
+
+
+@dataclass(frozen=True)
+class CommandRecord:
+    """A finished (or failed to start) command."""
+
+    operation: str
+    args: tuple[str, ...]
+    duration: float
+    returncode: Optional[int] = None
+    timed_out: bool = False
+
+    @property
+    def succeeded(self) -> bool:
+        """Check whether the command exited with status 0."""
+        return self.returncode == 0
+
+
+class ProcessStats:
+    """Thread-safe accounting of command invocations.
+
+    Invocation counts and durations are kept per operation, along with the most recent ``maxlen`` records.
+    """
+
+    def __init__(self, maxlen: Optional[int] = 1000):
+        """Initialise the (empty) statistics."""
+        self._records: deque[CommandRecord] = deque(maxlen=maxlen)
+        self._counts: Counter[str] = Counter()
+        self._durations: Counter[str] = Counter()
+        self._failures: Counter[str] = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, record: CommandRecord):
+        """Add a command record."""
+        with self._lock:
+            self._records.append(record)
+            self._counts[record.operation] += 1
+            self._durations[record.operation] += record.duration
+            if not record.succeeded:
+                self._failures[record.operation] += 1
+
+    @property
+    def records(self) -> list[CommandRecord]:
+        """Get the (most recent) command records."""
+        with self._lock:
+            return list(self._records)
+
+    def counts(self) -> dict[str, int]:
+        """Get the number of invocations for each operation."""
+        with self._lock:
+            return dict(self._counts)
+
+    @staticmethod
+    def _matches(operation: str, prefix: Optional[str]) -> bool:
+        return prefix is None or operation == prefix or operation.startswith(f"{prefix} ")
+
+    def invocations(self, operation: Optional[str] = None) -> int:
+        """Get the number of invocations of an operation (``git`` includes ``git commit``), or of all commands."""
+        with self._lock:
+            return sum(n for name, n in self._counts.items() if self._matches(name, operation))
+
+    def failures(self, operation: Optional[str] = None) -> int:
+        """Get the number of invocations of an operation that failed or timed out."""
+        with self._lock:
+            return sum(n for name, n in self._failures.items() if self._matches(name, operation))
+
+    def duration(self, operation: Optional[str] = None) -> float:
+        """Get the total duration (seconds) of the invocations of an operation."""
+        with self._lock:
+            return sum(d for name, d in self._durations.items() if self._matches(name, operation))
+
+    def clear(self):
+        """Clear the statistics."""
+        with self._lock:
+            self._records.clear()
+            self._counts.clear()
+            self._durations.clear()
+            self._failures.clear()
+
+
+PROCESS_STATS = ProcessStats()
+_recorders: list[ProcessStats] = []
+_recorders_lock = threading.Lock()
+
+
+@contextmanager
+def recording(maxlen: Optional[int] = None) -> Iterator[ProcessStats]:
+    """Record the commands run (by any thread) within the block in a new ``ProcessStats``."""
+    stats = ProcessStats(maxlen=maxlen)
+    with _recorders_lock:
+        _recorders.append(stats)
+    try:
+        yield stats
+    finally:
+        with _recorders_lock:
+            _recorders.remove(stats)
+
+
+def _argv(args: Union[Args, str, os.PathLike]) -> tuple[str, ...]:
+    if isinstance(args, (str, os.PathLike)):
+        return (os.fspath(args),)
+    return tuple(os.fspath(arg) for arg in args)
+
+
+def operation_name(args: Args) -> str:
+    """Get the operation for a command, the program and its sub-command (e.g. ``git commit``, ``pip install``).
+
+    ``python -m <module>`` is treated as ``<module>``, and options before the sub-command are skipped. Only known
+    multi-command programs (``git``, ``docker``, ``gh``, ``pip``, ``uv``, ``pre_commit``) get a sub-command, so e.g.
+    ``curl -o <file> <url>`` is just ``curl``.
+    """
+    args = _argv(args)
+    if not args:
+        return ""
+    program = Path(args[0]).name
+    program = program[:-4] if program.lower().endswith(".exe") else program
+    rest = list(args[1:])
+    if program.startswith("python") and rest[:1] == ["-m"] and len(rest) > 1:
+        program, rest = rest[1], rest[2:]
+    if program not in _SUBCOMMAND_PROGRAMS:
+        return program
+    skip = False
+    for arg in rest:
+        if skip:
+            skip = False
+        elif arg in _VALUE_OPTIONS:
+            skip = True
+        elif not arg.startswith("-"):
+            return f"{program} {arg}"
+    return program
+
+
+class ProcessTimeouts(BaseModel):
+    """Default timeouts for commands by operation (seconds, ``None`` for no limit).
+
+    The longest matching operation prefix is used (e.g. ``pip install`` rather than ``pip``), falling back to
+    ``default`` for other commands.
+    """
+
+    default: Optional[float] = None
+    operations: dict[str, Optional[float]] = Field(default_factory=lambda: dict(_OPERATION_TIMEOUTS))
+
+    def get(self, operation: str) -> Optional[float]:
+        """Get the timeout for an operation."""
+        matches = [prefix for prefix in self.operations if ProcessStats._matches(operation, prefix)]
+        if not matches:
+            return self.default
+        return self.operations[max(matches, key=len)]
+
+
+PROCESS_TIMEOUTS = ProcessTimeouts()
+
+
+def default_timeout(operation: Optional[str] = None) -> Optional[float]:
+    """Get the default timeout (seconds) for an operation.
+
+    ``NSKIT_SUBPROCESS_TIMEOUT`` overrides the ``PROCESS_TIMEOUTS`` for all operations if it is set (``0`` for no limit).
+    """
+    value = os.environ.get(TIMEOUT_ENV_VAR)
+    if value:
+        try:
+            timeout = float(value)
+        except ValueError:
+            logger.warning(f"Invalid {TIMEOUT_ENV_VAR} value {value!r}, ignoring")
+        else:
+            return timeout if timeout > 0 else None
+    if operation is None:
+        return PROCESS_TIMEOUTS.default
+    return PROCESS_TIMEOUTS.get(operation)
+
+
+def _record(record: CommandRecord):
+    PROCESS_STATS.record(record)
+    with _recorders_lock:
+        recorders = list(_recorders)
+    for stats in recorders:
+        stats.record(record)
+    count("nskit.subprocess.invocations", operation=record.operation, succeeded=record.succeeded)
+    if record.timed_out:
+        logger.warning(f"{record.operation} timed out after {record.duration:.1f}s")
+    else:
+        logger.debug(f"{record.operation} exited with {record.returncode} in {record.duration:.3f}s")
+
+
+def _invoke(
+    func: Callable,
+    args: Args,
+    operation: Optional[str],
+    timeout: Optional[float],
+    kwargs: dict[str, Any],
+    returncode: Callable[[Any], Optional[int]],
+):
+    operation = operation or operation_name(args)
+    if timeout is None:
+        timeout = default_timeout(operation)
+    if timeout is not None:
+        kwargs["timeout"] = timeout
+    code = None
+    timed_out = False
+    start = time.perf_counter()
+    with span("nskit.subprocess", operation=operation) as current_span:
+        try:
+            result = func(args, **kwargs)
+            code = returncode(result)
+            return result
+        except TimeoutExpired:
+            timed_out = True
+            raise
+        except CalledProcessError as e:
+            code = e.returncode
+            raise
+        finally:
+            current_span.set_attribute("returncode", code)
+            _record(CommandRecord(operation, _argv(args), time.perf_counter() - start, code, timed_out))
+
+
+def run(
+    args: Args, *, operation: Optional[str] = None, timeout: Optional[float] = None, **kwargs
+) -> subprocess.CompletedProcess:
+    """Run a command (``subprocess.run``)."""
+    return _invoke(subprocess.run, args, operation, timeout, kwargs, lambda result: getattr(result, "returncode", None))
+
+
+def call(args: Args, *, operation: Optional[str] = None, timeout: Optional[float] = None, **kwargs) -> int:
+    """Run a command and return its exit status (``subprocess.call``)."""
+    return _invoke(subprocess.call, args, operation, timeout, kwargs, lambda result: result)
+
+
+def check_call(args: Args, *, operation: Optional[str] = None, timeout: Optional[float] = None, **kwargs) -> int:
+    """Run a command, raising ``CalledProcessError`` if it fails (``subprocess.check_call``)."""
+    return _invoke(subprocess.check_call, args, operation, timeout, kwargs, lambda result: 0)
+
+
+def check_output(args: Args, *, operation: Optional[str] = None, timeout: Optional[float] = None, **kwargs) -> Any:
+    """Run a command and return its output, raising ``CalledProcessError`` if it fails (``subprocess.check_output``)."""
+    return _invoke(subprocess.check_output, args, operation, timeout, kwargs, lambda result: 0)
+
+
+@contextmanager
+def popen(
+    args: Args, *, operation: Optional[str] = None, timeout: Optional[float] = None, **kwargs
+) -> Iterator[subprocess.Popen]:
+    """Start a command (``subprocess.Popen``), for streaming to/from it, recording it when it exits.
+
+    Exiting the block closes the command's pipes and waits for it to finish, killing it (and raising
+    ``TimeoutExpired``) if it takes longer than ``timeout`` (or the default timeout for the operation).
+    """
+    operation = operation or operation_name(args)
+    if timeout is None:
+        timeout = default_timeout(operation)
+    start = time.perf_counter()
+    code = None
+    timed_out = False
+    with span("nskit.subprocess", operation=operation) as current_span:
+        try:
+            with subprocess.Popen(args, **kwargs) as process:  # nosec B603
+                try:
+                    yield process
+                finally:
+                    for stream in (process.stdout, process.stderr, process.stdin):
+                        if stream is not None:
+                            with suppress(BrokenPipeError):
+                                stream.close()
+                    try:
+                        process.wait(timeout=timeout)
+                    except TimeoutExpired:
+                        timed_out = True
+                        process.kill()
+                        raise
+            code = process.returncode
+        finally:
+            current_span.set_attribute("returncode", code)
+            _record(CommandRecord(operation, _argv(args), time.perf_counter() - start, code, timed_out))
+
+
+_outputs: dict[tuple, Any] = {}
+_outputs_lock = threading.Lock()
+
+
+def _freeze(value: Any) -> Any:
+    """Get a hashable version of a keyword argument value (e.g. an ``env`` mapping) for the output cache key."""
+    if isinstance(value, Mapping):
+        return ("mapping", tuple(sorted((str(key), _freeze(item)) for key, item in value.items())))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_freeze(item) for item in value))
+    if isinstance(value, os.PathLike):
+        return ("path", os.fspath(value))
+    try:
+        hash(value)
+    except TypeError:
+        raise TypeError(f"cached_output can't cache calls with a {type(value).__name__} argument") from None
+    return value
+
+
+def cached_output(args: Args, *, cwd: Optional[Union[str, os.PathLike]] = None, **kwargs) -> Any:
+    """Get the output of a side-effect free command (``check_output``), reusing it for later identical calls.
+
+    Failures aren't cached. Disabled by ``NSKIT_CACHE=0``. Mapping and sequence arguments (e.g. ``env``) are compared
+    by value, other arguments must be hashable.
+    """
+    key = (
+        _argv(args),
+        None if cwd is None else os.fspath(cwd),
+        tuple(sorted((name, _freeze(value)) for name, value in kwargs.items())),
+    )
+    if caching_enabled():
+        with _outputs_lock:
+            if key in _outputs:
+                return _outputs[key]
+    output = check_output(args, cwd=cwd, **kwargs)
+    if caching_enabled():
+        with _outputs_lock:
+            _outputs[key] = output
+    return output
+
+
+def clear_cached_outputs():
+    """Clear the outputs stored by ``cached_output``."""
+    with _outputs_lock:
+        _outputs.clear()
@@ -3,7 +3,20 @@
 Building blocks to build up repo templates and mix (instantiate) them.
 """
 
-from nskit.mixer import hooks  # noqa: F401
-from nskit.mixer.components import File, Folder, Hook, LicenseFile, Recipe  # noqa: F401
-from nskit.mixer.repo import CodeRecipe, RepoMetadata  # noqa: F401
-from nskit.mixer.utilities import ref  # noqa: F401
+# The exports are imported on first access (PEP 562)
+from nskit.common.lazy import LazyAttributes
+
+_lazy = LazyAttributes(__name__)
+__getattr__ = _lazy.__getattr__
+__dir__ = _lazy.__dir__
+
+_lazy.submodule("hooks")
+_lazy.alias("File", "nskit.mixer.components")
+_lazy.alias("Folder", "nskit.mixer.components")
+_lazy.alias("Hook", "nskit.mixer.components")
+_lazy.alias("LicenseFile", "nskit.mixer.components")
+_lazy.alias("Recipe", "nskit.mixer.components")
+_lazy.alias("CodeRecipe", "nskit.mixer.repo")
+_lazy.alias("RepoMetadata", "nskit.mixer.repo")
+_lazy.alias("ref", "nskit.mixer.utilities")
+_lazy.alias("StaticSource", "nskit.mixer.utilities")
@@ -0,0 +1,288 @@
+"""Self-contained recipe bundles with precompiled templates.
+
+A bundle is a zip archive holding a recipe's flattened ``File``/``Folder`` tree, its
+Jinja templates precompiled to Python code, the recipe field specifications and a
+content hash manifest. Loading a bundle rebuilds the tree without building the
+recipe's ingredients or re-parsing any templates.
+
+Bundles contain executable (compiled template) code, so only load trusted bundles.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import importlib
+import importlib.util
+import marshal
+import shutil
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Any
+
+import jinja2
+
+from nskit import __version__
+from nskit.common.io import json
+from nskit.constants import RECIPE_ENTRYPOINT
+from nskit.mixer.components import File, Folder, Recipe
+from nskit.mixer.components.filesystem_object import FileSystemObject, TemplateStr
+from nskit.mixer.utilities import JINJA_ENVIRONMENT_FACTORY, RENDER_MEMO, Resource
+
+BUNDLE_FORMAT_VERSION = 1
+BUNDLE_METADATA = "bundle.json"
+
+
+class BundleError(ValueError):
+    """Raised when a recipe can't be bundled, or a bundle can't be loaded."""
+
+
+def _reference(obj: Any) -> str:
+    """Get an importable ``module:qualname`` reference for a class or function."""
+    qualname = getattr(obj, "__qualname__", "")
+    if not qualname or "<" in qualname:
+        raise BundleError(f"{obj!r} can't be bundled, callables need to be importable module level objects.")
+    return f"{obj.__module__}:{qualname}"
+
+
+def _resolve(reference: str) -> Any:
+    module_name, qualname = reference.split(":")
+    obj = importlib.import_module(module_name)
+    for attribute in qualname.split("."):
+        obj = getattr(obj, attribute)
+    return obj
+
+
+def _environment_reference(environment: jinja2.Environment) -> str:
+    return f"{_reference(type(environment))}@jinja2=={jinja2.__version__}"
+
+
+class _BundleWriter:
+    """Collect the archive members while flattening a recipe tree."""
+
+    def __init__(self, environment: jinja2.Environment):
+        self.environment = environment
+        self.members: dict[str, bytes] = {}
+        self.templates: list[str] = []
+        self.analysis: dict[str, dict[str, Any]] = {}
+
+    def add_template(self, source: str) -> str:
+        key = hashlib.sha256(source.encode("utf-8")).hexdigest()
+        if f"templates/{key}.jinja" not in self.members:
+            ast = self.environment.parse(source)
+            code = self.environment.compile(ast, raw=True)
+            self.members[f"templates/{key}.jinja"] = source.encode("utf-8")
+            self.members[f"templates/{key}.py"] = code.encode("utf-8")
+            self.members[f"templates/{key}.pyc"] = marshal.dumps(compile(code, f"<template {key}>", "exec"))
+            self.templates.append(key)
+            self.analysis[key] = self._analysis(source)
+        return key
+
+    def _analysis(self, source: str) -> dict[str, Any]:
+        info = RENDER_MEMO.template_info(self.environment, source)
+        variables = None if info.variables is None else sorted(info.variables)
+        return {"variables": variables, "non_deterministic": info.non_deterministic}
+
+    def add_static(self, content: Resource | Path) -> str:
+        if isinstance(content, Resource):
+            with content.as_file() as path:
+                data = Path(path).read_bytes()
+        else:
+            data = Path(content).read_bytes()
+        key = hashlib.sha256(data).hexdigest()
+        self.members[f"static/{key}"] = data
+        return key
+
+    def value(self, obj: FileSystemObject, field_name: str, value: Any) -> Any:
+        if field_name == "name" and isinstance(value, TemplateStr):
+            return {"template": self.add_template(value)}
+        if isinstance(value, (str, int, float, bool)) or value is None:
+            if field_name == "content" and isinstance(value, str):
+                if getattr(obj, "static", False):
+                    return {"static": self.add_static(value)}
+                if isinstance(value, Resource):
+                    value = value.load()
+                return {"template": self.add_template(value)}
+            return value
+        if isinstance(value, bytes):
+            return {"bytes": base64.b64encode(value).decode("ascii")}
+        if isinstance(value, Path) and field_name == "content":
+            if getattr(obj, "static", False):
+                return {"static": self.add_static(value)}
+            with open(value) as f:
+                return {"template": self.add_template(f.read())}
+        if callable(value):
+            return {"callable": _reference(value)}
+        raise BundleError(f"Unable to bundle {field_name}={value!r} on {obj!r}")
+
+    def node(self, obj: FileSystemObject) -> dict[str, Any]:
+        node: dict[str, Any] = {"class": _reference(type(obj)), "fields": {}}
+        for field_name in type(obj).model_fields:
+            if field_name == "contents":
+                node["contents"] = [self.node(child) for child in obj.contents]
+            else:
+                node["fields"][field_name] = self.value(obj, field_name, getattr(obj, field_name))
+        return node
+
+
+def build_bundle(recipe: str | type[Recipe], output: str | Path, *, entrypoint: str = RECIPE_ENTRYPOINT) -> Path:
+    """Package a recipe (entry-point name or class) into a bundle at ``output``."""
+    from nskit.client.field_parser import FieldParser
+
+    if isinstance(recipe, str):
+        try:
+            recipe_class = Recipe.load(recipe, entrypoint=entrypoint, initialize=False)
+        except ValueError as exc:
+            # The recipe isn't installed
+            raise BundleError(str(exc)) from exc
+        recipe_name = recipe
+    else:
+        recipe_class = recipe
+        recipe_name = recipe.__name__
+    environment = JINJA_ENVIRONMENT_FACTORY.environment
+    writer = _BundleWriter(environment)
+    contents = recipe_class.model_fields["contents"].get_default(call_default_factory=True)
+    tree = [writer.node(obj) for obj in contents]
+    fields = FieldParser().from_recipe_model(recipe_class).model_dump(mode="json")
+    metadata = {
+        "format_version": BUNDLE_FORMAT_VERSION,
+        "nskit_version": __version__,
+        "recipe": {"name": recipe_name, "class": _reference(recipe_class)},
+        "environment": _environment_reference(environment),
+        "bytecode_magic": importlib.util.MAGIC_NUMBER.hex(),
+        "templates": writer.templates,
+        "analysis": writer.analysis,
+        "tree": tree,
+        "fields": fields,
+        "manifest": {member: hashlib.sha256(data).hexdigest() for member, data in sorted(writer.members.items())},
+    }
+    output = Path(output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(output, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr(BUNDLE_METADATA, json.dumps_bytes(metadata))
+        for member, data in sorted(writer.members.items()):
+            archive.writestr(member, data)
+    return output
+
+
+class RecipeBundle:
+    """A loaded recipe bundle.
+
+    Use it as a context manager (or call ``cleanup``) to remove any extracted static files.
+    """
+
+    def __init__(self, path: str | Path):
+        """Load the bundle, verifying its manifest and registering the compiled templates."""
+        self.path = Path(path)
+        self._static_dir: Path | None = None
+        with zipfile.ZipFile(self.path) as archive:
+            self.metadata = json.loads(archive.read(BUNDLE_METADATA))
+            if self.metadata.get("format_version") != BUNDLE_FORMAT_VERSION:
+                raise BundleError(f"Unsupported bundle format version {self.metadata.get('format_version')}")
+            self._members = {}
+            for member, digest in self.metadata["manifest"].items():
+                data = archive.read(member)
+                if hashlib.sha256(data).hexdigest() != digest:
+                    raise BundleError(f"Bundle member {member} does not match the manifest")
+                self._members[member] = data
+        self._register_templates()
+
+    @property
+    def name(self) -> str:
+        """The recipe name."""
+        return self.metadata["recipe"]["name"]
+
+    @property
+    def fields(self) -> dict[str, Any]:
+        """The recipe field specifications (``FieldParser.from_recipe_model`` output)."""
+        return self.metadata["fields"]
+
+    @property
+    def recipe_class(self) -> type[Recipe]:
+        """The recipe class (needed for validating inputs and computing the context)."""
+        return _resolve(self.metadata["recipe"]["class"])
+
+    def _source(self, key: str) -> str:
+        return self._members[f"templates/{key}.jinja"].decode("utf-8")
+
+    def _register_templates(self):
+        environment = JINJA_ENVIRONMENT_FACTORY.environment
+        if self.metadata["environment"] != _environment_reference(environment):
+            # Compiled for a different environment, so templates are compiled from source on use
+            return
+        use_bytecode = self.metadata["bytecode_magic"] == importlib.util.MAGIC_NUMBER.hex()
+        template_globals = environment.make_globals(None)
+        for key in self.metadata["templates"]:
+            if use_bytecode:
+                code = marshal.loads(self._members[f"templates/{key}.pyc"])  # nosec B302 - trusted bundle
+            else:
+                code = compile(self._members[f"templates/{key}.py"].decode("utf-8"), f"<template {key}>", "exec")
+            template = environment.template_class.from_code(environment, code, template_globals)
+            analysis = self.metadata.get("analysis", {}).get(key)
+            info = None
+            if analysis is not None:
+                variables = analysis["variables"]
+                info = (None if variables is None else frozenset(variables), analysis["non_deterministic"])
+            RENDER_MEMO.register(environment, self._source(key), template, info)
+
+    def _static_path(self, key: str) -> Path:
+        if self._static_dir is None:
+            self._static_dir = Path(tempfile.mkdtemp(prefix="nskit-bundle-"))
+        path = self._static_dir / key
+        if not path.exists():
+            path.write_bytes(self._members[f"static/{key}"])
+        return path
+
+    def _value(self, value: Any) -> Any:
+        if not isinstance(value, dict):
+            return value
+        if "template" in value:
+            return self._source(value["template"])
+        if "static" in value:
+            return self._static_path(value["static"])
+        if "bytes" in value:
+            return base64.b64decode(value["bytes"])
+        if "callable" in value:
+            return _resolve(value["callable"])
+        raise BundleError(f"Unknown bundle value {value!r}")
+
+    def _node(self, node: dict[str, Any]) -> FileSystemObject:
+        klass = _resolve(node["class"])
+        values = {field_name: self._value(value) for field_name, value in node["fields"].items()}
+        name = node["fields"].get("name")
+        if isinstance(name, dict) and "template" in name:
+            values["name"] = TemplateStr(values["name"])
+        if "contents" in node:
+            values["contents"] = [self._node(child) for child in node["contents"]]
+        # The tree was validated when bundled, so skip re-validation (which would also re-infer resources)
+        return klass.model_construct(**values)
+
+    def contents(self) -> list[File | Folder]:
+        """Build the recipe contents from the bundle."""
+        return [self._node(node) for node in self.metadata["tree"]]
+
+    def recipe(self, **kwargs) -> Recipe:
+        """Initialise the recipe with the bundled contents."""
+        recipe = self.recipe_class(contents=self.contents(), **kwargs)
+        recipe.extension_name = self.name
+        return recipe
+
+    def cleanup(self):
+        """Remove any extracted static files."""
+        if self._static_dir is not None:
+            shutil.rmtree(self._static_dir, ignore_errors=True)
+            self._static_dir = None
+
+    def __enter__(self) -> RecipeBundle:
+        """Use the bundle, cleaning up on exit."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Remove any extracted static files."""
+        self.cleanup()
+
+
+def load_bundle(path: str | Path) -> RecipeBundle:
+    """Load a recipe bundle."""
+    return RecipeBundle(path)
@@ -4,9 +4,10 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional
 
-import yaml
 from pydantic import BaseModel, Field
 
+from nskit.common.io import yaml
+
 
 class ConfigNotFoundError(Exception):
     """Raised when a configuration file is not found."""
@@ -70,7 +71,7 @@ class RecipeConfig(BaseModel):
             data = self.model_dump(mode="json")
 
             with open(file_path, "w", encoding="utf-8") as f:
-                yaml.safe_dump(data, f, default_flow_style=False, sort_keys=False, indent=2)
+                yaml.safe_dump(data, f, indent=2)
 
         except OSError as e:
             raise FileSystemError(f"Error writing configuration file {file_path}: {e}") from None
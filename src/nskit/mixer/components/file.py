@@ -1,23 +1,51 @@
 """File component."""
 
+import filecmp
 from pathlib import Path
 from typing import Any, Callable, Optional, Union
 
-from pydantic import Field
+from pydantic import Field, model_validator
 
-from nskit.mixer.components.filesystem_object import FileSystemObject
-from nskit.mixer.utilities import JINJA_ENVIRONMENT_FACTORY, Resource
+from nskit.mixer.components.filesystem_object import FileSystemObject, PathSelector
+from nskit.mixer.utilities import (
+    IORequest,
+    Resource,
+    StaticSource,
+    copy_static,
+    render_template,
+    template_variables,
+)
 
 
 class File(FileSystemObject):
     """File component."""
 
     content: Union[Resource, str, bytes, Path, Callable] = Field("", description="The file content")
+    static: bool = Field(
+        False,
+        description="Copy the content (a Path or Resource) as-is, without templating or loading it into memory",
+    )
+
+    @model_validator(mode="after")
+    def _validate_static_content(self):
+        if self.static and not isinstance(self.content, (Resource, Path)):
+            raise ValueError("Static files need Path or Resource content.")
+        return self
+
+    def _static_source(self):
+        """Get a context manager for the filesystem path of static content."""
+        return StaticSource(self.content).as_file()
 
     def render_content(self, context: dict[str, Any]):  # pylint: disable=arguments-differ
-        """Return the rendered content using the context and the Jinja environment."""
+        """Return the rendered content using the context and the Jinja environment.
+
+        Static content is returned as bytes, without templating.
+        """
         if context is None:
             context = {}
+        if self.static:
+            with self._static_source() as source:
+                return Path(source).read_bytes()
         if isinstance(self.content, Resource):
             content = self.content.load()
         elif isinstance(self.content, Path):
@@ -29,27 +57,113 @@ class File(FileSystemObject):
             content = self.content
         if isinstance(content, str):
             # If it is a string, we render the content
-            content = JINJA_ENVIRONMENT_FACTORY.environment.from_string(content).render(**context)
+            content = render_template(content, context)
         return content
 
-    def write(self, base_path: Path, context: dict[str, Any], override_path: Optional[Path] = None):
-        """Write the rendered content to the appropriate path within the ``base_path``."""
+    def template_variables(self) -> Optional[frozenset[str]]:
+        """Get the context keys the rendered name and content depend on.
+
+        Returns ``None`` if they can't be determined statically (e.g. the content is a callable).
+        """
+        name_variables = super().template_variables()
+        if name_variables is None:
+            return None
+        if self.static or isinstance(self.content, bytes):
+            return name_variables
+        if isinstance(self.content, Resource):
+            source = self.content.load()
+        elif isinstance(self.content, Path):
+            with open(self.content) as f:
+                source = f.read()
+        elif isinstance(self.content, str):
+            source = self.content
+        else:
+            return None
+        content_variables = template_variables(source)
+        if content_variables is None:
+            return None
+        return name_variables | content_variables
+
+    def dependencies(
+        self, base_path: Path, context: dict[str, Any], override_path: Optional[Path] = None
+    ) -> dict[Path, Optional[frozenset[str]]]:
+        """Get the context keys the output path depends on (``None`` if unknown)."""
+        if not self.is_included(context):
+            return {}
+        path = self.get_path(base_path, context, override_path)
+        if path is None:
+            return {}
+        return {path: self.template_variables()}
+
+    def io_requests(
+        self,
+        base_path: Path,
+        context: dict[str, Any],
+        override_path: Optional[Path] = None,
+        *,
+        selector: Optional[PathSelector] = None,
+    ) -> list[IORequest]:
+        """Get the ``io_bound`` calls the content callable declares for the context (see ``io_requests``)."""
+        requests = getattr(self.content, "io_requests", None)
+        if requests is None or self.static or not self.is_included(context):
+            return []
+        if selector is not None and not selector.includes_file(self.get_path(base_path, context, override_path)):
+            return []
+        return list(requests(context))
+
+    def write(
+        self,
+        base_path: Path,
+        context: dict[str, Any],
+        override_path: Optional[Path] = None,
+        *,
+        selector: Optional[PathSelector] = None,
+    ):
+        """Write the rendered content to the appropriate path within the ``base_path``.
+
+        Static content is copied directly and the returned value is a ``StaticSource`` for the source.
+        """
+        if not self.is_included(context):
+            return {}
         file_path = self.get_path(base_path, context, override_path)
+        if selector is not None and not selector.includes_file(file_path):
+            return {}
+        if self.static:
+            with self._static_source() as source:
+                copy_static(source, file_path)
+            return {file_path: StaticSource(self.content)}
         content = self.render_content(context)
         response = {}
         if content is not None:
             if isinstance(content, str):
-                open_str = "w"
+                # Write the rendered text as is, so the file matches the rendered value on every platform
+                open_str, open_kwargs = "w", {"encoding": "utf-8", "newline": ""}
             elif isinstance(content, bytes):
-                open_str = "wb"
-            with file_path.open(open_str) as output_file:
+                open_str, open_kwargs = "wb", {}
+            with file_path.open(open_str, **open_kwargs) as output_file:
                 output_file.write(content)
             response[file_path] = content
         return response
 
-    def dryrun(self, base_path: Path, context: dict[str, Any], override_path: Optional[Path] = None):
-        """Preview the file contents using the context."""
+    def dryrun(
+        self,
+        base_path: Path,
+        context: dict[str, Any],
+        override_path: Optional[Path] = None,
+        *,
+        selector: Optional[PathSelector] = None,
+    ):
+        """Preview the file contents using the context.
+
+        Static content is not loaded, the preview value is a ``StaticSource`` for the source.
+        """
+        if not self.is_included(context):
+            return {}
         file_path = self.get_path(base_path, context, override_path)
+        if selector is not None and not selector.includes_file(file_path):
+            return {}
+        if self.static:
+            return {file_path: StaticSource(self.content)}
         content = self.render_content(context)
         result = {}
         if content is not None:
@@ -61,17 +175,29 @@ class File(FileSystemObject):
         missing = []
         errors = []
         ok = []
+        if not self.is_included(context):
+            return missing, errors, ok
         path = self.get_path(base_path, context, override_path)
+        if self.static:
+            if not path.exists():
+                missing.append(path)
+            else:
+                with self._static_source() as source:
+                    if filecmp.cmp(source, path, shallow=False):
+                        ok.append(path)
+                    else:
+                        errors.append(path)
+            return missing, errors, ok
         content = self.render_content(context)
         if content is not None:
             if not path.exists():
                 missing.append(path)
             else:
                 if isinstance(content, bytes):
-                    read_str = "rb"
+                    read_str, read_kwargs = "rb", {}
                 else:
-                    read_str = "r"
-                with open(path, read_str) as f:
+                    read_str, read_kwargs = "r", {"encoding": "utf-8", "newline": ""}
+                with open(path, read_str, **read_kwargs) as f:
                     if f.read() != self.render_content(context):
                         errors.append(path)
                     else:
@@ -1,14 +1,23 @@
 """Base Filesystem object and template string."""
 
 from abc import ABC, abstractmethod
-from pathlib import Path
+from collections.abc import Iterable
+from fnmatch import fnmatchcase
+from pathlib import Path, PurePath, PurePosixPath
 from typing import Any, Callable, Optional, Union
 
-from pydantic import Field, GetCoreSchemaHandler
+from jinja2 import UndefinedError
+from pydantic import BaseModel, Field, GetCoreSchemaHandler
 from pydantic_core import CoreSchema, core_schema
 
 from nskit.common.configuration import BaseConfiguration
-from nskit.mixer.utilities import JINJA_ENVIRONMENT_FACTORY
+from nskit.mixer.utilities import (
+    IORequest,
+    evaluate_expression,
+    expression_variables,
+    render_template,
+    template_variables,
+)
 
 
 class TemplateStr(str):
@@ -34,11 +43,92 @@ class TemplateStr(str):
         """Render the template."""
         if context is None:
             context = {}
-        return JINJA_ENVIRONMENT_FACTORY.environment.from_string(self).render(context)
+        return render_template(self, context)
+
+    def template_variables(self) -> Optional[frozenset[str]]:
+        """Get the context keys the template depends on."""
+        return template_variables(self)
+
+
+_GLOB_CHARACTERS = frozenset("*?[")
+
+
+def _match_parts(parts: tuple[str, ...], pattern: tuple[str, ...], prefix: bool = False) -> bool:
+    """Match path segments against glob pattern segments.
+
+    With ``prefix``, check if the path could be a folder containing a match instead.
+    """
+    if not pattern:
+        return not parts
+    if pattern[0] == "**":
+        if prefix:
+            # Any folder could contain a match
+            return True
+        return any(_match_parts(parts[index:], pattern[1:]) for index in range(len(parts) + 1))
+    if not parts:
+        return prefix
+    return fnmatchcase(parts[0], pattern[0]) and _match_parts(parts[1:], pattern[1:], prefix=prefix)
+
+
+class PathSelector:
+    """Select a subset of the files in a rendered tree.
+
+    Paths are relative to the ``root`` (usually the recipe folder). String paths can be glob patterns
+    (``*``, ``?`` and ``[...]`` match within a path segment, ``**`` matches any number of segments), while
+    ``PurePath`` instances are always matched literally. A literal folder path selects everything under it.
+    Other folders are only included if they contain (or could contain) a selected path, so unselected subtrees
+    can be skipped entirely. The root folder itself is always included.
+    """
+
+    def __init__(self, root: Path, paths: Iterable[Union[str, PurePath]]):
+        """Initialise the selector."""
+        self.root = Path(root)
+        literals = set()
+        patterns = set()
+        for path in paths:
+            if isinstance(path, str) and _GLOB_CHARACTERS.intersection(path):
+                patterns.add(tuple(PurePosixPath(PurePath(path).as_posix()).parts))
+            literals.add(PurePath(path).as_posix())
+        self.paths = frozenset(literals)
+        self.patterns = frozenset(patterns)
+        self._folders = frozenset(parent.as_posix() for path in self.paths for parent in PurePosixPath(path).parents)
+
+    def _relative(self, path: Path) -> Optional[str]:
+        try:
+            return Path(path).relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+
+    def _in_selected_folder(self, relative: str) -> bool:
+        return any(parent.as_posix() in self.paths for parent in PurePosixPath(relative).parents)
+
+    def includes_file(self, path: Path) -> bool:
+        """Check if a file path is selected."""
+        relative = self._relative(path)
+        if relative is None:
+            return False
+        if relative in self.paths or self._in_selected_folder(relative):
+            return True
+        parts = PurePosixPath(relative).parts
+        return any(_match_parts(parts, pattern) for pattern in self.patterns)
+
+    def includes_folder(self, path: Path) -> bool:
+        """Check if a folder path is, is in, or contains, a selected path."""
+        relative = self._relative(path)
+        if relative is None:
+            return False
+        if relative == "." or relative in self._folders or relative in self.paths or self._in_selected_folder(relative):
+            return True
+        parts = PurePosixPath(relative).parts
+        return any(_match_parts(parts, pattern, prefix=True) for pattern in self.patterns)
 
 
 class FileSystemObject(ABC, BaseConfiguration):
-    """Abstract pydantic model that acts as the base for filesystem objects."""
+    """Abstract pydantic model that acts as the base for filesystem objects.
+
+    Tree nodes are initialised as plain models, without loading the settings sources (environment variables,
+    dotenv and config files), which recipes still use for their inputs.
+    """
 
     id_: Optional[Union[int, str]] = Field(
         None, description="An Id to refer to the object when e.g. the name is a template string or callable"
@@ -48,6 +138,28 @@ class FileSystemObject(ABC, BaseConfiguration):
         validate_default=True,
         description="The name of the filesystem object, can be  a string, TemplateStr or callable (which returns a string)",
     )
+    when: Optional[Union[str, Callable]] = Field(
+        None,
+        description="A condition for including the object (and its contents), either a Jinja expression or a callable taking the context",
+    )
+
+    def __init__(self, **data: Any):
+        """Initialise the object (skipping the settings sources)."""
+        BaseModel.__init__(self, **data)
+
+    def is_included(self, context: Optional[dict[str, Any]] = None) -> bool:
+        """Evaluate the ``when`` condition against the context."""
+        if self.when is None:
+            return True
+        if context is None:
+            context = {}
+        if isinstance(self.when, str):
+            try:
+                return bool(evaluate_expression(self.when, context))
+            except UndefinedError:
+                # e.g. an attribute of a missing context value
+                return False
+        return bool(self.when(context))
 
     def render_name(self, context: Optional[dict[str, Union[str, int]]] = None):
         """Render the name if it is a template string or callable."""
@@ -62,6 +174,49 @@ class FileSystemObject(ABC, BaseConfiguration):
             rendered_name = self.name
         return rendered_name
 
+    def template_variables(self) -> Optional[frozenset[str]]:
+        """Get the context keys the rendered name and ``when`` condition depend on.
+
+        Returns ``None`` if they can't be determined statically (e.g. the name is a callable).
+        """
+        if self.when is None:
+            when_variables = frozenset()
+        elif isinstance(self.when, str):
+            when_variables = expression_variables(self.when)
+        else:
+            return None
+        if isinstance(self.name, TemplateStr):
+            name_variables = self.name.template_variables()
+        elif self.name is None or isinstance(self.name, str):
+            name_variables = frozenset()
+        else:
+            return None
+        if when_variables is None or name_variables is None:
+            return None
+        return name_variables | when_variables
+
+    def dependencies(
+        self, base_path: Path, context: dict[str, Any], override_path: Optional[Path] = None
+    ) -> dict[Path, Optional[frozenset[str]]]:
+        """Get the context keys each output path depends on (``None`` if unknown)."""
+        if not self.is_included(context):
+            return {}
+        path = self.get_path(base_path, context, override_path)
+        if path is None:
+            return {}
+        return {path: None}
+
+    def io_requests(
+        self,
+        base_path: Path,  # noqa: U100
+        context: dict[str, Any],  # noqa: U100
+        override_path: Optional[Path] = None,  # noqa: U100
+        *,
+        selector: Optional[PathSelector] = None,  # noqa: U100
+    ) -> list[IORequest]:
+        """Get the ``io_bound`` calls to resolve before rendering (none by default)."""
+        return []
+
     def _repr(self, context=None, **kwargs):  # noqa: U100
         if isinstance(self.name, TemplateStr):
             name_value = self.name
@@ -5,8 +5,13 @@ from typing import Any, Optional, Union
 
 from pydantic import Field, field_validator
 
+from nskit._logging import logger_factory
+from nskit.mixer.utilities import IORequest
+
 from .file import File
-from .filesystem_object import FileSystemObject
+from .filesystem_object import FileSystemObject, PathSelector
+
+logger = logger_factory.get_logger(__name__)
 
 
 class Folder(FileSystemObject):
@@ -14,29 +19,104 @@ class Folder(FileSystemObject):
 
     contents: list[Union[File, "Folder"]] = Field(default_factory=list, description="The folder contents")
 
-    def write(self, base_path: Path, context: dict[str, Any], override_path: Optional[Path] = None):
-        """Write the rendered content to the appropriate path within the ``base_path``."""
+    def write(
+        self,
+        base_path: Path,
+        context: dict[str, Any],
+        override_path: Optional[Path] = None,
+        *,
+        selector: Optional[PathSelector] = None,
+    ):
+        """Write the rendered content to the appropriate path within the ``base_path``.
+
+        If a ``selector`` is provided, only the selected files (and the folders containing them) are written.
+        """
+        if not self.is_included(context):
+            return {}
         folder_path = self.get_path(base_path, context, override_path)
+        if selector is not None and not selector.includes_folder(folder_path):
+            return {}
+        logger.debug("Writing folder", path=str(folder_path))
         folder_path.mkdir(exist_ok=True, parents=True)
         contents_dict = {}
         for obj in self.contents:
-            contents_dict.update(obj.write(folder_path, context))
+            contents_dict.update(obj.write(folder_path, context, **self._selector_kwargs(selector)))
         return {folder_path: contents_dict}
 
-    def dryrun(self, base_path: Path, context: dict[str, Any], override_path: Optional[Path] = None):
+    def dryrun(
+        self,
+        base_path: Path,
+        context: dict[str, Any],
+        override_path: Optional[Path] = None,
+        *,
+        selector: Optional[PathSelector] = None,
+    ):
         """Preview the file contents using the context."""
+        if not self.is_included(context):
+            return {}
         folder_path = self.get_path(base_path, context, override_path)
+        if selector is not None and not selector.includes_folder(folder_path):
+            return {}
         contents_dict = {}
         for u in self.contents:
-            contents_dict.update(u.dryrun(folder_path, context))
+            contents_dict.update(u.dryrun(folder_path, context, **self._selector_kwargs(selector)))
         result = {folder_path: contents_dict}
         return result
 
+    def io_requests(
+        self,
+        base_path: Path,
+        context: dict[str, Any],
+        override_path: Optional[Path] = None,
+        *,
+        selector: Optional[PathSelector] = None,
+    ) -> list[IORequest]:
+        """Get the ``io_bound`` calls the file contents declare for the context."""
+        if not self.is_included(context):
+            return []
+        folder_path = self.get_path(base_path, context, override_path)
+        if selector is not None and not selector.includes_folder(folder_path):
+            return []
+        requests = []
+        for obj in self.contents:
+            requests += obj.io_requests(folder_path, context, **self._selector_kwargs(selector))
+        return requests
+
+    @staticmethod
+    def _selector_kwargs(selector: Optional[PathSelector]):
+        # Only pass the selector on when set, so custom components without selector support still work
+        if selector is None:
+            return {}
+        return {"selector": selector}
+
+    def dependencies(
+        self, base_path: Path, context: dict[str, Any], override_path: Optional[Path] = None
+    ) -> dict[Path, Optional[frozenset[str]]]:
+        """Get the context keys each file in the folder depends on (``None`` if unknown).
+
+        The folder name and ``when`` dependencies are included for every file in it, as they change the file path
+        or whether it is written.
+        """
+        if not self.is_included(context):
+            return {}
+        folder_path = self.get_path(base_path, context, override_path)
+        name_variables = self.template_variables()
+        dependencies = {}
+        for obj in self.contents:
+            for path, variables in obj.dependencies(folder_path, context).items():
+                if variables is None or name_variables is None:
+                    dependencies[path] = None
+                else:
+                    dependencies[path] = variables | name_variables
+        return dependencies
+
     def validate(self, base_path: Path, context: dict[str, Any], override_path: Optional[Path] = None):
         """Validate the output against expected."""
         missing = []
         errors = []
         ok = []
+        if not self.is_included(context):
+            return missing, errors, ok
         path = self.get_path(base_path, context, override_path)
         if not path.exists():
             missing.append(path)
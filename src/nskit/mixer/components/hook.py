@@ -28,8 +28,10 @@ class Hook(ABC, BaseModel):
             recipe_path: Path where the recipe will be (pre) or was (post) written.
             context: Template rendering context (all recipe fields + properties).
             **kwargs: Additional keyword arguments. Currently passes ``recipe``
-                (the Recipe instance) when called from ``Recipe.create()``.
-                Hooks that don't need the recipe can ignore it via **kwargs.
+                (the Recipe instance) when called from ``Recipe.create()``, and
+                ``rendered`` (the written ``{recipe_path: contents}`` tree, static files map to a
+                ``StaticSource``) to post-hooks.
+                Hooks that don't need them can ignore them via **kwargs.
 
         Returns:
             None to keep path/context unchanged, or ``(recipe_path, context)`` tuple.
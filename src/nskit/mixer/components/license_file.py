@@ -1,5 +1,6 @@
 """License file handler."""
 
+import importlib.util
 import sys
 from datetime import date
 from enum import Enum
@@ -7,16 +8,13 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable, Optional, Union
 
-try:
-    from ghapi.all import GhApi
-except ImportError:
-    GhApi = None
 from pydantic import Field
 
 from nskit.common.ghapi_compat import sync_ghapi
+from nskit.common.instrumentation import span
 from nskit.mixer.components.file import File
 from nskit.mixer.components.filesystem_object import TemplateStr
-from nskit.mixer.utilities import Resource
+from nskit.mixer.utilities import Resource, io_bound, io_requests
 
 
 class LicenseOptionsEnum(Enum):
@@ -96,15 +94,24 @@ def get_license_filename(context: Optional[dict[str, Any]] = None):
         return name
 
 
+@io_bound
 @lru_cache
 def _get_license_content(license: LicenseOptionsEnum):
     # Cache results as a static method to make testing etc. better on rates/rate limiting
-    if GhApi is None:
+    # ghapi is only imported (by sync_ghapi) when a license is fetched
+    if importlib.util.find_spec("ghapi") is None:
         raise ImportError("License file support requires ghapi. Install with: pip install nskit[github]")
-    license_content = sync_ghapi().licenses.get(license.value)
+    with span("nskit.github.get_license", license=license.value):
+        license_content = sync_ghapi().licenses.get(license.value)
     return license_content
 
 
+def _license_requests(context: dict[str, Any]):
+    if LicenseOptionsEnum.contains(context.get("license", None)):
+        yield _get_license_content, (LicenseOptionsEnum(context.get("license", None)),)
+
+
+@io_requests(_license_requests)
 def get_license_content(context: dict[str, Any]):
     """Render the content of the license."""
     # We implement some specifics based on the implementation instructions in Github licenses api get
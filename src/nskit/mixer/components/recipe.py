@@ -3,18 +3,24 @@
 import datetime as dt
 import inspect
 import sys
-from pathlib import Path
-from typing import Any, ClassVar, Optional
+from collections.abc import Iterable
+from pathlib import Path, PurePath
+from typing import Any, ClassVar, Optional, Union
 
 from pydantic import BaseModel, Field
 from pydantic.fields import FieldInfo
+from pydantic_settings import BaseSettings
 
 from nskit import __version__
+from nskit.common.configuration import memoised_property
 from nskit.common.extensions import get_extension_names, load_extension
+from nskit.common.instrumentation import span, traced
 from nskit.common.io import yaml
 from nskit.constants import RECIPE_ENTRYPOINT
+from nskit.mixer.components.filesystem_object import PathSelector
 from nskit.mixer.components.folder import Folder
 from nskit.mixer.components.hook import Hook
+from nskit.mixer.utilities import prefetch, prefetched
 
 
 def RecipeField(
@@ -91,6 +97,10 @@ def RecipeField(
     )
 
 
+def _hook_name(hook: Any) -> str:
+    return getattr(hook, "__qualname__", type(hook).__qualname__)
+
+
 class Recipe(Folder):
     """The base Recipe object.
 
@@ -117,7 +127,10 @@ class Recipe(Folder):
     config_dir: ClassVar[str] = ".recipe"
     config_filename: ClassVar[str] = "config.yml"
 
-    @property
+    # Unlike the other tree nodes, recipe inputs can come from the environment, dotenv and config files
+    __init__ = BaseSettings.__init__
+
+    @memoised_property(depends_on=("extension_name", "version"))
     def recipe(self):
         """Recipe context."""
         extension_name = self.extension_name
@@ -129,11 +142,25 @@ class Recipe(Folder):
             "extension_name": extension_name,
         }
 
-    def create(self, base_path: Optional[Path] = None, override_path: Optional[Path] = None, **additional_context):
+    @traced("nskit.recipe.create")
+    def create(
+        self,
+        base_path: Optional[Path] = None,
+        override_path: Optional[Path] = None,
+        *,
+        paths: Optional[Iterable[Union[str, PurePath]]] = None,
+        **additional_context,
+    ):
         """Create the recipe.
 
         Use the configured parameters and any additional context as kwargs to create the recipe at the
         base path (or current directory if not provided).
+
+        If ``paths`` (relative to the recipe folder, strings can be glob patterns) are provided, only the
+        matching files are written, the hooks are still run (even if no files match).
+
+        If the recipe's ``when`` condition is false nothing is written, the post hooks aren't run and ``{}``
+        is returned.
         """
         if base_path is None:
             base_path = Path.cwd()
@@ -143,14 +170,80 @@ class Recipe(Folder):
         context.update(additional_context)
         recipe_path = self.get_path(base_path, context, override_path=override_path)
         for hook in self.pre_hooks:
-            recipe_path, context = hook(recipe_path, context, recipe=self)
-        content = self.write(recipe_path.parent, context, override_path=recipe_path.name)
+            with span("nskit.recipe.hook", hook=_hook_name(hook), stage="pre"):
+                recipe_path, context = hook(recipe_path, context, recipe=self)
+        if not self.is_included(context):
+            return {}
+        selector = None if paths is None else PathSelector(recipe_path, paths)
+        with self._prefetch(recipe_path.parent, context, override_path=recipe_path.name, selector=selector):
+            content = self.write(
+                recipe_path.parent, context, override_path=recipe_path.name, **self._selector_kwargs(selector)
+            )
         recipe_path = next(iter(content.keys()))
         for hook in self.post_hooks:
-            recipe_path, context = hook(recipe_path, context, recipe=self)
+            with span("nskit.recipe.hook", hook=_hook_name(hook), stage="post"):
+                if isinstance(hook, Hook):
+                    # Hooks only receive the rendered content if their call accepts it
+                    recipe_path, context = hook(recipe_path, context, recipe=self, rendered=content)
+                else:
+                    recipe_path, context = hook(recipe_path, context, recipe=self)
         self._write_batch(Path(recipe_path))
         return {Path(recipe_path): next(iter(content.values()))}
 
+    def affected_paths(
+        self,
+        changed: Iterable[str],
+        base_path: Optional[Path] = None,
+        override_path: Optional[Path] = None,
+        **additional_context,
+    ) -> set[Path]:
+        """Get the output file paths that depend on any of the changed context keys.
+
+        Files whose dependencies can't be determined statically (e.g. callable content) are always included.
+        """
+        if base_path is None:
+            base_path = Path.cwd()
+        context = self.context
+        context.update(additional_context)
+        changed = set(changed)
+        dependencies = self.dependencies(Path(base_path), context, override_path=override_path)
+        return {path for path, variables in dependencies.items() if variables is None or variables & changed}
+
+    def rerender(
+        self,
+        changed: Iterable[str],
+        base_path: Optional[Path] = None,
+        override_path: Optional[Path] = None,
+        **additional_context,
+    ):
+        """Re-write only the files affected by the changed context keys.
+
+        This is for refreshing an already created recipe, so no hooks are run and the batch file is not updated.
+        Files that are no longer produced (e.g. because a templated name changed) are not removed.
+        """
+        if base_path is None:
+            base_path = Path.cwd()
+        else:
+            base_path = Path(base_path)
+        context = self.context
+        context.update(additional_context)
+        recipe_path = self.get_path(base_path, context, override_path=override_path)
+        affected = self.affected_paths(changed, base_path=base_path, override_path=override_path, **additional_context)
+        selector = PathSelector(recipe_path, [path.relative_to(recipe_path) for path in affected])
+        with self._prefetch(recipe_path.parent, context, override_path=recipe_path.name, selector=selector):
+            return self.write(recipe_path.parent, context, override_path=recipe_path.name, selector=selector)
+
+    def _prefetch(
+        self,
+        base_path: Path,
+        context: dict[str, Any],
+        override_path: Optional[Path] = None,
+        selector: Optional[PathSelector] = None,
+    ):
+        """Resolve the ``io_bound`` content calls concurrently (and once each) ahead of rendering."""
+        requests = self.io_requests(base_path, context, override_path, **self._selector_kwargs(selector))
+        return prefetched(prefetch(requests))
+
     def _write_batch(self, folder_path: Path):
         """Write out the parameters used.
 
@@ -206,9 +299,11 @@ class Recipe(Folder):
                 "recipe_batch",
                 "recipe",
                 "extension_name",
+                "when",
             },
         )
-        context.update({"recipe": self.recipe})
+        # Copied, as the cached value is shared
+        context.update({"recipe": dict(self.recipe)})
         return context
 
     def __repr__(self):
@@ -216,13 +311,37 @@ class Recipe(Folder):
         context = self.context
         return f"{self._repr(context=context)}\n\nContext: {context}"
 
-    def dryrun(self, base_path: Optional[Path] = None, override_path: Optional[Path] = None, **additional_context):
-        """See the recipe as a dry run."""
+    def dryrun(
+        self,
+        base_path: Optional[Path] = None,
+        override_path: Optional[Path] = None,
+        *,
+        selector: Optional[PathSelector] = None,
+        paths: Optional[Iterable[Union[str, PurePath]]] = None,
+        **additional_context,
+    ):
+        """See the recipe as a dry run.
+
+        If a ``selector``, or ``paths`` (relative to the recipe folder, strings can be glob patterns), are
+        provided, only the selected files are rendered. Unselected folders are skipped without rendering
+        their contents.
+        """
         combined_context = self.context
         combined_context.update(additional_context)
         if base_path is None:
             base_path = Path.cwd()
-        return super().dryrun(base_path=base_path, context=combined_context, override_path=override_path)
+        if paths is not None:
+            if selector is not None:
+                raise ValueError("Only one of selector and paths can be provided")
+            recipe_path = self.get_path(Path(base_path), combined_context, override_path=override_path)
+            selector = PathSelector(recipe_path, paths)
+        with self._prefetch(Path(base_path), combined_context, override_path=override_path, selector=selector):
+            return super().dryrun(
+                base_path=base_path,
+                context=combined_context,
+                override_path=override_path,
+                **self._selector_kwargs(selector),
+            )
 
     def validate(self, base_path: Optional[Path] = None, override_path: Optional[Path] = None, **additional_context):
         """Validate the created repo."""
@@ -1,3 +1,11 @@
 """Common hooks."""
 
-from nskit.mixer.hooks import git, pre_commit  # noqa: F401
+# The hook modules are imported on first access (PEP 562)
+from nskit.common.lazy import LazyAttributes
+
+_lazy = LazyAttributes(__name__)
+__getattr__ = _lazy.__getattr__
+__dir__ = _lazy.__dir__
+
+_lazy.submodule("git")
+_lazy.submodule("pre_commit")
@@ -1,14 +1,19 @@
 """Git hooks."""
 
+import stat
 import subprocess  # nosec: B404
+import time
+from collections.abc import Iterable, Iterator
+from itertools import chain
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional, Union
 
 from packaging.version import parse
 
 from nskit._logging import logger_factory
-from nskit.common.contextmanagers import ChDir
+from nskit.common import process
 from nskit.mixer.components import Hook
+from nskit.mixer.utilities import StaticSource
 
 logger = logger_factory.get(__name__)
 
@@ -18,26 +23,135 @@ class GitInit(Hook):
 
     def call(self, recipe_path: Path, context: dict[str, Any]):
         """(re)initialise the repo."""
-        with ChDir(recipe_path):
-            logger.info("Initialising git repo")
+        logger.info("Initialising git repo")
+        try:
+            initial_branch_name = process.check_output(
+                ["git", "config", "--get", "init.defaultBranch"], cwd=recipe_path
+            ).decode()
+        except subprocess.CalledProcessError:
+            initial_branch_name = None
+        if not initial_branch_name:
+            initial_branch_name = "main"
+        initial_branch_name = context.get("git", {}).get("initial_branch_name", initial_branch_name)
+        # Validate branch name to prevent argument injection
+        initial_branch_name = initial_branch_name.strip()
+        if not initial_branch_name or initial_branch_name.startswith("-"):
+            initial_branch_name = "main"
+        # Check git version - new versions have --initial-branch arg on init
+        version = process.cached_output(["git", "version"]).decode()
+        version = version.replace("git version", "").lstrip()
+        semver = parse(".".join(version.split(" ")[0].split(".")[:3]))
+        if semver >= parse("2.28.0"):
+            process.check_call(["git", "init", "--initial-branch", initial_branch_name], cwd=recipe_path)
+        else:
+            process.check_call(["git", "init"], cwd=recipe_path)
+            process.check_call(["git", "checkout", "-B", initial_branch_name], cwd=recipe_path)
+        logger.info("Done")
+
+
+def _rendered_files(rendered: dict) -> Iterator[tuple[Path, Any]]:
+    """Iterate over the (path, value) pairs of the files in a ``write``/``create`` tree."""
+    pending = [rendered]
+    while pending:
+        for path, value in pending.pop().items():
+            if isinstance(value, dict):
+                pending.append(value)
+            elif value is not None:
+                yield Path(path), value
+
+
+def _quote_path(path: str) -> str:
+    """Quote a path for git fast-import if needed."""
+    if "\n" in path or path.startswith('"'):
+        return '"' + path.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+    return path
+
+
+class GitInitialCommit(Hook):
+    """Git Hook to create the initial commit from the rendered files using ``git fast-import``.
+
+    The rendered content is streamed to git in a single process, rather than ``git add`` re-reading and
+    hashing the working tree. Use it after ``GitInit``, only the files rendered by the recipe are committed
+    (files created by other hooks, or the recipe batch file, are left for a later commit) unless
+    ``include_untracked`` is set, in which case the other untracked (and not ignored) files are read from disk
+    and committed too.
+    """
+
+    message: str = "Initial commit from recipe"
+    author_name: str = "nskit"
+    author_email: str = "nskit@noreply"
+    include_untracked: bool = False
+
+    def call(self, recipe_path: Path, context: dict[str, Any], rendered: Optional[dict] = None):  # noqa: U100
+        """Commit the rendered files."""
+        recipe_path = Path(recipe_path)
+        git_dir = recipe_path / ".git"
+        if not git_dir.is_dir():
+            logger.warning(f"{recipe_path} is not a git repo, skipping the initial commit")
+            return
+        if not rendered:
+            logger.warning("No rendered files provided, skipping the initial commit")
+            return
+        head = (git_dir / "HEAD").read_text().strip()
+        ref = head.removeprefix("ref:").strip() if head.startswith("ref:") else "refs/heads/main"
+        if (git_dir / ref).exists():
+            logger.info(f"{ref} already has commits, skipping the initial commit")
+            return
+        logger.info("Creating initial commit")
+        root, contents = next(iter(rendered.items()))
+        root = Path(root)
+        others = self._others(recipe_path, root, contents) if self.include_untracked else []
+        with process.popen(
+            ["git", "fast-import", "--quiet", "--done"],
+            cwd=recipe_path,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        ) as fast_import:
             try:
-                initial_branch_name = subprocess.check_output(["git", "config", "--get", "init.defaultBranch"]).decode()  # nosec B607, B603
-            except subprocess.CalledProcessError:
-                initial_branch_name = None
-            if not initial_branch_name:
-                initial_branch_name = "main"
-            initial_branch_name = context.get("git", {}).get("initial_branch_name", initial_branch_name)
-            # Validate branch name to prevent argument injection
-            initial_branch_name = initial_branch_name.strip()
-            if not initial_branch_name or initial_branch_name.startswith("-"):
-                initial_branch_name = "main"
-            # Check git version - new versions have --initial-branch arg on init
-            version = subprocess.check_output(["git", "version"]).decode()  # nosec B607, B603
-            version = version.replace("git version", "").lstrip()
-            semver = parse(".".join(version.split(" ")[0].split(".")[:3]))
-            if semver >= parse("2.28.0"):
-                subprocess.check_call(["git", "init", "--initial-branch", initial_branch_name])  # nosec B607, B603
-            else:
-                subprocess.check_call(["git", "init"])  # nosec B607, B603
-                subprocess.check_call(["git", "checkout", "-B", initial_branch_name])  # nosec B607, B603
-            logger.info("Done")
+                self._stream(fast_import.stdin, ref, root, contents, others)
+            finally:
+                fast_import.stdin.close()
+            stderr = fast_import.stderr.read()
+        if fast_import.returncode:
+            raise subprocess.CalledProcessError(fast_import.returncode, fast_import.args, stderr=stderr)
+        # Populate the index, so the working tree shows as clean
+        process.check_call(["git", "read-tree", ref], cwd=recipe_path)
+        process.call(["git", "update-index", "-q", "--refresh"], cwd=recipe_path)
+        logger.info("Done")
+
+    @staticmethod
+    def _others(recipe_path: Path, root: Path, rendered: dict) -> list[Path]:
+        """Get the untracked (and not ignored) files that weren't rendered."""
+        output = process.check_output(["git", "ls-files", "-z", "--others", "--exclude-standard"], cwd=recipe_path)
+        names = {path.relative_to(root).as_posix() for path, _ in _rendered_files(rendered)}
+        return [root / name for name in output.decode().split("\0") if name and name not in names]
+
+    def _stream(self, stream, ref: str, root: Path, rendered: dict, others: Iterable[Path] = ()):
+        files = []
+        entries = chain(_rendered_files(rendered), ((path, StaticSource(path)) for path in others))
+        for mark, (path, value) in enumerate(entries, start=1):
+            data = self._content(path, value)
+            stream.write(b"blob\nmark :%d\ndata %d\n" % (mark, len(data)))
+            stream.write(data)
+            stream.write(b"\n")
+            mode = "100755" if path.stat().st_mode & stat.S_IXUSR else "100644"
+            files.append(f"M {mode} :{mark} {_quote_path(path.relative_to(root).as_posix())}\n")
+        timestamp = int(time.time())
+        ident = f"{self.author_name} <{self.author_email}> {timestamp} +0000"
+        message = self.message.encode()
+        stream.write(f"commit {ref}\nauthor {ident}\ncommitter {ident}\n".encode())
+        stream.write(b"data %d\n" % len(message) + message + b"\n")
+        stream.write("".join(files).encode())
+        stream.write(b"\ndone\n")
+
+    @staticmethod
+    def _content(path: Path, value: Union[str, bytes, StaticSource]) -> bytes:
+        if isinstance(value, str):
+            return value.encode()
+        if isinstance(value, bytes):
+            return value
+        if isinstance(value, StaticSource):
+            # Static files are copied without being loaded, so read them now
+            return value.read_bytes()
+        raise TypeError(f"Unexpected rendered value for {path}: {value!r}")
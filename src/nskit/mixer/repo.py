@@ -4,7 +4,7 @@ from typing import Callable, Optional
 
 from pydantic import EmailStr, Field, HttpUrl, field_validator
 
-from nskit.common.configuration import BaseConfiguration
+from nskit.common.configuration import BaseConfiguration, memoised_property
 from nskit.mixer import hooks
 from nskit.mixer.components import LicenseOptionsEnum, Recipe
 
@@ -15,7 +15,7 @@ class GitConfig(BaseConfiguration):
     initial_branch_name: str = "main"
     git_flow: bool = True
 
-    @property
+    @memoised_property(depends_on=("git_flow", "initial_branch_name"))
     def default_branch(self):
         """Get the default branch."""
         if self.git_flow:
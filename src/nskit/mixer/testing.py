@@ -20,20 +20,34 @@ Typical use in a downstream ``conftest``/test module::
 
 The harness never asserts on its own — it returns a :class:`RecipeCheckResult`
 so the caller decides which findings are fatal.
+
+For snapshot testing, :func:`check_manifest` compares a compact golden manifest
+(relative path → size and content hash) instead of whole rendered trees::
+
+    result = check_manifest(name, INPUTS[name], golden=GOLDEN_DIR / f"{name}.json", entrypoint=ENTRYPOINT)
+    assert result.ok, result.summary()
+
+Run with ``NSKIT_UPDATE_GOLDEN=1`` (or ``update=True``) to regenerate the goldens.
 """
 
 from __future__ import annotations
 
+import difflib
+import hashlib
+import os
+import tempfile
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any
 
 import jinja2
+import orjson
 
-from nskit.common.contextmanagers import ChDir
 from nskit.common.extensions import get_extension_names
+from nskit.common.io import json
 from nskit.mixer.components import File, Folder, Recipe
 from nskit.mixer.components.recipe import RECIPE_ENTRYPOINT
-from nskit.mixer.utilities import Resource
+from nskit.mixer.utilities import Resource, StaticSource, copy_static
 
 
 def list_recipes(entrypoint: str = RECIPE_ENTRYPOINT) -> list[str]:
@@ -95,6 +109,23 @@ class RecipeCheckResult:
         return "\n".join(lines)
 
 
+def _recipe_name(recipe: str | type | Recipe) -> str:
+    name = (
+        recipe
+        if isinstance(recipe, str)
+        else getattr(recipe, "extension_name", None) or getattr(recipe, "__name__", recipe.__class__.__name__)
+    )
+    return str(name)
+
+
+def _construct(recipe: str | type | Recipe, inputs: dict[str, Any], entrypoint: str) -> Recipe:
+    if isinstance(recipe, str):
+        return Recipe.load(recipe, entrypoint=entrypoint, **inputs)
+    if isinstance(recipe, type):
+        return recipe(**inputs)
+    return recipe
+
+
 def _walk_paths(tree: dict, seen: set, duplicates: list) -> None:
     for path, value in tree.items():
         if isinstance(value, dict):
@@ -130,21 +161,11 @@ def check_recipe(
     (only for genuinely broken usage). The caller asserts on ``.ok``.
     """
     inputs = inputs or {}
-    name = (
-        recipe
-        if isinstance(recipe, str)
-        else getattr(recipe, "extension_name", None) or getattr(recipe, "__name__", recipe.__class__.__name__)
-    )
-    result = RecipeCheckResult(recipe=str(name))
+    result = RecipeCheckResult(recipe=_recipe_name(recipe))
 
     # --- construct -------------------------------------------------------
     try:
-        if isinstance(recipe, str):
-            instance = Recipe.load(recipe, entrypoint=entrypoint, **inputs)
-        elif isinstance(recipe, type):
-            instance = recipe(**inputs)
-        else:
-            instance = recipe
+        instance = _construct(recipe, inputs, entrypoint)
     except Exception as exc:  # noqa: BLE001 - report, don't crash the suite
         result.construction_error = f"{type(exc).__name__}: {exc}"
         return result
@@ -156,6 +177,15 @@ def check_recipe(
     for f in iter_files(instance.contents):
         if not isinstance(f.content, Resource):
             continue
+        if f.static:
+            # Static assets are copied as-is (and may be binary), so only check they resolve
+            try:
+                with f.content.as_file() as source:
+                    if not source.is_file():
+                        result.unresolved_resources.append(f"{f.content} (not a file)")
+            except (FileNotFoundError, ModuleNotFoundError, OSError) as exc:
+                result.unresolved_resources.append(f"{f.content} ({exc})")
+            continue
         try:
             source = f.content.load()
         except (FileNotFoundError, ModuleNotFoundError, OSError) as exc:
@@ -169,8 +199,8 @@ def check_recipe(
 
     # --- dryrun + duplicate-path detection -------------------------------
     try:
-        with ChDir():
-            tree = instance.dryrun()
+        with tempfile.TemporaryDirectory() as tmp:
+            tree = instance.dryrun(base_path=Path(tmp))
         seen: set = set()
         duplicates: list[str] = []
         _walk_paths(tree, seen, duplicates)
@@ -204,3 +234,180 @@ def check_recipes(
     for name, inputs in inputs_by_recipe.items():
         results[name] = check_recipe(name, inputs, entrypoint=entrypoint)
     return results
+
+
+GOLDEN_UPDATE_ENV_VAR = "NSKIT_UPDATE_GOLDEN"
+
+
+def _manifest_bytes(value: Any) -> bytes | None:
+    """Get the rendered bytes for a tree value (``None`` for static sources, which are streamed)."""
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, str):
+        return value.encode("utf-8")
+    if isinstance(value, StaticSource):
+        return None
+    raise TypeError(f"Unexpected rendered value: {value!r}")
+
+
+def _manifest_entry(value: Any) -> dict[str, Any]:
+    data = _manifest_bytes(value)
+    if data is not None:
+        return {"size": len(data), "sha256": hashlib.sha256(data).hexdigest()}
+    # Static (copied) files map to their source, so hash it without loading it all
+    digest = hashlib.sha256()
+    size = 0
+    with value.as_file() as path, open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+            size += len(chunk)
+    return {"size": size, "sha256": digest.hexdigest()}
+
+
+def _flatten_tree(tree: dict) -> dict[str, Any]:
+    """Flatten a ``dryrun``/``create`` tree into relative path → rendered value."""
+    root, contents = next(iter(tree.items()))
+    files: dict[str, Any] = {}
+    pending = [contents]
+    while pending:
+        for path, value in pending.pop().items():
+            if isinstance(value, dict):
+                pending.append(value)
+            else:
+                files[Path(path).relative_to(root).as_posix()] = value
+    return dict(sorted(files.items()))
+
+
+def build_manifest(tree: dict) -> dict[str, dict[str, Any]]:
+    """Build a manifest (relative path → size and sha256) from a ``dryrun``/``create`` tree."""
+    return {path: _manifest_entry(value) for path, value in _flatten_tree(tree).items()}
+
+
+@dataclass
+class ManifestCheckResult:
+    """Outcome of comparing a rendered recipe against a golden manifest."""
+
+    recipe: str
+    golden: Path
+    missing: list[str] = field(default_factory=list)
+    unexpected: list[str] = field(default_factory=list)
+    changed: dict[str, str] = field(default_factory=dict)
+    error: str | None = None
+    updated: bool = False
+
+    @property
+    def ok(self) -> bool:
+        """True when the rendered recipe matches the golden manifest (or it was updated)."""
+        return not (self.error or self.missing or self.unexpected or self.changed)
+
+    def summary(self) -> str:
+        """Human-readable multi-line summary of all mismatches (for assert messages)."""
+        status = "UPDATED" if self.updated else ("OK" if self.ok else "FAILED")
+        lines = [f"recipe {self.recipe!r} against {self.golden}: {status}"]
+        if self.error:
+            lines.append(f"  error: {self.error}")
+        for path in self.missing:
+            lines.append(f"  missing file: {path}")
+        for path in self.unexpected:
+            lines.append(f"  unexpected file: {path}")
+        for path, detail in self.changed.items():
+            lines.append(f"  changed file: {path}")
+            lines.extend(f"    {line}" for line in detail.splitlines())
+        if not self.ok and not self.updated:
+            lines.append(f"  (set {GOLDEN_UPDATE_ENV_VAR}=1 to update the golden files)")
+        return "\n".join(lines)
+
+
+def _diff(path: str, expected: dict[str, Any], entry: dict[str, Any], value: Any, contents_dir: Path | None) -> str:
+    """Describe a mismatch, with a full diff only if the golden contents are available."""
+    detail = f"size {expected['size']} -> {entry['size']}, sha256 {expected['sha256'][:12]} -> {entry['sha256'][:12]}"
+    data = _manifest_bytes(value)
+    golden_path = contents_dir / path if contents_dir is not None else None
+    if data is None or golden_path is None or not golden_path.is_file():
+        return detail
+    try:
+        new = data.decode("utf-8")
+        old = golden_path.read_text(encoding="utf-8")
+    except UnicodeDecodeError:
+        return f"{detail}\n(binary files differ)"
+    diff = difflib.unified_diff(
+        old.splitlines(keepends=True),
+        new.splitlines(keepends=True),
+        fromfile=f"golden/{path}",
+        tofile=f"rendered/{path}",
+    )
+    return detail + "\n" + "".join(diff).rstrip("\n")
+
+
+def _write_golden(golden: Path, manifest: dict, files: dict[str, Any], contents_dir: Path | None) -> None:
+    golden.parent.mkdir(parents=True, exist_ok=True)
+    json.dump_to_path(manifest, golden, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE)
+    if contents_dir is None:
+        return
+    if contents_dir.is_dir():
+        # Remove the contents of files no longer rendered (children before their folders)
+        for existing in sorted(contents_dir.rglob("*"), reverse=True):
+            if existing.is_dir():
+                if not any(existing.iterdir()):
+                    existing.rmdir()
+            elif existing.relative_to(contents_dir).as_posix() not in files and existing.resolve() != golden.resolve():
+                existing.unlink()
+    for path, value in files.items():
+        target = contents_dir / path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        data = _manifest_bytes(value)
+        if data is None:
+            with value.as_file() as source:
+                copy_static(source, target)
+        else:
+            target.write_bytes(data)
+
+
+def check_manifest(
+    recipe: str | type | Recipe,
+    inputs: dict[str, Any] | None = None,
+    *,
+    golden: str | Path,
+    entrypoint: str = RECIPE_ENTRYPOINT,
+    update: bool | None = None,
+    contents_dir: str | Path | None = None,
+) -> ManifestCheckResult:
+    """Render a recipe (``dryrun``) and compare it against a golden manifest file.
+
+    The golden manifest is a JSON mapping of relative path to size and sha256, so
+    matching files are compared by hash only. Mismatches report the size/hash change,
+    plus a unified diff if ``contents_dir`` holds the golden file contents.
+
+    With ``update`` (defaulting to the ``NSKIT_UPDATE_GOLDEN`` environment variable), the
+    golden manifest (and ``contents_dir`` if given) is rewritten from the render instead.
+    """
+    golden = Path(golden)
+    if contents_dir is not None:
+        contents_dir = Path(contents_dir)
+    if update is None:
+        update = os.environ.get(GOLDEN_UPDATE_ENV_VAR, "").lower() in ("1", "true", "yes")
+    result = ManifestCheckResult(recipe=_recipe_name(recipe), golden=golden)
+    try:
+        instance = _construct(recipe, inputs or {}, entrypoint)
+        with tempfile.TemporaryDirectory() as tmp:
+            tree = instance.dryrun(base_path=Path(tmp))
+        files = _flatten_tree(tree)
+        manifest = {path: _manifest_entry(value) for path, value in files.items()}
+    except Exception as exc:  # noqa: BLE001 - report, don't crash the suite
+        result.error = f"{type(exc).__name__}: {exc}"
+        return result
+
+    if update:
+        _write_golden(golden, manifest, files, contents_dir)
+        result.updated = True
+        return result
+    if not golden.exists():
+        result.error = f"golden manifest {golden} does not exist"
+        return result
+    expected = json.loads(golden.read_bytes())
+    result.missing = sorted(set(expected) - set(manifest))
+    result.unexpected = sorted(set(manifest) - set(expected))
+    for path in sorted(set(expected) & set(manifest)):
+        if expected[path] != manifest[path]:
+            result.changed[path] = _diff(path, expected[path], manifest[path], files[path], contents_dir)
+    return result
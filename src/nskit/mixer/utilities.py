@@ -1,21 +1,34 @@
 """Utilities for interacting with systems etc."""
 
+import hashlib
 import os
+import shutil
 import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass
+from functools import lru_cache, update_wrapper
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, NamedTuple, Optional, Union
 
 if sys.version_info.major <= 3 and sys.version_info.minor < 9:
-    from importlib_resources import files
+    from importlib_resources import as_file, files
 else:
-    from importlib.resources import files
+    from importlib.resources import as_file, files
 
-from jinja2 import BaseLoader, ChoiceLoader, Environment, TemplateNotFound
+import orjson
+from jinja2 import BaseLoader, ChoiceLoader, Environment, Template, TemplateNotFound, meta, nodes
 from jinja2.sandbox import SandboxedEnvironment
 from pydantic import GetCoreSchemaHandler, TypeAdapter, ValidationError
 from pydantic_core import CoreSchema, core_schema
 
+from nskit.common.cache import key_value
 from nskit.common.extensions import ExtensionsEnum
+from nskit.common.instrumentation import count
 
 
 class Resource(str):
@@ -58,6 +71,11 @@ class Resource(str):
         p = files(path).joinpath(filename)
         return p.read_text(encoding="utf-8")
 
+    def as_file(self):
+        """Get a context manager for a filesystem path to the resource (extracted if e.g. in a zip file)."""
+        path, filename = self.split(":")
+        return as_file(files(path).joinpath(filename))
+
     @classmethod
     def validate(cls, value):
         """Validate the input."""
@@ -80,6 +98,77 @@ def ref(module: str, filename: str) -> Resource:
     return Resource.validate(f"{module}:{filename}")
 
 
+# Linux ioctl for a copy-on-write clone of a file (e.g. on btrfs/XFS)
+_FICLONE = 0x40049409
+
+
+def _reflink(source_fd: int, destination_fd: int) -> bool:
+    if not sys.platform.startswith("linux"):
+        return False
+    import fcntl
+
+    try:
+        fcntl.ioctl(destination_fd, _FICLONE, source_fd)
+    except OSError:
+        return False
+    return True
+
+
+def _copy_file_range(source_fd: int, destination_fd: int) -> bool:
+    if not hasattr(os, "copy_file_range"):
+        return False
+    remaining = os.fstat(source_fd).st_size
+    try:
+        while remaining > 0:
+            copied = os.copy_file_range(source_fd, destination_fd, remaining)
+            if copied == 0:
+                break
+            remaining -= copied
+    except OSError:
+        return False
+    return remaining == 0
+
+
+def copy_static(source: Path, destination: Path):
+    """Copy a file without reading it into Python memory.
+
+    Tries a reflink (copy-on-write clone), then ``os.copy_file_range``, before falling back
+    to ``shutil.copyfile`` (which uses ``sendfile``/``fcopyfile`` where available).
+
+    Files are never hard linked: the sources are installed package files (or a bundle's extracted files),
+    and edits to the generated project would change them too.
+    """
+    with open(source, "rb") as source_file, open(destination, "wb") as destination_file:
+        if _reflink(source_file.fileno(), destination_file.fileno()):
+            return
+        if _copy_file_range(source_file.fileno(), destination_file.fileno()):
+            return
+    shutil.copyfile(source, destination)
+
+
+@dataclass(frozen=True)
+class StaticSource:
+    """The value of a static file in a ``write``/``dryrun`` tree.
+
+    Static content is copied without loading it into memory, so the tree holds the source (a ``Path`` or
+    ``Resource``) instead of the ``str``/``bytes`` content. It isn't a ``str``, so it can't be mistaken for
+    rendered text.
+    """
+
+    source: Union[Resource, Path]
+
+    def as_file(self):
+        """Get a context manager for a filesystem path to the source."""
+        if isinstance(self.source, Resource):
+            return self.source.as_file()
+        return nullcontext(self.source)
+
+    def read_bytes(self) -> bytes:
+        """Load the content."""
+        with self.as_file() as path:
+            return Path(path).read_bytes()
+
+
 class _PkgResourcesTemplateLoader(BaseLoader):
     """Load jinja templates via importlib.resources."""
 
@@ -160,3 +249,273 @@ class _EnvironmentFactory:
 
 
 JINJA_ENVIRONMENT_FACTORY = _EnvironmentFactory()
+
+
+# Default jinja globals that always give the same output for the same input
+_DETERMINISTIC_GLOBALS = frozenset({"range", "dict", "namespace", "cycler", "joiner"})
+
+
+class _TemplateInfo(NamedTuple):
+    """Static analysis of a template source."""
+
+    # The context keys the template references (``None`` if they can't be determined)
+    variables: Optional[frozenset[str]]
+    # Whether it calls global functions that may not give the same output each time (e.g. lipsum)
+    non_deterministic: bool
+
+
+class _CompiledTemplate(NamedTuple):
+    template: Template
+    info: _TemplateInfo
+
+
+def _analyse(environment: Environment, ast: nodes.Template) -> _TemplateInfo:
+    if any(True for _ in meta.find_referenced_templates(ast)):
+        # Included/imported/extended templates can reference anything in the context
+        variables = None
+    else:
+        variables = frozenset(meta.find_undeclared_variables(ast))
+    names = {node.name for node in ast.find_all(nodes.Name) if node.ctx == "load"}
+    non_deterministic = any(
+        name not in _DETERMINISTIC_GLOBALS and callable(environment.globals.get(name)) for name in names
+    )
+    return _TemplateInfo(variables, non_deterministic)
+
+
+def template_variables(source: str, environment: Optional[Environment] = None) -> Optional[frozenset[str]]:
+    """Get the context keys a template source depends on.
+
+    Returns ``None`` if the dependencies can't be determined statically (e.g. the template
+    includes, imports or extends another template).
+    """
+    if environment is None:
+        environment = JINJA_ENVIRONMENT_FACTORY.environment
+    return RENDER_MEMO.template_info(environment, source).variables
+
+
+@lru_cache(maxsize=1024)
+def _compile_expression(environment: Environment, expression: str):
+    return environment.compile_expression(expression)
+
+
+def evaluate_expression(expression: str, context: Optional[Mapping[str, Any]] = None) -> Any:
+    """Evaluate a Jinja expression (e.g. ``repo.docker and language == 'python'``) against the context."""
+    if context is None:
+        context = {}
+    return _compile_expression(JINJA_ENVIRONMENT_FACTORY.environment, expression)(**context)
+
+
+def expression_variables(expression: str) -> Optional[frozenset[str]]:
+    """Get the context keys a Jinja expression depends on."""
+    return template_variables(f"{{{{ {expression} }}}}")
+
+
+def changed_context_keys(previous: Mapping[str, Any], current: Mapping[str, Any]) -> set[str]:
+    """Get the top level context keys that differ between two contexts."""
+    _missing = object()
+    return {
+        key
+        for key in set(previous) | set(current)
+        if previous.get(key, _missing) is _missing
+        or current.get(key, _missing) is _missing
+        or previous[key] != current[key]
+    }
+
+
+class _RenderMemo:
+    """Compiled template cache and memo of rendered output.
+
+    Each template source is parsed once, and its static analysis (the context keys it references) is kept with the
+    compiled template. Rendered output is keyed by the template hash and a hash of the values of the context keys
+    the template references, so unrelated context changes still hit the memo. Set ``NSKIT_MIXER_RENDER_MEMO=0`` to
+    disable the rendered output memo.
+    """
+
+    def __init__(self, maxsize: int = 2048):
+        """Initialise the memo."""
+        self.maxsize = maxsize
+        self.enabled = os.environ.get("NSKIT_MIXER_RENDER_MEMO", "1").lower() not in ("0", "false", "no", "off")
+        self.hits = 0
+        self.misses = 0
+        self._templates: OrderedDict[tuple[Environment, str], _CompiledTemplate] = OrderedDict()
+        self._rendered: OrderedDict[tuple, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def clear(self):
+        """Clear the cached templates and rendered output."""
+        with self._lock:
+            self._templates.clear()
+            self._rendered.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _compiled(self, environment: Environment, source: str) -> _CompiledTemplate:
+        key = (environment, source)
+        with self._lock:
+            compiled = self._templates.get(key)
+            if compiled is not None:
+                self._templates.move_to_end(key)
+                return compiled
+        ast = environment.parse(source)
+        template = environment.template_class.from_code(
+            environment, environment.compile(ast), environment.make_globals(None), None
+        )
+        compiled = _CompiledTemplate(template, _analyse(environment, ast))
+        self._store(self._templates, key, compiled)
+        return compiled
+
+    def get_template(self, environment: Environment, source: str) -> Template:
+        """Get the compiled template for the source."""
+        return self._compiled(environment, source).template
+
+    def template_info(self, environment: Environment, source: str) -> _TemplateInfo:
+        """Get the static analysis of the source."""
+        return self._compiled(environment, source).info
+
+    def register(
+        self,
+        environment: Environment,
+        source: str,
+        template: Template,
+        info: Optional[tuple[Optional[frozenset[str]], bool]] = None,
+    ):
+        """Register an already compiled template for the source.
+
+        ``info`` is its precomputed ``(variables, non_deterministic)`` analysis, if not given the source is parsed.
+        """
+        info = _analyse(environment, environment.parse(source)) if info is None else _TemplateInfo(*info)
+        self._store(self._templates, (environment, source), _CompiledTemplate(template, info))
+
+    def render(self, environment: Environment, source: str, context: Mapping[str, Any]) -> str:
+        """Render the source with the context, re-using previous output where possible."""
+        compiled = self._compiled(environment, source)
+        key = self._key(environment, source, compiled.info, context) if self.enabled else None
+        if key is not None:
+            with self._lock:
+                rendered = self._rendered.get(key)
+                if rendered is not None:
+                    self._rendered.move_to_end(key)
+                    self.hits += 1
+                    count("nskit.mixer.template_renders", memoised=True)
+                    return rendered
+                self.misses += 1
+        count("nskit.mixer.template_renders", memoised=False)
+        rendered = compiled.template.render(context)
+        if key is not None:
+            self._store(self._rendered, key, rendered)
+        return rendered
+
+    @staticmethod
+    def _key(environment: Environment, source: str, info: _TemplateInfo, context: Mapping[str, Any]) -> Optional[tuple]:
+        # Global functions (e.g. lipsum or a timestamp) may not give the same output each time
+        if info.variables is None or info.non_deterministic:
+            return None
+        try:
+            values = [[name, key_value(context[name])] for name in sorted(info.variables) if name in context]
+            values_hash = hashlib.sha256(orjson.dumps(values)).digest()
+        except TypeError:
+            return None
+        return (environment, hashlib.sha256(source.encode("utf-8")).digest(), values_hash)
+
+    def _store(self, cache: OrderedDict, key, value):
+        with self._lock:
+            cache[key] = value
+            cache.move_to_end(key)
+            while len(cache) > self.maxsize:
+                cache.popitem(last=False)
+
+
+RENDER_MEMO = _RenderMemo()
+
+
+def render_template(source: str, context: Optional[Mapping[str, Any]] = None) -> str:
+    """Render a template source string with the configured Jinja environment."""
+    if context is None:
+        context = {}
+    return RENDER_MEMO.render(JINJA_ENVIRONMENT_FACTORY.environment, source, context)
+
+
+IORequest = tuple["IOBoundFunction", tuple]
+
+_PREFETCHED: ContextVar[Optional[dict[IORequest, tuple[bool, Any]]]] = ContextVar("nskit_prefetched", default=None)
+
+
+class IOBoundFunction:
+    """A blocking (I/O bound) function whose calls can be resolved concurrently ahead of rendering.
+
+    Calls are answered from the prefetched results when available (see ``prefetched``), otherwise the
+    function is called as normal. Arguments need to be hashable.
+    """
+
+    def __init__(self, func: Callable):
+        """Initialise the wrapper."""
+        self.func = func
+        update_wrapper(self, func)
+
+    def __call__(self, *args):
+        """Get the prefetched result, or call the function."""
+        results = _PREFETCHED.get()
+        if results is not None and (self, args) in results:
+            ok, value = results[(self, args)]
+            if not ok:
+                raise value
+            return value
+        return self.func(*args)
+
+    def __getattr__(self, name):
+        """Fall back to the wrapped function attributes (e.g. ``cache_clear``)."""
+        if name == "func":
+            raise AttributeError(name)
+        return getattr(self.func, name)
+
+
+def io_bound(func: Callable) -> IOBoundFunction:
+    """Declare a function as blocking I/O, so its calls can be resolved concurrently before rendering."""
+    return IOBoundFunction(func)
+
+
+def io_requests(requests: Callable[[Mapping[str, Any]], Iterable[IORequest]]):
+    """Declare the ``io_bound`` calls a content callable makes for a context.
+
+    The ``requests`` callable gets the context and returns ``(function, args)`` pairs, it shouldn't do any I/O itself.
+    """
+
+    def decorator(func):
+        func.io_requests = requests
+        return func
+
+    return decorator
+
+
+def prefetch(requests: Iterable[IORequest], max_workers: Optional[int] = None) -> dict[IORequest, tuple[bool, Any]]:
+    """Resolve the (de-duplicated) requests concurrently in a thread pool.
+
+    Errors are kept with the results, and raised when the result is used.
+    """
+    unique = list(dict.fromkeys(requests))
+    if not unique:
+        return {}
+
+    def resolve(request: IORequest) -> tuple[bool, Any]:
+        function, args = request
+        try:
+            return True, function.func(*args)
+        except Exception as e:
+            return False, e
+
+    if len(unique) == 1:
+        return {unique[0]: resolve(unique[0])}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="nskit-prefetch") as executor:
+        return dict(zip(unique, executor.map(resolve, unique)))
+
+
+@contextmanager
+def prefetched(results: Mapping[IORequest, tuple[bool, Any]]):
+    """Use the prefetched results for ``io_bound`` calls made in this context."""
+    combined = dict(_PREFETCHED.get() or {})
+    combined.update(results)
+    token = _PREFETCHED.set(combined)
+    try:
+        yield
+    finally:
+        _PREFETCHED.reset(token)
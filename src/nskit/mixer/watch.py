@@ -0,0 +1,296 @@
+"""Watch mode for recipe authors.
+
+Keeps a rendered project in sync with a recipe while its templates, modules and inputs are edited.
+Changes are detected by polling modification times, and only the affected files are re-rendered
+(and only rewritten if their content changed). Hooks are not run.
+"""
+
+from __future__ import annotations
+
+import filecmp
+import importlib
+import os
+import sys
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from importlib.resources import files
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from nskit._logging import logger_factory
+from nskit.common.io import yaml
+from nskit.constants import RECIPE_ENTRYPOINT
+from nskit.mixer.components import File, Folder, Recipe
+from nskit.mixer.components.filesystem_object import FileSystemObject, PathSelector
+from nskit.mixer.utilities import Resource, StaticSource, changed_context_keys, copy_static
+
+logger = logger_factory.get_logger(__name__)
+
+_IGNORED_DIRECTORIES = frozenset({"__pycache__", ".git", ".mypy_cache", ".pytest_cache", ".ruff_cache"})
+
+
+@dataclass
+class WatchUpdate:
+    """The result of syncing the rendered project."""
+
+    changed: list[Path] = field(default_factory=list)
+    written: list[Path] = field(default_factory=list)
+    removed: list[Path] = field(default_factory=list)
+
+
+def _source_path(content: Any) -> Optional[Path]:
+    """Get the filesystem path of file content loaded from a file (if it is)."""
+    if isinstance(content, Resource):
+        package, filename = content.split(":")
+        try:
+            traversable = files(package).joinpath(filename)
+        except ModuleNotFoundError:
+            return None
+        if isinstance(traversable, Path):
+            return traversable.resolve()
+        return None
+    if isinstance(content, Path):
+        return content.resolve()
+    return None
+
+
+def _template_sources(
+    obj: FileSystemObject, base_path: Path, context: dict[str, Any], override_path: Optional[Path] = None
+) -> dict[Path, Path]:
+    """Map output file paths to the source files their content is read from."""
+    if not obj.is_included(context):
+        return {}
+    path = obj.get_path(base_path, context, override_path)
+    if path is None:
+        return {}
+    if isinstance(obj, Folder):
+        sources = {}
+        for child in obj.contents:
+            sources.update(_template_sources(child, path, context))
+        return sources
+    if isinstance(obj, File):
+        source = _source_path(obj.content)
+        if source is not None:
+            return {path: source}
+    return {}
+
+
+def _write_if_changed(path: Path, value: Any) -> bool:
+    """Write a rendered (``dryrun``) value to the path, unless the path already has that content."""
+    if isinstance(value, StaticSource):
+        with value.as_file() as source:
+            if path.exists() and filecmp.cmp(source, path, shallow=False):
+                return False
+            copy_static(source, path)
+        return True
+    if isinstance(value, bytes):
+        if path.exists() and path.read_bytes() == value:
+            return False
+        path.write_bytes(value)
+        return True
+    if path.exists():
+        with path.open() as f:
+            if f.read() == value:
+                return False
+    with path.open("w") as f:
+        f.write(value)
+    return True
+
+
+class RecipeWatcher:
+    """Keep a rendered recipe in sync with its templates, modules and inputs."""
+
+    def __init__(
+        self,
+        recipe: str,
+        output: Path,
+        inputs: Optional[Path] = None,
+        *,
+        entrypoint: str = RECIPE_ENTRYPOINT,
+        watch_paths: Optional[Iterable[Path]] = None,
+        interval: float = 0.5,
+    ):
+        """Initialise the watcher.
+
+        Args:
+            recipe: The recipe (extension) name.
+            output: The rendered project directory.
+            inputs: A YAML file with the recipe inputs.
+            entrypoint: The recipe entrypoint.
+            watch_paths: Additional files or directories to watch. The folder of the recipe's module, and the folders
+                of the template files its contents are loaded from, are always watched.
+            interval: The polling interval in seconds.
+        """
+        self.recipe_name = recipe
+        self.output = Path(output).absolute()
+        self.inputs = None if inputs is None else Path(inputs).absolute()
+        self.entrypoint = entrypoint
+        self.extra_paths = [Path(path).absolute() for path in watch_paths or []]
+        self.interval = interval
+        self.recipe: Optional[Recipe] = None
+        self._context: dict[str, Any] = {}
+        self._files: set[Path] = set()
+        self._template_folders: set[Path] = set()
+        self._mtimes: dict[Path, int] = {}
+
+    def load_recipe(self) -> Recipe:
+        """Load the recipe with the current inputs."""
+        inputs = {}
+        if self.inputs is not None:
+            with self.inputs.open() as f:
+                inputs = yaml.safe_load(f) or {}
+        return Recipe.load(self.recipe_name, entrypoint=self.entrypoint, **inputs)
+
+    def watched_paths(self) -> list[Path]:
+        """Get the files and directories to watch.
+
+        Rather than the whole (top-level) package, only the folder of the recipe's module and the folders of its
+        template files are watched, so each poll only stats the recipe's own sources. Directories within another
+        watched directory are dropped, so nothing is walked twice.
+        """
+        paths = list(self.extra_paths)
+        if self.inputs is not None:
+            paths.append(self.inputs)
+        if self.recipe is not None:
+            module_file = getattr(sys.modules[type(self.recipe).__module__], "__file__", None)
+            if module_file is not None:
+                paths.append(Path(module_file).resolve().parent)
+            paths.extend(sorted(self._template_folders))
+        watched: list[Path] = []
+        for path in sorted(set(paths), key=lambda path: len(path.parts)):
+            if not any(path.is_relative_to(folder) for folder in watched if folder.is_dir()):
+                watched.append(path)
+        return watched
+
+    def snapshot(self) -> dict[Path, int]:
+        """Get the modification times of the watched files."""
+        mtimes = {}
+        for root in self.watched_paths():
+            if root.is_file():
+                mtimes[root.resolve()] = root.stat().st_mtime_ns
+                continue
+            for directory, directories, filenames in os.walk(root):
+                directories[:] = [name for name in directories if name not in _IGNORED_DIRECTORIES]
+                for filename in filenames:
+                    path = Path(directory, filename).resolve()
+                    try:
+                        mtimes[path] = path.stat().st_mtime_ns
+                    except FileNotFoundError:
+                        # Removed while scanning
+                        continue
+        return mtimes
+
+    def _reload_modules(self, changed: Iterable[Path]):
+        """Reload the changed (already imported) modules, and the recipe module."""
+        changed = set(changed)
+        modules = []
+        for name, module in list(sys.modules.items()):
+            module_file = getattr(module, "__file__", None)
+            if module_file and Path(module_file).resolve() in changed:
+                modules.append(name)
+        if self.recipe is not None and type(self.recipe).__module__ not in modules:
+            # The recipe module may hold references to objects from the changed modules
+            modules.append(type(self.recipe).__module__)
+        for name in modules:
+            logger.debug(f"Reloading {name}")
+            importlib.reload(sys.modules[name])
+
+    def _paths(self, recipe_path: Path) -> tuple[Path, Path]:
+        return recipe_path.parent, Path(recipe_path.name)
+
+    def _watch_templates(self, recipe: Recipe, context: dict[str, Any]):
+        base_path, override_path = self._paths(self.output)
+        sources = _template_sources(recipe, base_path, context, override_path=override_path)
+        self._template_folders = {source.parent for source in sources.values()}
+
+    def render(self) -> WatchUpdate:
+        """Render the full recipe, writing only the files whose content differs."""
+        self.recipe = self.load_recipe()
+        self._watch_templates(self.recipe, self.recipe.context)
+        self._mtimes = self.snapshot()
+        return self._sync(self.recipe, changed=[], selected=None)
+
+    def update(self, changed: Iterable[Path]) -> WatchUpdate:
+        """Re-render the files affected by the changed source files."""
+        changed = [Path(path).resolve() for path in changed]
+        if any(path.suffix == ".py" for path in changed):
+            self._reload_modules(path for path in changed if path.suffix == ".py")
+            # The recipe structure itself may have changed
+            self.recipe = self.load_recipe()
+            return self._sync(self.recipe, changed=changed, selected=None)
+        recipe = self.load_recipe()
+        context = recipe.context
+        changed_keys = changed_context_keys(self._context, context)
+        base_path, override_path = self._paths(self.output)
+        dependencies = recipe.dependencies(base_path, context, override_path=override_path)
+        sources = _template_sources(recipe, base_path, context, override_path=override_path)
+        changed_sources = set(changed)
+        selected = {
+            path
+            for path, variables in dependencies.items()
+            if path not in self._files
+            or variables is None
+            or variables & changed_keys
+            or sources.get(path) in changed_sources
+        }
+        self.recipe = recipe
+        return self._sync(recipe, changed=changed, selected=selected)
+
+    def _sync(self, recipe: Recipe, changed: list[Path], selected: Optional[set[Path]]) -> WatchUpdate:
+        context = recipe.context
+        base_path, override_path = self._paths(self.output)
+        current = set(recipe.dependencies(base_path, context, override_path=override_path))
+        self._watch_templates(recipe, context)
+        result = WatchUpdate(changed=changed)
+        if selected is None or selected:
+            selector = None
+            if selected is not None:
+                selector = PathSelector(self.output, [path.relative_to(self.output) for path in selected])
+            tree = recipe.dryrun(base_path, override_path, selector=selector)
+            pending = [tree]
+            while pending:
+                for path, value in pending.pop().items():
+                    if isinstance(value, dict):
+                        path.mkdir(parents=True, exist_ok=True)
+                        pending.append(value)
+                    elif _write_if_changed(path, value):
+                        result.written.append(path)
+        for path in sorted(self._files - current):
+            if path.is_file():
+                path.unlink()
+                result.removed.append(path)
+        self._files = current
+        self._context = context
+        return result
+
+    def poll(self) -> Optional[WatchUpdate]:
+        """Check for changes, and update the rendered project if there are any."""
+        mtimes = self.snapshot()
+        changed = [path for path in set(mtimes) | set(self._mtimes) if mtimes.get(path) != self._mtimes.get(path)]
+        self._mtimes = mtimes
+        if not changed:
+            return None
+        return self.update(changed)
+
+    def run(
+        self,
+        callback: Optional[Callable[[WatchUpdate], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ):
+        """Render the recipe, then keep it in sync until interrupted (or ``should_stop`` returns True).
+
+        Errors while re-rendering (e.g. a template syntax error mid-edit) are logged and the watcher carries on.
+        """
+        update = self.render()
+        if callback is not None:
+            callback(update)
+        while should_stop is None or not should_stop():
+            time.sleep(self.interval)
+            try:
+                update = self.poll()
+            except Exception:
+                logger.exception("Unable to re-render the recipe")
+                continue
+            if update is not None and callback is not None:
+                callback(update)
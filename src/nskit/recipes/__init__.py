@@ -1,13 +1,24 @@
 """Recipes module initialization (moved to nskit.client)."""
 
-# Backward compatibility - re-export from new location
-from nskit.client import DiscoveryClient, RecipeClient, UpdateClient
-from nskit.client.engines import DockerEngine, LocalEngine
+from nskit.common.lazy import LazyAttributes
 
+# Backward compatibility - re-export from new location (imported on first access, PEP 562)
+_lazy = LazyAttributes(__name__)
+__getattr__ = _lazy.__getattr__
+__dir__ = _lazy.__dir__
+
+_lazy.alias("DiscoveryClient", "nskit.client")
+_lazy.alias("RecipeClient", "nskit.client")
+_lazy.alias("UpdateClient", "nskit.client")
+_lazy.alias("DockerEngine", "nskit.client.engines")
+_lazy.alias("LocalEngine", "nskit.client.engines")
 # Backward compatibility for ExecutionMode (deprecated)
-from nskit.client.execution import ExecutionMode
-from nskit.client.models import RecipeInfo, RecipeResult, RepositoryInfo, UpdateResult
-from nskit.recipes.repository_client import RepositoryClient
+_lazy.alias("ExecutionMode", "nskit.client.execution")
+_lazy.alias("RecipeInfo", "nskit.client.models")
+_lazy.alias("RecipeResult", "nskit.client.models")
+_lazy.alias("RepositoryInfo", "nskit.client.models")
+_lazy.alias("UpdateResult", "nskit.client.models")
+_lazy.alias("RepositoryClient", "nskit.recipes.repository_client")
 
 __all__ = [
     "RecipeClient",
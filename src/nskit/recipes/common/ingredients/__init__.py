@@ -1,36 +1,61 @@
-"""Shared language-agnostic ingredients for recipes."""
+"""Shared language-agnostic ingredients for recipes.
 
+Ingredients are built on first access.
+"""
+
+from nskit.common.lazy import LazyAttributes
 from nskit.mixer import File, Folder
 
-pre_commit_config = File(
-    name=".pre-commit-config.yaml",
-    content="nskit.recipes.common.ingredients:pre_commit_config.yaml.jinja",
-)
-
-gitignore = File(
-    name=".gitignore",
-    content="nskit.recipes.common.ingredients:gitignore.jinja",
-)
-
-# Taskfiles folder structure
-taskfiles_folder = Folder(
-    name="taskfiles",
-    contents=[
-        File(
-            name="common.yml",
-            content="nskit.recipes.common.ingredients:taskfiles_common.yml.jinja",
-        ),
-    ],
-)
-
-# Base Taskfile template
-taskfile = File(
-    name="Taskfile.yml",
-    content="nskit.recipes.common.ingredients:Taskfile.yml.jinja",
-)
-
-# Base README template
-readme_base = File(
-    name="README.md",
-    content="nskit.recipes.common.ingredients:README.md.jinja",
-)
+_ingredients = LazyAttributes(__name__)
+__getattr__ = _ingredients.__getattr__
+__dir__ = _ingredients.__dir__
+
+
+@_ingredients.register
+def _pre_commit_config():
+    """Pre-commit config."""
+    return File(
+        name=".pre-commit-config.yaml",
+        content="nskit.recipes.common.ingredients:pre_commit_config.yaml.jinja",
+    )
+
+
+@_ingredients.register
+def _gitignore():
+    """Gitignore."""
+    return File(
+        name=".gitignore",
+        content="nskit.recipes.common.ingredients:gitignore.jinja",
+    )
+
+
+@_ingredients.register
+def _taskfiles_folder():
+    """Taskfiles folder structure."""
+    return Folder(
+        name="taskfiles",
+        contents=[
+            File(
+                name="common.yml",
+                content="nskit.recipes.common.ingredients:taskfiles_common.yml.jinja",
+            ),
+        ],
+    )
+
+
+@_ingredients.register
+def _taskfile():
+    """Base Taskfile template."""
+    return File(
+        name="Taskfile.yml",
+        content="nskit.recipes.common.ingredients:Taskfile.yml.jinja",
+    )
+
+
+@_ingredients.register
+def _readme_base():
+    """Base README template."""
+    return File(
+        name="README.md",
+        content="nskit.recipes.common.ingredients:README.md.jinja",
+    )
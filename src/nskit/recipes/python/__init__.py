@@ -1,15 +1,23 @@
 """Python Recipes."""
 
 import re
+from functools import cache
 from pathlib import Path
 from typing import Callable, Optional
 
 from pydantic import Field
 
 from nskit import __version__
+from nskit.common.configuration import memoised_property
 from nskit.mixer import CodeRecipe, RepoMetadata, hooks
 
 _DELIMITERS = [".", ",", "-"]
+_NAME_DEPENDENCIES = ("name", "repo_separator")
+
+
+@cache
+def _delimiter_pattern(repo_separator: str) -> re.Pattern:
+    return re.compile("|".join(map(re.escape, sorted(set(_DELIMITERS + [repo_separator])))))
 
 
 class PyRepoMetadata(RepoMetadata):
@@ -28,31 +36,35 @@ class PyRepoMetadata(RepoMetadata):
         if isinstance(value, str):
             self._name = value
 
+    @memoised_property(depends_on=_NAME_DEPENDENCIES)
+    def _name_parts(self):
+        return tuple(_delimiter_pattern(self.repo_separator).split(self.name))
+
     def _get_name_parts(self):
-        return re.split("|".join(map(re.escape, list(set(_DELIMITERS + [self.repo_separator])))), self.name)
+        return list(self._name_parts)
 
-    @property
+    @memoised_property(depends_on=_NAME_DEPENDENCIES)
     def py_name(self):
         """Get python module name."""
-        return ".".join(self._get_name_parts())
+        return ".".join(self._name_parts)
 
-    @property
+    @memoised_property(depends_on=_NAME_DEPENDENCIES)
     def py_root(self):
         """Get root python module name."""
-        return self._get_name_parts()[0]
+        return self._name_parts[0]
 
-    @property
+    @memoised_property(depends_on=_NAME_DEPENDENCIES)
     def src_path(self):
         """Get module folder structure (src not included)."""
-        return Path(*self._get_name_parts()).as_posix()
+        return Path(*self._name_parts).as_posix()
 
-    @property
+    @memoised_property(depends_on=_NAME_DEPENDENCIES)
     def module_depth(self) -> int:
         """Get the module depth.
 
         ``a.b.c`` has a depth of 3, ``a`` has a depth of 1
         """
-        return len(self._get_name_parts())
+        return len(self._name_parts)
 
 
 class PyRecipe(CodeRecipe):
@@ -1,5 +1,6 @@
 """API Service Recipe."""
 
+import copy
 from typing import Union
 
 from pydantic import Field
@@ -9,10 +10,9 @@ from nskit.recipes.python import PyRecipe, ingredients
 from nskit.recipes.python.ingredients import api as api_ingredients
 
 
-class APIRecipe(PyRecipe):
-    """API Service Recipe."""
-
-    contents: list[Union[File, Folder]] = Field(
+def _contents():
+    # Ingredients are built on first access, so this is deferred until a recipe is initialised
+    return copy.deepcopy(
         [
             ingredients.gitignore,
             ingredients.noxfile,
@@ -25,6 +25,11 @@ class APIRecipe(PyRecipe):
             api_ingredients.docker.dockerfile,
             ingredients.docs_dir,
             LicenseFile(),
-        ],
-        description="The folder contents",
+        ]
     )
+
+
+class APIRecipe(PyRecipe):
+    """API Service Recipe."""
+
+    contents: list[Union[File, Folder]] = Field(default_factory=_contents, description="The folder contents")
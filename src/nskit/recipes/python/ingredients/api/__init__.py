@@ -3,24 +3,42 @@
 Contains fastapi based api service ingredients.
 """
 
+from nskit.common.lazy import LazyAttributes
 from nskit.mixer import File, Folder
 from nskit.recipes.python.ingredients import docker  # noqa: F401
-from nskit.recipes.python.ingredients import src_dir as _src_dir
 
-pyproject_toml = File(name="pyproject.toml", content="nskit.recipes.python.ingredients.api:pyproject.toml.jinja")
+_ingredients = LazyAttributes(__name__)
+__getattr__ = _ingredients.__getattr__
+__dir__ = _ingredients.__dir__
 
-readme_md = File(name="README.md", content="nskit.recipes.python.ingredients.api:README.md.jinja")
 
+@_ingredients.register
+def _pyproject_toml():
+    """API pyproject.toml."""
+    return File(name="pyproject.toml", content="nskit.recipes.python.ingredients.api:pyproject.toml.jinja")
 
-src_dir = _src_dir.model_copy(deep=True)
-src_dir["src_path"].contents += [
-    File(name="app.py", content="nskit.recipes.python.ingredients.api:app.py.jinja"),
-    File(name="server.py", content="nskit.recipes.python.ingredients.api:server.py.jinja"),
-    Folder(
-        name="api",
-        contents=[
-            File(name="__init__.py", content="nskit.recipes.python.ingredients.api:api.__init__.py.jinja"),
-            File(name="base.py", content="nskit.recipes.python.ingredients.api:api.base.py.jinja"),
-        ],
-    ),
-]
+
+@_ingredients.register
+def _readme_md():
+    """API README."""
+    return File(name="README.md", content="nskit.recipes.python.ingredients.api:README.md.jinja")
+
+
+@_ingredients.register
+def _src_dir():
+    """Source folder with the API service modules."""
+    from nskit.recipes.python.ingredients import src_dir as _src_dir
+
+    folder = _src_dir.model_copy(deep=True)
+    folder["src_path"].contents += [
+        File(name="app.py", content="nskit.recipes.python.ingredients.api:app.py.jinja"),
+        File(name="server.py", content="nskit.recipes.python.ingredients.api:server.py.jinja"),
+        Folder(
+            name="api",
+            contents=[
+                File(name="__init__.py", content="nskit.recipes.python.ingredients.api:api.__init__.py.jinja"),
+                File(name="base.py", content="nskit.recipes.python.ingredients.api:api.base.py.jinja"),
+            ],
+        ),
+    ]
+    return folder
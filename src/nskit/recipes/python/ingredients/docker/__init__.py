@@ -1,13 +1,32 @@
+from nskit.common.lazy import LazyAttributes
 from nskit.mixer import File
-from nskit.recipes.python.ingredients.tools import taskfiles_folder  # noqa: F401
 
-taskfiles_folder.contents += [
-    File(name="python-package.yml", content="nskit.recipes.python.ingredients.docker:taskfiles.docker.yml.jinja")
-]
+_ingredients = LazyAttributes(__name__)
+__getattr__ = _ingredients.__getattr__
+__dir__ = _ingredients.__dir__
 
-taskfile = File(name="Taskfile.yml", content="nskit.recipes.python.ingredients.docker:Taskfile.yml.jinja")
 
+@_ingredients.register
+def _taskfiles_folder():
+    from nskit.recipes.python.ingredients.tools import taskfiles_folder
 
-dockerfile = File(name="Dockerfile", content="nskit.recipes.python.ingredients.docker:dockerfile.jinja")
+    folder = taskfiles_folder.model_copy(deep=True)
+    folder.contents += [
+        File(name="python-package.yml", content="nskit.recipes.python.ingredients.docker:taskfiles.docker.yml.jinja")
+    ]
+    return folder
 
-docker_ignore = File(name=".dockerignore", content="nskit.recipes.python.ingredients.docker:dockerignore.jinja")
+
+@_ingredients.register
+def _taskfile():
+    return File(name="Taskfile.yml", content="nskit.recipes.python.ingredients.docker:Taskfile.yml.jinja")
+
+
+@_ingredients.register
+def _dockerfile():
+    return File(name="Dockerfile", content="nskit.recipes.python.ingredients.docker:dockerfile.jinja")
+
+
+@_ingredients.register
+def _docker_ignore():
+    return File(name=".dockerignore", content="nskit.recipes.python.ingredients.docker:dockerignore.jinja")
@@ -1,26 +1,36 @@
 """MKDocs templates."""
 
+from nskit.common.lazy import LazyAttributes
 from nskit.mixer import File, Folder
 
-docs_dir = Folder(
-    name="docs",
-    contents=[
-        Folder(
-            name="source",
-            contents=[
-                File(name="index.md", content="nskit.recipes.python.ingredients.docs:index.md.jinja"),
-                File(name="usage.md", content="nskit.recipes.python.ingredients.docs:usage.md.jinja"),
-                Folder(
-                    name="developing",
-                    contents=[
-                        File(
-                            name="index.md", content="nskit.recipes.python.ingredients.docs:developing_index.md.jinja"
-                        ),
-                        File(name="license.md", content="nskit.recipes.python.ingredients.docs:license.md.jinja"),
-                    ],
-                ),
-            ],
-        ),
-        File(name="mkdocs.yml", content="nskit.recipes.python.ingredients.docs:mkdocs.yml.jinja"),
-    ],
-)
+_ingredients = LazyAttributes(__name__)
+__getattr__ = _ingredients.__getattr__
+__dir__ = _ingredients.__dir__
+
+
+@_ingredients.register
+def _docs_dir():
+    """MKDocs docs folder."""
+    return Folder(
+        name="docs",
+        contents=[
+            Folder(
+                name="source",
+                contents=[
+                    File(name="index.md", content="nskit.recipes.python.ingredients.docs:index.md.jinja"),
+                    File(name="usage.md", content="nskit.recipes.python.ingredients.docs:usage.md.jinja"),
+                    Folder(
+                        name="developing",
+                        contents=[
+                            File(
+                                name="index.md",
+                                content="nskit.recipes.python.ingredients.docs:developing_index.md.jinja",
+                            ),
+                            File(name="license.md", content="nskit.recipes.python.ingredients.docs:license.md.jinja"),
+                        ],
+                    ),
+                ],
+            ),
+            File(name="mkdocs.yml", content="nskit.recipes.python.ingredients.docs:mkdocs.yml.jinja"),
+        ],
+    )
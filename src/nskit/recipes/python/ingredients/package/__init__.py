@@ -1,10 +1,25 @@
-from nskit.mixer import File, Folder
-from nskit.recipes.python.ingredients.tools import taskfiles_folder  # noqa: F401
+from nskit.common.lazy import LazyAttributes
+from nskit.mixer import File
 
-taskfiles_folder.contents += [
-    File(
-        name="python-package.yml", content="nskit.recipes.python.ingredients.package:taskfiles.python_package.yml.jinja"
-    )
-]
+_ingredients = LazyAttributes(__name__)
+__getattr__ = _ingredients.__getattr__
+__dir__ = _ingredients.__dir__
 
-taskfile = File(name="Taskfile.yml", content="nskit.recipes.python.ingredients.package:Taskfile.yml.jinja")
+
+@_ingredients.register
+def _taskfiles_folder():
+    from nskit.recipes.python.ingredients.tools import taskfiles_folder
+
+    folder = taskfiles_folder.model_copy(deep=True)
+    folder.contents += [
+        File(
+            name="python-package.yml",
+            content="nskit.recipes.python.ingredients.package:taskfiles.python_package.yml.jinja",
+        )
+    ]
+    return folder
+
+
+@_ingredients.register
+def _taskfile():
+    return File(name="Taskfile.yml", content="nskit.recipes.python.ingredients.package:Taskfile.yml.jinja")
@@ -1,21 +1,44 @@
 """Ingredients for a recipe recipe."""
 
+from nskit.common.lazy import LazyAttributes
 from nskit.mixer import File
-from nskit.recipes.python.ingredients import src_dir as _src_dir
-from nskit.recipes.python.ingredients.docker import docker_ignore
 
-pyproject_toml = File(name="pyproject.toml", content="nskit.recipes.python.ingredients.recipe:pyproject.toml.jinja")
+_ingredients = LazyAttributes(__name__)
+__getattr__ = _ingredients.__getattr__
+__dir__ = _ingredients.__dir__
 
-readme_md = File(name="README.md", content="nskit.recipes.python.ingredients.recipe:readme.md.jinja")
+_ingredients.alias("docker_ignore", "nskit.recipes.python.ingredients.docker")
 
-dockerfile = File(name="Dockerfile", content="nskit.recipes.python.ingredients.recipe:Dockerfile.jinja")
 
+@_ingredients.register
+def _pyproject_toml():
+    """Recipe pyproject.toml."""
+    return File(name="pyproject.toml", content="nskit.recipes.python.ingredients.recipe:pyproject.toml.jinja")
 
-src_dir = _src_dir.model_copy(deep=True)
-src_dir["src_path"].contents += [
-    File(name="recipe.py", content="nskit.recipes.python.ingredients.recipe:recipe.py.jinja"),
-    File(name="ingredient.py.jinja", content="nskit.recipes.python.ingredients.recipe:ingredient.py.jinja.jinja"),
-]
+
+@_ingredients.register
+def _readme_md():
+    """Recipe README."""
+    return File(name="README.md", content="nskit.recipes.python.ingredients.recipe:readme.md.jinja")
+
+
+@_ingredients.register
+def _dockerfile():
+    """Recipe Dockerfile."""
+    return File(name="Dockerfile", content="nskit.recipes.python.ingredients.recipe:Dockerfile.jinja")
+
+
+@_ingredients.register
+def _src_dir():
+    """Source folder with the recipe modules."""
+    from nskit.recipes.python.ingredients import src_dir as _src_dir
+
+    folder = _src_dir.model_copy(deep=True)
+    folder["src_path"].contents += [
+        File(name="recipe.py", content="nskit.recipes.python.ingredients.recipe:recipe.py.jinja"),
+        File(name="ingredient.py.jinja", content="nskit.recipes.python.ingredients.recipe:ingredient.py.jinja.jinja"),
+    ]
+    return folder
 
 
 # What build info to use here (docker?)
@@ -1,20 +1,60 @@
 """Ingredients for repos."""
 
-from nskit.mixer import File, Folder
-from nskit.recipes.common.ingredients import taskfiles_folder  # noqa: F401
+from nskit.common.lazy import LazyAttributes
+from nskit.mixer import File
 
-gitignore = File(name=".gitignore", content="nskit.recipes.python.ingredients.tools:gitignore.jinja")
-noxfile = File(name="noxfile.py", content="nskit.recipes.python.ingredients.tools:noxfile.py.jinja")
-pre_commit = File(
-    name=".pre-commit-config.yaml", content="nskit.recipes.python.ingredients.tools:pre-commit-config.yaml.jinja"
-)
-pyproject_toml = File(name="pyproject.toml", content="nskit.recipes.python.ingredients.tools:pyproject.toml.jinja")
-readme_md = File(name="README.md", content="nskit.recipes.python.ingredients.tools:README.md.jinja")
+_ingredients = LazyAttributes(__name__)
+__getattr__ = _ingredients.__getattr__
+__dir__ = _ingredients.__dir__
 
-taskfiles_folder = taskfiles_folder.model_copy()
 
-taskfiles_folder.contents += [
-    File(name="python-common.yml", content="nskit.recipes.python.ingredients.tools:taskfiles.python_common.yml.jinja")
-]
+@_ingredients.register
+def _gitignore():
+    """Python gitignore."""
+    return File(name=".gitignore", content="nskit.recipes.python.ingredients.tools:gitignore.jinja")
 
-taskfile = File(name="Taskfile.yml", content="nskit.recipes.python.ingredients.tools:Taskfile.yml.jinja")
+
+@_ingredients.register
+def _noxfile():
+    """Noxfile."""
+    return File(name="noxfile.py", content="nskit.recipes.python.ingredients.tools:noxfile.py.jinja")
+
+
+@_ingredients.register
+def _pre_commit():
+    """Pre-commit config."""
+    return File(
+        name=".pre-commit-config.yaml", content="nskit.recipes.python.ingredients.tools:pre-commit-config.yaml.jinja"
+    )
+
+
+@_ingredients.register
+def _pyproject_toml():
+    """Pyproject.toml."""
+    return File(name="pyproject.toml", content="nskit.recipes.python.ingredients.tools:pyproject.toml.jinja")
+
+
+@_ingredients.register
+def _readme_md():
+    """README."""
+    return File(name="README.md", content="nskit.recipes.python.ingredients.tools:README.md.jinja")
+
+
+@_ingredients.register
+def _taskfiles_folder():
+    """Taskfiles folder with the common python tasks."""
+    from nskit.recipes.common.ingredients import taskfiles_folder
+
+    folder = taskfiles_folder.model_copy(deep=True)
+    folder.contents += [
+        File(
+            name="python-common.yml", content="nskit.recipes.python.ingredients.tools:taskfiles.python_common.yml.jinja"
+        )
+    ]
+    return folder
+
+
+@_ingredients.register
+def _taskfile():
+    """Taskfile."""
+    return File(name="Taskfile.yml", content="nskit.recipes.python.ingredients.tools:Taskfile.yml.jinja")
@@ -1,5 +1,6 @@
 """Package Recipe."""
 
+import copy
 from typing import Union
 
 from pydantic import Field
@@ -8,10 +9,9 @@ from nskit.mixer import File, Folder, LicenseFile
 from nskit.recipes.python import PyRecipe, ingredients
 
 
-class PackageRecipe(PyRecipe):
-    """Package Recipe."""
-
-    contents: list[Union[File, Folder]] = Field(
+def _contents():
+    # Ingredients are built on first access, so this is deferred until a recipe is initialised
+    return copy.deepcopy(
         [
             ingredients.gitignore,
             ingredients.noxfile,
@@ -22,6 +22,11 @@ class PackageRecipe(PyRecipe):
             ingredients.src_dir,
             ingredients.docs_dir,
             LicenseFile(),
-        ],
-        description="The folder contents",
+        ]
     )
+
+
+class PackageRecipe(PyRecipe):
+    """Package Recipe."""
+
+    contents: list[Union[File, Folder]] = Field(default_factory=_contents, description="The folder contents")
@@ -1,5 +1,6 @@
 """A Recipe for creating Recipes, meta!"""
 
+import copy
 from typing import Union
 
 from pydantic import Field
@@ -10,11 +11,9 @@ from nskit.recipes.python import PyRecipe, ingredients
 from nskit.recipes.python.ingredients import recipe as recipe_ingredients
 
 
-class RecipeRecipe(PyRecipe):
-    """A Recipe for creating Recipes, meta!"""
-
-    recipe_entrypoint: str = RECIPE_ENTRYPOINT
-    contents: list[Union[File, Folder]] = Field(
+def _contents():
+    # Ingredients are built on first access, so this is deferred until a recipe is initialised
+    return copy.deepcopy(
         [
             ingredients.gitignore,
             ingredients.noxfile,
@@ -27,6 +26,12 @@ class RecipeRecipe(PyRecipe):
             recipe_ingredients.src_dir,
             ingredients.docs_dir,
             LicenseFile(),
-        ],
-        description="The folder contents",
+        ]
     )
+
+
+class RecipeRecipe(PyRecipe):
+    """A Recipe for creating Recipes, meta!"""
+
+    recipe_entrypoint: str = RECIPE_ENTRYPOINT
+    contents: list[Union[File, Folder]] = Field(default_factory=_contents, description="The folder contents")
@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import subprocess  # nosec B404
 from pathlib import Path
 from typing import Any
 
 from nskit.client.models import RepositoryInfo
+from nskit.common import process
 from nskit.vcs.providers.abstract import RepoClient
 
 
@@ -73,13 +73,13 @@ class RepositoryClient:
         info = self.create_repository(repo_name, description=description, private=private)
         clone_url = str(self.vcs_client.get_clone_url(repo_name))
 
-        subprocess.run(  # nosec B603, B607
+        process.run(
             ["git", "remote", "add", "origin", clone_url],
             cwd=project_path,
             capture_output=True,
             check=True,
         )
-        subprocess.run(  # nosec B603, B607
+        process.run(
             ["git", "push", "-u", "origin", "HEAD"],
             cwd=project_path,
             capture_output=True,
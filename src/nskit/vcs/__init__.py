@@ -1,5 +1,13 @@
 """VCS handlers for repository infrastructure."""
 
-from nskit.vcs.namespace_validator import NamespaceOptionsType, NamespaceValidator  # noqa: F401
-from nskit.vcs.provider_detection import get_default_repo_client  # noqa: F401
-from nskit.vcs.repo import Repo  # noqa: F401
+# The exports are imported on first access (PEP 562)
+from nskit.common.lazy import LazyAttributes
+
+_lazy = LazyAttributes(__name__)
+__getattr__ = _lazy.__getattr__
+__dir__ = _lazy.__dir__
+
+_lazy.alias("NamespaceOptionsType", "nskit.vcs.namespace_validator")
+_lazy.alias("NamespaceValidator", "nskit.vcs.namespace_validator")
+_lazy.alias("get_default_repo_client", "nskit.vcs.provider_detection")
+_lazy.alias("Repo", "nskit.vcs.repo")
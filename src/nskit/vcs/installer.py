@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import subprocess  # nosec B404
 import sys
 from abc import ABC, abstractmethod
 from pathlib import Path
@@ -11,8 +10,8 @@ import virtualenv
 from pydantic_settings import SettingsConfigDict
 
 from nskit._logging import logger_factory
+from nskit.common import process
 from nskit.common.configuration import BaseConfiguration
-from nskit.common.contextmanagers import ChDir
 from nskit.common.extensions import ExtensionsEnum
 
 logger = logger_factory.get_logger(__name__)
@@ -82,11 +81,11 @@ class PythonInstaller(Installer):
         args = []
         if not deps:
             args.append("--no-deps")
-        with ChDir(path):
-            if Path("setup.py").exists() or Path("pyproject.toml").exists():
-                subprocess.check_call([str(executable), "-m", "pip", "install", "-e", ".[dev]"] + args)  # nosec B603, B607
-            elif deps and Path(_REQUIREMENTS_TXT).exists():
-                subprocess.check_call([str(executable), "-m", "pip", "install", "-r", _REQUIREMENTS_TXT])  # nosec B603, B607
+        path = Path(path)
+        if (path / "setup.py").exists() or (path / "pyproject.toml").exists():
+            process.check_call([str(executable), "-m", "pip", "install", "-e", ".[dev]"] + args, cwd=path)
+        elif deps and (path / _REQUIREMENTS_TXT).exists():
+            process.check_call([str(executable), "-m", "pip", "install", "-r", _REQUIREMENTS_TXT], cwd=path)
 
     def _get_virtualenv(self, full_virtualenv_dir: Path):
         """Get the virtualenv executable.
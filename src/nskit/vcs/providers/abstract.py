@@ -1,15 +1,28 @@
 """Abstract classes for the provider."""
 
+import inspect
 from abc import ABC, abstractmethod, abstractproperty
 from typing import Any, Optional
 
 from pydantic import HttpUrl
 
 from nskit.common.configuration import BaseConfiguration
+from nskit.common.instrumentation import traced
 
 
 class RepoClient(ABC):
-    """Repo management client."""
+    """Repo management client.
+
+    The public methods implemented by subclasses are traced (``nskit.vcs.<method>`` spans).
+    """
+
+    def __init_subclass__(cls, **kwargs):
+        """Trace the public methods implemented by the subclass."""
+        super().__init_subclass__(**kwargs)
+        for name, value in list(cls.__dict__.items()):
+            if not name.startswith("_") and inspect.isfunction(value):
+                wrapper = traced(f"nskit.vcs.{name}", arguments=("repo_name",), provider=cls.__name__)
+                setattr(cls, name, wrapper(value))
 
     @abstractmethod
     def create(self, repo_name: str):
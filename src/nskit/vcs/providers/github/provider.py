@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 import base64
-import subprocess  # nosec: B404
 from enum import Enum
 from typing import Any, Optional
 
+from nskit.common import process
+
 try:
     from fastcore.net import HTTP404NotFoundError, HTTPError
 
@@ -25,7 +26,7 @@ from pydantic import Field, HttpUrl, SecretStr, ValidationInfo, field_validator
 
 from nskit._logging import logger_factory
 from nskit.common.configuration import BaseConfiguration, SettingsConfigDict
-from nskit.common.ghapi_compat import paged, sync_ghapi
+from nskit.common.ghapi_compat import json_request, paged, sync_ghapi
 from nskit.vcs.providers.abstract import RepoClient, VCSProviderSettings
 from nskit.vcs.providers.github.rulesets import Ruleset
 
@@ -81,7 +82,7 @@ def gh_cli_token() -> Optional[str]:
     one link in a fallback chain.
     """
     try:
-        result = subprocess.run(  # nosec B603, B607 - fixed argv, no shell
+        result = process.run(
             ["gh", "auth", "token"],
             capture_output=True,
             text=True,
@@ -290,11 +291,7 @@ class GithubRepoClient(RepoClient):
             "repository_names": [repo_name],
             "properties": [{"property_name": k, "value": v} for k, v in properties.items()],
         }
-        self._github(
-            f"/orgs/{org}/properties/values",
-            "PATCH",
-            data=payload,
-        )
+        json_request(self._github, f"/orgs/{org}/properties/values", "PATCH", payload)
         logger.info(f"Set custom properties on {repo_name}: {list(properties.keys())}")
 
     def set_branch_protection(
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import shutil
-import subprocess  # nosec B404
 import sys
 import tempfile
 import warnings
@@ -14,8 +13,8 @@ import git
 from pydantic import Field, ValidationInfo, field_validator, model_validator
 
 from nskit._logging import logger_factory
+from nskit.common import process
 from nskit.common.configuration import BaseConfiguration
-from nskit.common.contextmanagers import ChDir
 from nskit.common.io import yaml
 from nskit.vcs.installer import InstallersEnum
 from nskit.vcs.namespace_validator import NamespaceOptionsType, NamespaceValidator, ValidationEnum
@@ -99,8 +98,7 @@ class _Repo(BaseConfiguration):
         self.clone()
         if not self.exists_locally:
             self.local_dir.mkdir(exist_ok=True, parents=True)
-            with ChDir(self.local_dir):
-                self._git_repo_cls.init()
+            self._git_repo_cls.init(self.local_dir)
 
     def delete(self, remote=True):
         """Delete the repo.
@@ -150,13 +148,13 @@ class _Repo(BaseConfiguration):
             paths = [
                 paths,
             ]
-        with ChDir(self._git_repo.working_tree_dir):
-            subprocess.check_call(["git", "add"] + paths)  # nosec B603, B607
-            if hooks:
-                hook_args = []
-            else:
-                hook_args = ["--no-verify"]
-            subprocess.check_call(["git", "commit"] + hook_args + ["-m", message])  # nosec B603, B607
+        working_tree_dir = self._git_repo.working_tree_dir
+        process.check_call(["git", "add"] + paths, cwd=working_tree_dir)
+        if hooks:
+            hook_args = []
+        else:
+            hook_args = ["--no-verify"]
+        process.check_call(["git", "commit"] + hook_args + ["-m", message], cwd=working_tree_dir)
 
     def push(self, remote=DEFAULT_REMOTE):
         """Push the repo to the remote (defaults to origin)."""
@@ -265,7 +263,7 @@ class NamespaceValidationRepo(_Repo):
             self._download_namespaces()
         self.pull()
         with (self.local_dir / self.namespaces_filename).open() as f:
-            namespace_validator = NamespaceValidator(**yaml.load(f))
+            namespace_validator = NamespaceValidator(**yaml.load(f, typ="safe"))
         return namespace_validator
 
     def create(
@@ -289,16 +287,15 @@ class NamespaceValidationRepo(_Repo):
             namespace_validator = namespace_options.model_copy(update=kwargs)
         # Create the repo
         super().create()
-        with ChDir(self.local_dir):
-            # Write the Config
-            with open(self.namespaces_filename, "w") as f:
-                f.write(namespace_validator.model_dump_yaml())
-            with open("README.md", "w") as f:
-                f.write(_NAMESPACE_README)
-            # Commit it
-            self.commit("Initial Namespaces Commit", [self.namespaces_filename, "README.md"])
-            # Push it
-            self.push()
+        # Write the Config
+        with open(Path(self.local_dir) / self.namespaces_filename, "w") as f:
+            f.write(namespace_validator.model_dump_yaml())
+        with open(Path(self.local_dir) / "README.md", "w") as f:
+            f.write(_NAMESPACE_README)
+        # Commit it
+        self.commit("Initial Namespaces Commit", [self.namespaces_filename, "README.md"])
+        # Push it
+        self.push()
 
 
 class Repo(_Repo):
@@ -0,0 +1,62 @@
+"""Import time regression checks.
+
+Run with ``pytest tests/performance -s`` to see the timings.
+"""
+
+import subprocess  # nosec B404
+import sys
+import unittest
+
+import pytest
+
+# Cumulative import time budget for ``import nskit`` in microseconds (as reported by ``-X importtime``)
+IMPORT_BUDGET_US = 100_000
+# Modules that importing nskit (or nskit.common.io) shouldn't pull in
+HEAVY_MODULES = [
+    "git",
+    "virtualenv",
+    "ghapi",
+    "jinja2",
+    "pydantic_settings",
+    "ruamel",
+    "tomlkit",
+    "nskit.mixer.components",
+]
+
+
+def _import_time(statement: str) -> tuple[int, list[str]]:
+    """Get the cumulative import time (us) of the top-level imports in a fresh interpreter, and the imported modules."""
+    code = f"import sys\n{statement}\nprint('\\n'.join(sys.modules))"
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+    )
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        # Top-level (not nested) imports
+        if not name[1:].startswith(" "):
+            total += int(cumulative)
+    return total, result.stdout.split()
+
+
+@pytest.mark.slow
+class TestImportTime(unittest.TestCase):
+    """The nskit exports are lazy, so importing nskit is cheap."""
+
+    def test_import_nskit(self):
+        # Best of a few runs, to reduce noise
+        timings = [_import_time("import nskit")[0] for _ in range(3)]
+        print(f"\nimport nskit: {min(timings) / 1000:.1f}ms")
+        self.assertLess(min(timings), IMPORT_BUDGET_US)
+
+    def test_no_heavy_imports(self):
+        for statement in ["import nskit", "import nskit.common.io"]:
+            with self.subTest(statement=statement):
+                _, modules = _import_time(statement)
+                self.assertEqual([module for module in HEAVY_MODULES if module in modules], [])
+
+    def test_exports(self):
+        _, modules = _import_time("from nskit import Recipe")
+        self.assertIn("nskit.mixer.components", modules)
@@ -0,0 +1,59 @@
+"""Benchmarks for constructing the built-in recipe trees.
+
+Run with ``pytest tests/performance -s`` to see the timings.
+"""
+
+import importlib
+import timeit
+import unittest
+from unittest.mock import patch
+
+import pytest
+
+from nskit.mixer import File, Recipe
+from nskit.mixer.components.filesystem_object import FileSystemObject
+
+_INGREDIENT_MODULES = [
+    "nskit.recipes.common.ingredients",
+    "nskit.recipes.python.ingredients.api",
+    "nskit.recipes.python.ingredients.docker",
+    "nskit.recipes.python.ingredients.docs",
+    "nskit.recipes.python.ingredients.package",
+    "nskit.recipes.python.ingredients.recipe",
+    "nskit.recipes.python.ingredients.tools",
+]
+_REPEATS = 20
+
+
+def _ingredient_factories():
+    factories = []
+    for name in _INGREDIENT_MODULES:
+        factories += list(importlib.import_module(name)._ingredients._factories.values())
+    return factories
+
+
+def _build(factories):
+    for factory in factories:
+        factory()
+
+
+@pytest.mark.slow
+class TestRecipeConstructionBenchmark(unittest.TestCase):
+    """Constructing tree nodes skips the settings sources, so is much cheaper than constructing a recipe."""
+
+    def test_built_in_ingredients(self):
+        factories = _ingredient_factories()
+        _build(factories)
+        seconds = timeit.timeit(lambda: _build(factories), number=_REPEATS) / _REPEATS
+        print(f"\nBuilding the built-in recipe ingredients: {seconds * 1000:.2f}ms")
+
+    def test_node_vs_settings_construction(self):
+        node = timeit.timeit(lambda: File(name="a.txt", content="a"), number=200)
+        settings = timeit.timeit(lambda: Recipe(name="a"), number=200)
+        print(f"\nFile: {node / 200 * 1e6:.1f}us, Recipe (with settings sources): {settings / 200 * 1e6:.1f}us")
+        self.assertLess(node, settings)
+
+    def test_node_skips_settings_sources(self):
+        with patch.object(FileSystemObject, "settings_customise_sources", side_effect=AssertionError) as sources:
+            _build(_ingredient_factories())
+        sources.assert_not_called()
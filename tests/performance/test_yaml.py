@@ -0,0 +1,76 @@
+"""Benchmarks for the YAML load/dump paths.
+
+Run with ``pytest tests/performance -s`` to see the timings.
+"""
+
+import timeit
+import unittest
+
+import pytest
+from ruamel.yaml import YAML
+
+from nskit.common.io import yaml
+
+_REPEATS = 3
+
+
+def _recipe_config(n_fields: int = 300) -> str:
+    """A large ``.recipe/config.yml`` style document."""
+    data = {
+        "metadata": {"recipe_name": "python_package", "docker_image": "ghcr.io/org/python_package:v1.0.0"},
+        "input": {
+            f"field_{i}": {"name": f"value {i}", "enabled": i % 2 == 0, "items": list(range(5))}
+            for i in range(n_fields)
+        },
+        "rendered": {f"derived_{i}": f"derived value {i}" for i in range(n_fields)},
+    }
+    return yaml.safe_dumps(data)
+
+
+def _batch(n_runs: int = 200) -> str:
+    """A large ``.recipe-batch.yaml`` style document."""
+    return yaml.safe_dumps(
+        [
+            {"recipe": "nskit.recipes.python", "context": {"name": f"project-{i}", "repo": {"owner": "me"}}}
+            for i in range(n_runs)
+        ]
+    )
+
+
+def _time(func, *args) -> float:
+    func(*args)
+    return timeit.timeit(lambda: func(*args), number=_REPEATS) / _REPEATS
+
+
+@pytest.mark.slow
+class TestYAMLBenchmark(unittest.TestCase):
+    """The libyaml safe loader is much faster than the round-trip loader, so is used on read-only paths."""
+
+    def test_load_paths(self):
+        for name, document in [("recipe config", _recipe_config()), ("batch", _batch())]:
+            with self.subTest(document=name):
+                uncached = _time(lambda s: YAML(typ="rt").load(s), document)
+                round_trip = _time(yaml.loads, document)
+                ruamel_safe = _time(lambda s: yaml.loads(s, typ="safe"), document)
+                safe = _time(yaml.safe_loads, document)
+                print(
+                    f"\n{name} ({len(document) / 1024:.0f}KiB) load: new rt instance {uncached * 1000:.1f}ms, "
+                    f"cached rt {round_trip * 1000:.1f}ms, ruamel safe {ruamel_safe * 1000:.1f}ms, "
+                    f"safe (libyaml) {safe * 1000:.1f}ms"
+                )
+                self.assertEqual(yaml.safe_loads(document), yaml.loads(document))
+                self.assertLess(safe, round_trip)
+
+    def test_dump_paths(self):
+        data = yaml.safe_loads(_recipe_config())
+        round_trip = _time(yaml.dumps, data)
+        safe = _time(yaml.safe_dumps, data)
+        print(f"\nrecipe config dump: rt {round_trip * 1000:.1f}ms, safe (libyaml) {safe * 1000:.1f}ms")
+        self.assertLess(safe, round_trip)
+
+    def test_instance_cache(self):
+        # Building the YAML instance dominates for small documents (e.g. single inputs files)
+        document = "name: project\nrepo:\n  owner: me\n"
+        uncached = timeit.timeit(lambda: YAML(typ="rt").load(document), number=200) / 200
+        cached = timeit.timeit(lambda: yaml.loads(document), number=200) / 200
+        print(f"\nsmall document load: new rt instance {uncached * 1e6:.0f}us, cached rt {cached * 1e6:.0f}us")
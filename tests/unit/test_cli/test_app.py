@@ -164,6 +164,40 @@ class TestCommitAndMaybePush(unittest.TestCase):
             result = subprocess.run(["git", "log", "--oneline"], cwd=project, capture_output=True, text=True)
             self.assertIn("Initial commit from recipe", result.stdout)
 
+    def test_fast_commit(self):
+        """The rendered files are streamed into the initial commit, along with files written after rendering."""
+        import subprocess
+
+        from rich.console import Console
+
+        from nskit.cli.app import _commit_and_maybe_push
+        from nskit.common import process
+
+        with tempfile.TemporaryDirectory() as tmp_path:
+            project = Path(tmp_path) / "proj"
+            project.mkdir()
+            subprocess.run(["git", "init"], cwd=project, capture_output=True, check=True)
+            (project / "file.txt").write_text("content")
+            (project / ".recipe-config.yaml").write_text("input: {}\n")
+
+            console = Console()
+            with process.recording() as stats:
+                _commit_and_maybe_push(
+                    project, "proj", "", False, None, console, rendered={project: {project / "file.txt": "content"}}
+                )
+
+            self.assertEqual(stats.invocations("git fast-import"), 1)
+            self.assertEqual(stats.invocations("git commit"), 0)
+            result = subprocess.run(["git", "log", "--oneline"], cwd=project, capture_output=True, text=True)
+            self.assertEqual(len(result.stdout.splitlines()), 1)
+            self.assertIn("Initial commit from recipe", result.stdout)
+            files = subprocess.run(
+                ["git", "ls-tree", "-r", "--name-only", "HEAD"], cwd=project, capture_output=True, text=True
+            )
+            self.assertEqual(files.stdout.split(), [".recipe-config.yaml", "file.txt"])
+            status = subprocess.run(["git", "status", "--porcelain"], cwd=project, capture_output=True, text=True)
+            self.assertEqual(status.stdout, "")
+
     def test_skips_without_git(self):
         """Does nothing if project has no .git directory."""
         from rich.console import Console
@@ -200,7 +234,7 @@ class TestCommitAndMaybePush(unittest.TestCase):
             mock_vcs.get_clone_url.return_value = "https://github.com/org/proj.git"
 
             console = Console()
-            with patch("nskit.recipes.repository_client.subprocess.run", return_value=MagicMock(returncode=0)):
+            with patch("nskit.common.process.subprocess.run", return_value=MagicMock(returncode=0)):
                 _commit_and_maybe_push(project, "proj", "desc", True, mock_vcs, console)
 
             mock_vcs.create.assert_called_once_with("proj")
@@ -264,3 +298,112 @@ class TestListJsonFlag(unittest.TestCase):
 
 if __name__ == "__main__":
     unittest.main()
+
+
+class TestBundleBuild(unittest.TestCase):
+    """``bundle build`` packages a recipe into a bundle file."""
+
+    def setUp(self):
+        self.runner = CliRunner()
+        self.app = create_cli(recipe_entrypoint="nskit.recipes")
+
+    def test_bundle_build(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            output = Path(tmp) / "package.nskit-bundle"
+            result = self.runner.invoke(
+                self.app, ["bundle", "build", "--recipe", "python_package", "--output", str(output)]
+            )
+            self.assertEqual(result.exit_code, 0, result.output)
+            self.assertTrue(output.exists())
+
+    def test_bundle_build_unknown_recipe(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            result = self.runner.invoke(
+                self.app, ["bundle", "build", "--recipe", "missing", "--output", str(Path(tmp) / "x")]
+            )
+            self.assertEqual(result.exit_code, 1)
+            self.assertIn("Error: Recipe missing not found", result.output)
+
+    def test_bundle_build_unexpected_error(self):
+        """Errors other than bundle errors aren't reported as bundle errors."""
+        with patch("nskit.mixer.bundle.build_bundle", side_effect=ValueError("unexpected")):
+            result = self.runner.invoke(self.app, ["bundle", "build", "--recipe", "python_package"])
+        self.assertIsInstance(result.exception, ValueError)
+        self.assertNotIn("Error: unexpected", result.output)
+
+    def _init_from_bundle(self, recipe_bundle, recipe, *args):
+        with tempfile.TemporaryDirectory() as tmp:
+            input_file = Path(tmp) / "input.yaml"
+            input_file.write_text("name: test\n")
+            with (
+                patch("nskit.mixer.bundle.load_bundle") as mock_load_bundle,
+                patch("nskit.cli.app._commit_and_maybe_push") as self.commit,
+            ):
+                mock_load_bundle.return_value.__enter__.return_value = recipe_bundle
+                with Env(remove=["GITHUB_TOKEN", "AZURE_DEVOPS_TOKEN"]):
+                    result = self.runner.invoke(
+                        self.app,
+                        [
+                            "init",
+                            "--recipe",
+                            recipe,
+                            "--bundle",
+                            str(Path(tmp) / "package.nskit-bundle"),
+                            "--input-yaml-path",
+                            str(input_file),
+                            "--output-base-path",
+                            tmp,
+                            *args,
+                        ],
+                    )
+        return result, mock_load_bundle.return_value
+
+    def test_init_from_bundle(self):
+        recipe_bundle = Mock()
+        recipe_bundle.name = "python_package"
+        recipe_bundle.recipe.return_value.create.return_value = {}
+        result, context = self._init_from_bundle(recipe_bundle, "python_package")
+        self.assertEqual(result.exit_code, 0, result.output)
+        recipe_bundle.recipe.return_value.create.assert_called_once()
+        context.__exit__.assert_called_once()
+
+    def test_init_from_bundle_fast_commit(self):
+        recipe_bundle = Mock()
+        recipe_bundle.name = "python_package"
+        rendered = {Path("project"): {}}
+        recipe_bundle.recipe.return_value.create.return_value = rendered
+        with patch("nskit.client.config.ConfigManager"), patch("nskit.cli.app._print_tree"):
+            result, _ = self._init_from_bundle(recipe_bundle, "python_package", "--fast-commit")
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIs(self.commit.call_args.kwargs["rendered"], rendered)
+
+    def test_init_from_bundle_recipe_mismatch(self):
+        recipe_bundle = Mock()
+        recipe_bundle.name = "other_recipe"
+        result, context = self._init_from_bundle(recipe_bundle, "python_package")
+        self.assertEqual(result.exit_code, 1)
+        self.assertIn("is for recipe other_recipe", result.output)
+        recipe_bundle.recipe.assert_not_called()
+        context.__exit__.assert_called_once()
+
+
+class TestDevWatch(unittest.TestCase):
+    """``dev watch`` renders a recipe and keeps it in sync."""
+
+    def setUp(self):
+        self.runner = CliRunner()
+        self.app = create_cli(recipe_entrypoint="nskit.recipes")
+
+    def test_dev_watch(self):
+        with patch("nskit.mixer.watch.RecipeWatcher") as watcher_class:
+            watcher_class.return_value.run.side_effect = KeyboardInterrupt
+            result = self.runner.invoke(
+                self.app,
+                ["dev", "watch", "--recipe", "python_package", "--out", "out", "--inputs", "in.yml", "--interval", "2"],
+            )
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn("Stopped watching", result.output)
+        watcher_class.assert_called_once_with(
+            "python_package", Path("out"), Path("in.yml"), entrypoint="nskit.recipes", watch_paths=None, interval=2.0
+        )
+        watcher_class.return_value.run.assert_called_once()
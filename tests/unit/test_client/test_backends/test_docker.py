@@ -11,7 +11,7 @@ from nskit.client.backends.docker import DockerBackend
 class TestDockerBackendImageUrl(unittest.TestCase):
     """Tests for DockerBackend._build_image_url."""
 
-    @patch("nskit.client.backends.docker.subprocess")
+    @patch("nskit.common.process.subprocess")
     def test_image_url_with_prefix(self, mock_subprocess: MagicMock) -> None:
         """Image URL includes registry, prefix, recipe name, and version."""
         mock_subprocess.run.return_value = MagicMock(returncode=0)
@@ -22,7 +22,7 @@ class TestDockerBackendImageUrl(unittest.TestCase):
         url = backend._build_image_url("my-recipe", "1.0.0")
         self.assertEqual(url, "ghcr.io/myorg/recipes/my-recipe:1.0.0")
 
-    @patch("nskit.client.backends.docker.subprocess")
+    @patch("nskit.common.process.subprocess")
     def test_image_url_without_prefix(self, mock_subprocess: MagicMock) -> None:
         """Image URL omits prefix when not configured."""
         mock_subprocess.run.return_value = MagicMock(returncode=0)
@@ -34,7 +34,7 @@ class TestDockerBackendImageUrl(unittest.TestCase):
 class TestDockerBackendGetImageUrl(unittest.TestCase):
     """Tests for DockerBackend.get_image_url."""
 
-    @patch("nskit.client.backends.docker.subprocess")
+    @patch("nskit.common.process.subprocess")
     def test_get_image_url(self, mock_subprocess: MagicMock) -> None:
         """get_image_url delegates to _build_image_url."""
         mock_subprocess.run.return_value = MagicMock(returncode=0)
@@ -49,7 +49,7 @@ class TestDockerBackendGetImageUrl(unittest.TestCase):
 class TestDockerBackendListRecipes(unittest.TestCase):
     """Tests for DockerBackend.list_recipes."""
 
-    @patch("nskit.client.backends.docker.subprocess")
+    @patch("nskit.common.process.subprocess")
     def test_returns_empty_list(self, mock_subprocess: MagicMock) -> None:
         """Docker backend cannot list recipes (registry limitation)."""
         mock_subprocess.run.return_value = MagicMock(returncode=0)
@@ -60,14 +60,14 @@ class TestDockerBackendListRecipes(unittest.TestCase):
 class TestDockerBackendEntrypoint(unittest.TestCase):
     """Tests for DockerBackend.entrypoint property."""
 
-    @patch("nskit.client.backends.docker.subprocess")
+    @patch("nskit.common.process.subprocess")
     def test_default_entrypoint(self, mock_subprocess: MagicMock) -> None:
         """Default entrypoint is 'nskit.recipes'."""
         mock_subprocess.run.return_value = MagicMock(returncode=0)
         backend = DockerBackend()
         self.assertEqual(backend.entrypoint, "nskit.recipes")
 
-    @patch("nskit.client.backends.docker.subprocess")
+    @patch("nskit.common.process.subprocess")
     def test_custom_entrypoint(self, mock_subprocess: MagicMock) -> None:
         """Custom entrypoint is returned."""
         mock_subprocess.run.return_value = MagicMock(returncode=0)
@@ -78,7 +78,7 @@ class TestDockerBackendEntrypoint(unittest.TestCase):
 class TestDockerBackendCheckDocker(unittest.TestCase):
     """Tests for DockerBackend._check_docker."""
 
-    @patch("nskit.client.backends.docker.subprocess")
+    @patch("nskit.common.process.subprocess")
     def test_raises_when_docker_not_found(
         self,
         mock_subprocess: MagicMock,
@@ -89,7 +89,7 @@ class TestDockerBackendCheckDocker(unittest.TestCase):
             DockerBackend()
         self.assertIn("not found", str(ctx.exception).lower())
 
-    @patch("nskit.client.backends.docker.subprocess")
+    @patch("nskit.common.process.subprocess")
     def test_raises_when_docker_not_running(
         self,
         mock_subprocess: MagicMock,
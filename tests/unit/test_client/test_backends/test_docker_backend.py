@@ -12,7 +12,7 @@ class TestDockerBackend(unittest.TestCase):
 
     def test_initialization_success(self):
         """Test successful initialization when Docker is running."""
-        with patch("nskit.client.backends.docker.subprocess.run") as mock_run:
+        with patch("nskit.common.process.subprocess.run") as mock_run:
             mock_run.return_value = Mock(returncode=0)
 
             backend = DockerBackend(registry_url="ghcr.io", image_prefix="org/project")
@@ -23,7 +23,7 @@ class TestDockerBackend(unittest.TestCase):
 
     def test_docker_not_installed(self):
         """Test error when Docker not installed."""
-        with patch("nskit.client.backends.docker.subprocess.run") as mock_run:
+        with patch("nskit.common.process.subprocess.run") as mock_run:
             mock_run.side_effect = FileNotFoundError()
 
             with self.assertRaisesRegex(RuntimeError, "install Docker"):
@@ -31,7 +31,7 @@ class TestDockerBackend(unittest.TestCase):
 
     def test_docker_not_running(self):
         """Test error when Docker not running."""
-        with patch("nskit.client.backends.docker.subprocess.run") as mock_run:
+        with patch("nskit.common.process.subprocess.run") as mock_run:
             mock_run.side_effect = subprocess.CalledProcessError(1, "docker")
 
             with self.assertRaisesRegex(RuntimeError, "not running"):
@@ -39,7 +39,7 @@ class TestDockerBackend(unittest.TestCase):
 
     def test_docker_not_responding(self):
         """Test error when Docker not responding."""
-        with patch("nskit.client.backends.docker.subprocess.run") as mock_run:
+        with patch("nskit.common.process.subprocess.run") as mock_run:
             mock_run.side_effect = subprocess.TimeoutExpired("docker", 5)
 
             with self.assertRaisesRegex(RuntimeError, "not responding"):
@@ -47,7 +47,7 @@ class TestDockerBackend(unittest.TestCase):
 
     def test_build_image_url_with_prefix(self):
         """Test building image URL with prefix."""
-        with patch("nskit.client.backends.docker.subprocess.run"):
+        with patch("nskit.common.process.subprocess.run"):
             backend = DockerBackend(registry_url="ghcr.io", image_prefix="myorg/myproject")
 
             url = backend._build_image_url("python_package", "v1.0.0")
@@ -55,7 +55,7 @@ class TestDockerBackend(unittest.TestCase):
 
     def test_build_image_url_without_prefix(self):
         """Test building image URL without prefix."""
-        with patch("nskit.client.backends.docker.subprocess.run"):
+        with patch("nskit.common.process.subprocess.run"):
             backend = DockerBackend(registry_url="ghcr.io")
 
             url = backend._build_image_url("python_package", "v1.0.0")
@@ -61,7 +61,7 @@ class TestGitHubBackendGetToken(unittest.TestCase):
         backend = GitHubBackend(org="org", token="my-token")
         self.assertEqual(backend._get_token(), "my-token")
 
-    @patch("nskit.client.backends.github.subprocess")
+    @patch("nskit.common.process.subprocess")
     def test_falls_back_to_gh_cli(
         self,
         mock_subprocess: MagicMock,
@@ -76,7 +76,7 @@ class TestGitHubBackendGetToken(unittest.TestCase):
         token = backend._get_token()
         self.assertEqual(token, "gh-cli-token")
 
-    @patch("nskit.client.backends.github.subprocess")
+    @patch("nskit.common.process.subprocess")
     def test_raises_when_gh_cli_missing(
         self,
         mock_subprocess: MagicMock,
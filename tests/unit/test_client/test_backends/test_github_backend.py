@@ -16,7 +16,7 @@ class TestGitHubBackend(unittest.TestCase):
     def setUp(self):
         """Set up patchers for ghapi and subprocess."""
         self.ghapi_patcher = patch("nskit.client.backends.github.sync_ghapi")
-        self.subprocess_patcher = patch("nskit.client.backends.github.subprocess")
+        self.subprocess_patcher = patch("nskit.common.process.subprocess")
 
         self.mock_ghapi = self.ghapi_patcher.start()
         self.mock_subprocess = self.subprocess_patcher.start()
@@ -120,7 +120,7 @@ class TestGitHubBackend(unittest.TestCase):
         with TemporaryDirectory() as tmp:
             tmp_path = Path(tmp)
 
-            with patch("nskit.client.backends.github.subprocess") as mock_sub:
+            with patch("nskit.common.process.subprocess") as mock_sub:
                 mock_sub.run.return_value = Mock(returncode=0)
 
                 with patch("nskit.client.backends.github.zipfile.ZipFile") as mock_zip:
@@ -164,7 +164,7 @@ class TestGitHubBackend(unittest.TestCase):
         # Stop the default subprocess patcher for this test
         self.subprocess_patcher.stop()
 
-        with patch("nskit.client.backends.github.subprocess") as mock_sub:
+        with patch("nskit.common.process.subprocess") as mock_sub:
             mock_sub.CalledProcessError = subprocess.CalledProcessError
             mock_sub.run.side_effect = subprocess.CalledProcessError(1, "gh")
 
@@ -181,7 +181,7 @@ class TestGitHubBackend(unittest.TestCase):
         # Stop the default subprocess patcher for this test
         self.subprocess_patcher.stop()
 
-        with patch("nskit.client.backends.github.subprocess.run") as mock_run:
+        with patch("nskit.common.process.subprocess.run") as mock_run:
             mock_run.side_effect = FileNotFoundError()
 
             backend = GitHubBackend(org="testorg")
@@ -38,24 +38,24 @@ class TestContextProvider(unittest.TestCase):
         """_get_username returns empty string on failure."""
         self.assertEqual(self.provider._get_username(), "")
 
-    @patch("nskit.client.context.subprocess.run")
+    @patch("nskit.common.process.subprocess.run")
     def test_get_git_email(self, mock_run: unittest.mock.MagicMock) -> None:
         """_get_git_email returns the git user.email."""
         mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="dev@example.com\n")
         self.assertEqual(self.provider._get_git_email(), "dev@example.com")
 
-    @patch("nskit.client.context.subprocess.run", side_effect=FileNotFoundError)
+    @patch("nskit.common.process.subprocess.run", side_effect=FileNotFoundError)
     def test_get_git_email_fallback(self, _mock: unittest.mock.MagicMock) -> None:
         """_get_git_email returns empty string when git is not installed."""
         self.assertEqual(self.provider._get_git_email(), "")
 
-    @patch("nskit.client.context.subprocess.run")
+    @patch("nskit.common.process.subprocess.run")
     def test_get_git_name(self, mock_run: unittest.mock.MagicMock) -> None:
         """_get_git_name returns the git user.name."""
         mock_run.return_value = subprocess.CompletedProcess(args=[], returncode=0, stdout="Test User\n")
         self.assertEqual(self.provider._get_git_name(), "Test User")
 
-    @patch("nskit.client.context.subprocess.run", side_effect=FileNotFoundError)
+    @patch("nskit.common.process.subprocess.run", side_effect=FileNotFoundError)
     def test_get_git_name_fallback(self, _mock: unittest.mock.MagicMock) -> None:
         """_get_git_name returns empty string when git is not installed."""
         self.assertEqual(self.provider._get_git_name(), "")
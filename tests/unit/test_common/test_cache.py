@@ -0,0 +1,283 @@
+import tempfile
+import threading
+import time
+import unittest
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from pathlib import Path
+from unittest.mock import patch
+
+from pydantic import AnyUrl, HttpUrl, TypeAdapter
+
+from nskit.common import cache as cache_module
+from nskit.common.cache import (
+    Cache,
+    CacheStats,
+    DiskCache,
+    FileLock,
+    MemoryCache,
+    cache_dir,
+    cache_stats,
+    cached,
+    get_cache,
+    key_value,
+    make_key,
+)
+from nskit.common.contextmanagers import Env
+
+
+class _Colour(Enum):
+    RED = "red"
+
+
+class MemoryCacheTestCase(unittest.TestCase):
+    def test_get_set(self):
+        cache = MemoryCache()
+        self.assertIsNone(cache.get("a"))
+        cache.set("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("b", 2), 2)
+        self.assertEqual(cache.stats, CacheStats(hits=1, misses=2))
+        self.assertAlmostEqual(cache.stats.hit_rate, 1 / 3)
+
+    def test_lru_eviction(self):
+        cache = MemoryCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertIn("c", cache)
+        self.assertEqual(cache.stats.evictions, 1)
+
+    def test_ttl(self):
+        cache = MemoryCache(ttl=10)
+        with patch.object(cache_module.time, "monotonic", return_value=100):
+            cache.set("a", 1)
+        with patch.object(cache_module.time, "monotonic", return_value=109):
+            self.assertEqual(cache.get("a"), 1)
+        with patch.object(cache_module.time, "monotonic", return_value=110):
+            self.assertIsNone(cache.get("a"))
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats, CacheStats(hits=1, misses=1, expired=1))
+
+    def test_delete_clear(self):
+        cache = MemoryCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.delete("a")
+        self.assertNotIn("a", cache)
+        cache.get("b")
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.stats, CacheStats())
+
+
+class DiskCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tempdir.cleanup)
+        self.directory = Path(self._tempdir.name) / "cache"
+
+    def test_get_set(self):
+        cache = DiskCache(self.directory)
+        self.assertIsNone(cache.get("a"))
+        cache.set("a", {"b": [1, "c"]})
+        # Shared with other instances (i.e. processes)
+        self.assertEqual(DiskCache(self.directory).get("a"), {"b": [1, "c"]})
+        self.assertEqual(cache.stats, CacheStats(misses=1))
+        # Only the entry is left (no temporary files)
+        self.assertEqual(len(list(self.directory.iterdir())), 1)
+
+    def test_ttl(self):
+        cache = DiskCache(self.directory, ttl=10)
+        with patch.object(cache_module.time, "time", return_value=100):
+            cache.set("a", 1)
+        with patch.object(cache_module.time, "time", return_value=109):
+            self.assertEqual(cache.get("a"), 1)
+        with patch.object(cache_module.time, "time", return_value=110):
+            self.assertIsNone(cache.get("a"))
+        self.assertEqual(list(self.directory.glob("*.json")), [])
+        self.assertEqual(cache.stats.expired, 1)
+
+    def test_corrupt_entry(self):
+        cache = DiskCache(self.directory)
+        cache.set("a", 1)
+        cache._path("a").write_bytes(b"{not json")
+        self.assertIsNone(cache.get("a"))
+
+    def test_unserialisable_value(self):
+        cache = DiskCache(self.directory)
+        cache.set("a", object())
+        self.assertIsNone(cache.get("a"))
+
+    def test_delete_clear(self):
+        cache = DiskCache(self.directory)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.delete("a")
+        self.assertIsNone(cache.get("a"))
+        cache.clear()
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.stats, CacheStats(misses=1))
+
+
+class FileLockTestCase(unittest.TestCase):
+    def test_exclusive(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "a" / "b.lock"
+            acquired = threading.Event()
+
+            def acquire():
+                with FileLock(path):
+                    acquired.set()
+
+            with FileLock(path):
+                thread = threading.Thread(target=acquire)
+                thread.start()
+                self.assertFalse(acquired.wait(0.2))
+            self.assertTrue(acquired.wait(5))
+            thread.join()
+
+
+class CacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tempdir.cleanup)
+        self.directory = Path(self._tempdir.name)
+
+    def test_memory_only(self):
+        cache = Cache("test")
+        self.assertIsNone(cache.disk)
+        cache.set("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.stats, CacheStats(hits=1, misses=1))
+
+    def test_disk_tier(self):
+        cache = Cache("test", disk=True, directory=self.directory)
+        cache.set("a", [1, 2])
+        # A new process only has the disk tier
+        other = Cache("test", disk=True, directory=self.directory)
+        self.assertEqual(other.get("a"), [1, 2])
+        self.assertEqual(other.disk.stats.hits, 1)
+        self.assertEqual(other.get("a"), [1, 2])
+        # Served from memory now
+        self.assertEqual(other.disk.stats.hits, 1)
+        self.assertEqual(other.memory.stats.hits, 1)
+
+    def test_default_directory(self):
+        with Env(override={"NSKIT_CACHE_DIR": str(self.directory)}):
+            cache = Cache("a/b:c", disk=True)
+        self.assertEqual(cache.disk.directory, self.directory / "a_b_c")
+
+    def test_clear(self):
+        cache = Cache("test", disk=True, directory=self.directory)
+        cache.set("a", 1)
+        cache.clear(disk=False)
+        self.assertEqual(cache.get("a"), 1)
+        cache.clear()
+        self.assertIsNone(cache.get("a"))
+
+    def test_get_or_set(self):
+        calls = []
+        cache = Cache("test", disk=True, directory=self.directory)
+        self.assertEqual(cache.get_or_set("a", lambda: calls.append(1) or "value"), "value")
+        self.assertEqual(cache.get_or_set("a", lambda: calls.append(1) or "value"), "value")
+        self.assertEqual(Cache("test", disk=True, directory=self.directory).get_or_set("a", lambda: "other"), "value")
+        self.assertEqual(calls, [1])
+
+    def test_get_or_set_computed_once_concurrently(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.1)
+            return "value"
+
+        # Separate instances share only the disk tier (like separate processes)
+        caches = [Cache("test", disk=True, directory=self.directory) for _ in range(4)]
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(lambda cache: cache.get_or_set("a", compute), caches))
+        self.assertEqual(results, ["value"] * 4)
+        self.assertEqual(calls, [1])
+
+    def test_disabled(self):
+        with Env(override={"NSKIT_CACHE": "0"}):
+            cache = Cache("test", disk=True, directory=self.directory)
+        cache.set("a", 1)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get_or_set("a", lambda: 2), 2)
+        self.assertEqual(list(self.directory.iterdir()), [])
+
+
+class HelpersTestCase(unittest.TestCase):
+    def test_cache_dir(self):
+        with Env(override={"NSKIT_CACHE_DIR": "/a/b", "XDG_CACHE_HOME": "/c"}):
+            self.assertEqual(cache_dir(), Path("/a/b"))
+        with Env(override={"XDG_CACHE_HOME": "/c"}, remove=["NSKIT_CACHE_DIR"]):
+            self.assertEqual(cache_dir(), Path("/c/nskit"))
+        with Env(remove=["NSKIT_CACHE_DIR", "XDG_CACHE_HOME"]):
+            self.assertEqual(cache_dir(), Path.home() / ".cache" / "nskit")
+
+    def test_make_key(self):
+        self.assertEqual(make_key(1, a=_Colour.RED, b=2), make_key(1, b=2, a=_Colour.RED))
+        self.assertNotEqual(make_key(1), make_key(2))
+        self.assertNotEqual(make_key(1), make_key(a=1))
+        self.assertEqual(make_key(Path("a")), make_key(Path("a")))
+
+    def test_make_key_types(self):
+        self.assertNotEqual(make_key((1, 2)), make_key([1, 2]))
+        self.assertNotEqual(make_key(Path("a")), make_key("a"))
+        self.assertNotEqual(make_key(_Colour.RED), make_key("red"))
+        self.assertNotEqual(make_key({"a": 1}), make_key([["a", 1]]))
+        self.assertEqual(make_key({"a": 1, "b": {2}}), make_key({"b": {2}, "a": 1}))
+
+    def test_make_key_urls(self):
+        url = "https://www.test.com/"
+        for url_type in (HttpUrl, AnyUrl):
+            with self.subTest(url_type=url_type):
+                self.assertEqual(key_value(TypeAdapter(url_type).validate_python(url))["object"][1], url)
+                self.assertNotEqual(make_key(TypeAdapter(url_type).validate_python(url)), make_key(url))
+
+    def test_make_key_unsupported(self):
+        with self.assertRaises(TypeError):
+            make_key(object())
+
+        @cached(f"test-{uuid.uuid4()}")
+        def identity(a):
+            return a
+
+        with self.assertRaisesRegex(TypeError, "pass key= to cached"):
+            identity(object())
+
+        @cached(f"test-{uuid.uuid4()}", key=lambda a: str(id(a)))
+        def keyed(a):
+            return a
+
+        value = object()
+        self.assertIs(keyed(value), value)
+
+    def test_cached(self):
+        calls = []
+        name = f"test-{uuid.uuid4()}"
+
+        @cached(name, maxsize=4)
+        def double(a):
+            calls.append(a)
+            return a * 2
+
+        self.assertEqual([double(1), double(1), double(2)], [2, 2, 4])
+        self.assertEqual(calls, [1, 2])
+        self.assertIs(double.cache, get_cache(name))
+        self.assertEqual(cache_stats()[name], CacheStats(hits=1, misses=2))
+        double.cache_clear()
+        double(1)
+        self.assertEqual(calls, [1, 2, 1])
+
+    def test_get_cache(self):
+        name = f"test-{uuid.uuid4()}"
+        self.assertIs(get_cache(name, maxsize=2), get_cache(name))
+        self.assertEqual(get_cache(name).memory.maxsize, 2)
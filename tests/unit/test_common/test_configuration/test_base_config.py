@@ -1,6 +1,11 @@
+import datetime as dt
+import enum
 import unittest
+from pathlib import Path
+from typing import Optional
+from unittest.mock import patch
 
-from pydantic import ConfigDict, ValidationError
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 
 from nskit.common.configuration import BaseConfiguration, SettingsConfigDict
 from nskit.common.contextmanagers import ChDir
@@ -133,6 +138,51 @@ class BaseConfigurationTestCase(unittest.TestCase):
     def test_dump_yaml(self):
         self.assertEqual(self.expected.model_dump_yaml(), yaml.dumps(self.file_config))
 
+    def test_dump_parity(self):
+        class Colour(enum.Enum):
+            RED = "red"
+
+        class Inner(BaseModel):
+            path: Path = Path("a/b.txt")
+            when: dt.datetime = dt.datetime(2024, 1, 2, 3, 4, 5, tzinfo=dt.timezone.utc)
+            tags: set[str] = {"x"}
+
+        class Outer(BaseConfiguration):
+            name: str = "name"
+            colour: Colour = Colour.RED
+            inner: Inner = Inner()
+            items: list[Inner] = [Inner(), Inner(path=Path("c"))]
+            pair: tuple[int, float] = (1, 2.5)
+            mapping: dict[str, int] = {"b": 2, "a": 1}
+            optional: Optional[str] = None
+            aliased: int = Field(3, alias="Aliased")
+
+            @property
+            def upper(self):
+                return self.name.upper()
+
+        model = Outer()
+        for kwargs in [{}, {"by_alias": True}, {"exclude": {"inner"}}, {"exclude_defaults": True}]:
+            expected = json.loads(model.model_dump_json(exclude_none=True, **kwargs))
+            with self.subTest(kwargs=kwargs):
+                self.assertEqual(model.model_dump_yaml(exclude_none=True, **kwargs), yaml.dumps(expected))
+                self.assertEqual(model.model_dump_toml(exclude_none=True, **kwargs), toml.dumps(expected))
+
+    def test_dump_non_finite_floats(self):
+        class Floats(BaseConfiguration):
+            nan: float = float("nan")
+            inf: float = float("inf")
+
+        # Non-finite floats are nulled, as in model_dump_json
+        model = Floats()
+        self.assertEqual(model.model_dump_yaml(), yaml.dumps(json.loads(model.model_dump_json())))
+        self.assertEqual(yaml.loads(model.model_dump_yaml()), {"nan": None, "inf": None})
+
+    def test_dump_skips_json(self):
+        with patch.object(self.settings_cls, "model_dump_json", side_effect=AssertionError):
+            self.assertEqual(self.expected.model_dump_yaml(), "a: a\nb: 2\n")
+            self.assertEqual(self.expected.model_dump_toml(), 'a = "a"\nb = 2\n')
+
     def test_nested_properties(self):
         class ASettings(BaseConfiguration):
             model_config = ConfigDict(extra="ignore")
@@ -2,7 +2,7 @@ import unittest
 
 from pydantic import BaseModel
 
-from nskit.common.configuration.mixins import PropertyDumpMixin
+from nskit.common.configuration.mixins import MemoisedProperty, PropertyDumpMixin, memoised_property
 
 
 class PropertyDumpMixinTestCase(unittest.TestCase):
@@ -68,3 +68,66 @@ class PropertyDumpMixinTestCase(unittest.TestCase):
         self.assertEqual(t.model_dump(exclude={"a"}), {"b": 1, "c": 1.2})
         self.assertEqual(t.model_dump(), {"a": "a", "b": 1, "c": 1.2})
         self.assertEqual(t.model_dump(include={"a", "d"}), {"a": "a", "d": True})
+
+
+class MemoisedPropertyTestCase(unittest.TestCase):
+    def setUp(self):
+        calls = []
+
+        class TestModel(PropertyDumpMixin, BaseModel):
+            a: str = "a"
+            b: int = 1
+
+            @memoised_property(depends_on=("a",))
+            def c(self):
+                """Upper case a."""
+                calls.append(self.a)
+                return self.a.upper()
+
+        self.calls = calls
+        self.model_cls = TestModel
+
+    def test_cached(self):
+        t = self.model_cls()
+        self.assertEqual(t.c, "A")
+        self.assertEqual(t.c, "A")
+        self.assertEqual(self.calls, ["a"])
+
+    def test_invalidated_on_dependency_change(self):
+        t = self.model_cls()
+        self.assertEqual(t.c, "A")
+        t.a = "b"
+        self.assertEqual(t.c, "B")
+        # Changing another field doesn't recompute
+        t.b = 2
+        self.assertEqual(t.c, "B")
+        self.assertEqual(self.calls, ["a", "b"])
+
+    def test_model_dump(self):
+        t = self.model_cls()
+        self.assertEqual(t.model_dump(), {"a": "a", "b": 1, "c": "A"})
+        self.assertEqual(t.model_dump(), {"a": "a", "b": 1, "c": "A"})
+        self.assertEqual(t.model_dump(exclude={"c"}), {"a": "a", "b": 1})
+        self.assertEqual(self.calls, ["a"])
+
+    def test_not_compared(self):
+        t = self.model_cls()
+        t.c
+        self.assertEqual(t, self.model_cls())
+
+    def test_copy(self):
+        t = self.model_cls()
+        t.c
+        copied = t.model_copy(update={"a": "x"})
+        self.assertEqual(copied.c, "X")
+        self.assertEqual(t.c, "A")
+
+    def test_class_access(self):
+        self.assertIsInstance(self.model_cls.c, MemoisedProperty)
+        self.assertIsInstance(self.model_cls.c, property)
+        self.assertEqual(self.model_cls.c.__doc__, "Upper case a.")
+
+    def test_read_only(self):
+        t = self.model_cls()
+        with self.assertRaises(AttributeError):
+            t.c = "b"
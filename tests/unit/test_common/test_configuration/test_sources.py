@@ -1,8 +1,13 @@
+import os
 import unittest
+from pathlib import Path
+from unittest.mock import patch
 
 from pydantic import BaseModel
 
+from nskit.common.configuration import sources
 from nskit.common.configuration.sources import (
+    PARSE_CACHE,
     JsonConfigSettingsSource,
     TomlConfigSettingsSource,
     YamlConfigSettingsSource,
@@ -66,3 +71,47 @@ class TomlConfigSettingsSourceTestCase(unittest.TestCase):
             with open("test.toml", arg) as f:
                 toml.dump(self.file_config, f)
             self.assertEqual(src(), self.file_config)
+
+    def test_utf8(self):
+        with ChDir(), patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as read_text:
+            Path("test.toml").write_bytes('a = "é"\nb = 2\n'.encode())
+            self.assertEqual(TomlConfigSettingsSource(self.settings_cls, "test.toml")(), {"a": "é", "b": 2})
+        self.assertEqual(read_text.call_args.args[1:], ("utf-8",))
+
+
+class ParseCacheTestCase(unittest.TestCase):
+    def setUp(self):
+        PARSE_CACHE.clear()
+        self.addCleanup(PARSE_CACHE.clear)
+
+        class Settings(BaseModel):
+            a: str
+            b: int
+
+        self.settings_cls = Settings
+
+    def test_parsed_once(self):
+        with ChDir(), patch.object(sources.yaml, "loads", side_effect=yaml.loads) as loads:
+            Path("test.yaml").write_text("a: a\nb: 2\n")
+            for _ in range(3):
+                src = YamlConfigSettingsSource(self.settings_cls, "test.yaml")
+                self.assertEqual(src(), {"a": "a", "b": 2})
+            loads.assert_called_once()
+
+    def test_reparsed_on_change(self):
+        with ChDir(), patch.object(sources.json, "loads", side_effect=json.loads) as loads:
+            Path("test.json").write_text('{"a": "a", "b": 2}')
+            self.assertEqual(JsonConfigSettingsSource(self.settings_cls, "test.json")(), {"a": "a", "b": 2})
+            Path("test.json").write_text('{"a": "b", "b": 3}')
+            # Make sure the change is visible even on filesystems with coarse timestamps
+            stat = os.stat("test.json")
+            os.utime("test.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            self.assertEqual(JsonConfigSettingsSource(self.settings_cls, "test.json")(), {"a": "b", "b": 3})
+            self.assertEqual(loads.call_count, 2)
+
+    def test_copy_returned(self):
+        with ChDir():
+            Path("test.toml").write_text('a = "a"\nb = 2\n')
+            data = PARSE_CACHE.get(Path("test.toml"), toml.loads)
+            data["a"] = "changed"
+            self.assertEqual(TomlConfigSettingsSource(self.settings_cls, "test.toml")(), {"a": "a", "b": 2})
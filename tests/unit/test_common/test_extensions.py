@@ -1,10 +1,21 @@
+import sys
+import tempfile
 import unittest
 import uuid
+from pathlib import Path
+from unittest.mock import patch
 
 from pydantic import BaseModel, ValidationError
 
-from nskit.common.contextmanagers import TestExtension
-from nskit.common.extensions import ExtensionsEnum, get_extension_names, get_extensions, load_extension
+from nskit.common import extensions
+from nskit.common.contextmanagers import Env, TestExtension
+from nskit.common.extensions import (
+    ExtensionsEnum,
+    get_extension_names,
+    get_extensions,
+    invalidate_extensions_cache,
+    load_extension,
+)
 
 
 class ExtensionHelpersTestCase(unittest.TestCase):
@@ -141,3 +152,57 @@ class ExtensionsEnumTestCase(unittest.TestCase):
                 self.assertEqual(getattr(TestExtensionsEnum, extension2_name).value, extension2_name)
                 model = TestModel(ext=getattr(TestExtensionsEnum, extension2_name))
                 self.assertEqual(model.ext, getattr(TestExtensionsEnum, extension2_name))
+
+
+class EntryPointIndexTestCase(unittest.TestCase):
+    def setUp(self):
+        invalidate_extensions_cache()
+        self._tempdir = tempfile.TemporaryDirectory()
+        self.index_path = Path(self._tempdir.name) / "index.json"
+
+    def tearDown(self):
+        invalidate_extensions_cache()
+        self._tempdir.cleanup()
+
+    def test_scanned_once(self):
+        with patch.object(extensions, "entry_points", wraps=extensions.entry_points) as entry_points:
+            names = get_extension_names("nskit.recipes")
+            self.assertEqual(get_extension_names("nskit.recipes"), names)
+            get_extensions("nskit.vcs.providers")
+            entry_points.assert_called_once_with()
+            invalidate_extensions_cache()
+            get_extension_names("nskit.recipes")
+            self.assertEqual(entry_points.call_count, 2)
+
+    def test_sys_path_change(self):
+        with patch.object(extensions, "entry_points", wraps=extensions.entry_points) as entry_points:
+            get_extension_names("nskit.recipes")
+            with patch.object(sys, "path", sys.path + [self._tempdir.name]):
+                get_extension_names("nskit.recipes")
+            self.assertEqual(entry_points.call_count, 2)
+
+    def test_disk_index(self):
+        with Env(override={extensions.INDEX_ENV_VAR: str(self.index_path)}):
+            names = get_extension_names("nskit.recipes")
+            self.assertTrue(self.index_path.exists())
+            invalidate_extensions_cache()
+            with patch.object(extensions, "entry_points", wraps=extensions.entry_points) as entry_points:
+                self.assertEqual(get_extension_names("nskit.recipes"), names)
+                entry_points.assert_not_called()
+                # Loaded from the index
+                self.assertIsNotNone(load_extension("nskit.recipes", "recipe"))
+                # A change in the installed distributions rebuilds it
+                invalidate_extensions_cache()
+                with patch.object(extensions, "_fingerprint", return_value="changed"):
+                    self.assertEqual(get_extension_names("nskit.recipes"), names)
+                entry_points.assert_called_once_with()
+
+    def test_disk_index_test_extension(self):
+        test_entry_point = f"nskit.tests.test_extension.a_{uuid.uuid4()}"
+        extension_name = f"test_ext{uuid.uuid4()}"
+        with Env(override={extensions.INDEX_ENV_VAR: str(self.index_path)}):
+            with TestExtension(extension_name, test_entry_point, int):
+                self.assertEqual(get_extension_names(test_entry_point), [extension_name])
+                # Test extensions aren't on disk, so the index isn't used
+                self.assertFalse(self.index_path.exists())
+            self.assertEqual(get_extension_names(test_entry_point), [])
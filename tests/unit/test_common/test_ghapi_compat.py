@@ -6,11 +6,11 @@ import inspect
 import re
 import unittest
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import nskit
 from nskit.common import ghapi_compat
-from nskit.common.ghapi_compat import paged, supports_sync_flag, sync_ghapi
+from nskit.common.ghapi_compat import json_request, paged, supports_sync_flag, sync_ghapi
 
 
 class TestSupportsSyncFlag(unittest.TestCase):
@@ -116,6 +116,26 @@ class TestSyncGhApi(unittest.TestCase):
         self.assertEqual(captured["gh_host"], "https://ghe.example.com")
 
 
+class TestJsonRequest(unittest.TestCase):
+    """Raw API calls with a JSON payload."""
+
+    def test_bytes_payload_on_2x(self) -> None:
+        """On 2.x the payload is sent pre-encoded, with a JSON content type."""
+        api = MagicMock()
+        with patch.object(ghapi_compat, "supports_sync_flag", return_value=True):
+            json_request(api, "/path", "PATCH", {"a": ["é"]})
+        api.assert_called_once_with(
+            "/path", "PATCH", headers={"Content-Type": "application/json"}, data='{"a":["é"]}'.encode()
+        )
+
+    def test_payload_passed_through_on_1x(self) -> None:
+        """1.x JSON encodes the payload itself."""
+        api = MagicMock()
+        with patch.object(ghapi_compat, "supports_sync_flag", return_value=False):
+            json_request(api, "/path", "PATCH", {"a": 1})
+        api.assert_called_once_with("/path", "PATCH", data={"a": 1})
+
+
 class TestPaged(unittest.TestCase):
     """Selection of the synchronous pager."""
 
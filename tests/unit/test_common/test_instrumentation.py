@@ -0,0 +1,201 @@
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from nskit.client.backends.base import RecipeBackend
+from nskit.client.engines.base import RecipeEngine
+from nskit.common.contextmanagers import Env
+from nskit.common.instrumentation import (
+    InMemoryInstrumentation,
+    Instrumentation,
+    OpenTelemetryInstrumentation,
+    count,
+    get_instrumentation,
+    set_instrumentation,
+    span,
+    traced,
+)
+from nskit.mixer.components import File, Hook, Recipe
+from nskit.vcs.providers.abstract import RepoClient
+
+
+class _Backend(RecipeBackend):
+    entrypoint = "nskit.test"
+
+    def list_recipes(self):
+        return []
+
+    def get_recipe_versions(self, recipe):
+        return ["v1"]
+
+    def fetch_recipe(self, recipe, version, dest):
+        return dest
+
+
+class _Engine(RecipeEngine):
+    def execute(self, recipe, version, parameters, output_dir, image_url=None, entrypoint=None):
+        return None
+
+
+class _RepoClient(RepoClient):
+    def create(self, repo_name):
+        self._helper()
+
+    def _helper(self):
+        pass
+
+    def get_remote_url(self, repo_name):
+        pass
+
+    def get_clone_url(self, repo_name):
+        pass
+
+    def delete(self, repo_name):
+        pass
+
+    def check_exists(self, repo_name):
+        return False
+
+    def list(self):
+        return []
+
+
+class _Hook(Hook):
+    def call(self, recipe_path, context, **kwargs):
+        return None
+
+
+class _Recipe(Recipe):
+    name: str = "test"
+    contents: list = [File(name="a.txt", content="{{ name }}")]
+
+
+class _InstrumentationTestCase(unittest.TestCase):
+    def setUp(self):
+        self.instrumentation = InMemoryInstrumentation()
+        set_instrumentation(self.instrumentation)
+        self.addCleanup(set_instrumentation, None)
+
+
+class NoOpInstrumentationTestCase(unittest.TestCase):
+    def setUp(self):
+        set_instrumentation(None)
+        self.addCleanup(set_instrumentation, None)
+
+    def test_default(self):
+        with Env(remove=["NSKIT_INSTRUMENTATION"]):
+            self.assertIs(type(get_instrumentation()), Instrumentation)
+        with span("a", b=1) as s:
+            s.set_attribute("c", 2)
+            s.record_exception(ValueError())
+        count("a")
+
+    def test_traced(self):
+        @traced()
+        def add(a, b):
+            return a + b
+
+        self.assertEqual(add(1, b=2), 3)
+        self.assertEqual(add.__name__, "add")
+
+    def test_unknown_environment_value(self):
+        with Env(override={"NSKIT_INSTRUMENTATION": "unknown"}):
+            self.assertIs(type(get_instrumentation()), Instrumentation)
+
+    def test_opentelemetry_not_installed(self):
+        with Env(override={"NSKIT_INSTRUMENTATION": "opentelemetry"}):
+            try:
+                import opentelemetry  # noqa: F401
+            except ImportError:
+                self.assertIs(type(get_instrumentation()), Instrumentation)
+            else:  # pragma: no cover
+                self.assertIsInstance(get_instrumentation(), OpenTelemetryInstrumentation)
+
+
+class InMemoryInstrumentationTestCase(_InstrumentationTestCase):
+    def test_nested_spans(self):
+        with span("outer", a=1):
+            with span("inner") as inner:
+                inner.set_attribute("b", 2)
+        outer, inner = self.instrumentation.spans
+        self.assertEqual((outer.name, outer.attributes, outer.parent), ("outer", {"a": 1}, None))
+        self.assertEqual((inner.name, inner.attributes), ("inner", {"b": 2}))
+        self.assertIs(inner.parent, outer)
+        self.assertGreaterEqual(outer.duration, inner.duration)
+
+    def test_exception(self):
+        error = ValueError("a")
+        with self.assertRaises(ValueError):
+            with span("a"):
+                raise error
+        self.assertIs(self.instrumentation.find("a")[0].exception, error)
+
+    def test_traced(self):
+        @traced("add", arguments=("a", "b"), kind="sum")
+        def add(a, b=2):
+            return a + b
+
+        self.assertEqual(add(1), 3)
+        self.assertEqual(add(1, b=3), 4)
+        self.assertEqual(
+            [record.attributes for record in self.instrumentation.find("add")],
+            [
+                {"kind": "sum", "a": 1},
+                {"kind": "sum", "a": 1, "b": 3},
+            ],
+        )
+
+    def test_counters(self):
+        count("a")
+        count("a", 2, kind="x")
+        count("b")
+        self.assertEqual(self.instrumentation.counter("a"), 3)
+        self.assertEqual(self.instrumentation.counter("a", kind="x"), 2)
+        self.instrumentation.clear()
+        self.assertEqual(self.instrumentation.counter("a"), 0)
+        self.assertEqual(self.instrumentation.spans, [])
+
+
+class OpenTelemetryInstrumentationTestCase(unittest.TestCase):
+    def test_span(self):
+        tracer = MagicMock()
+        otel = OpenTelemetryInstrumentation(tracer=tracer, meter=MagicMock())
+        otel.span("a", {"b": 1, "c": None, "d": Path("e"), "f": ("g", 1)})
+        tracer.start_as_current_span.assert_called_once_with("a", attributes={"b": 1, "d": "e", "f": ["g", 1]})
+
+    def test_counter(self):
+        meter = MagicMock()
+        otel = OpenTelemetryInstrumentation(tracer=MagicMock(), meter=meter)
+        otel.add("a", 1, {"b": True})
+        otel.add("a", 2, {})
+        meter.create_counter.assert_called_once_with("a")
+        self.assertEqual(meter.create_counter.return_value.add.call_count, 2)
+        meter.create_counter.return_value.add.assert_called_with(2, attributes={})
+
+
+class InstrumentedComponentsTestCase(_InstrumentationTestCase):
+    def test_backend(self):
+        _Backend().get_recipe_versions("a")
+        (record,) = self.instrumentation.find("nskit.backend.get_recipe_versions")
+        self.assertEqual(record.attributes, {"backend": "_Backend", "recipe": "a"})
+
+    def test_engine(self):
+        _Engine().execute("a", "v1", {}, Path("."))
+        (record,) = self.instrumentation.find("nskit.engine.execute")
+        self.assertEqual(record.attributes, {"engine": "_Engine", "recipe": "a", "version": "v1"})
+
+    def test_repo_client(self):
+        _RepoClient().create("repo")
+        self.assertEqual([record.name for record in self.instrumentation.spans], ["nskit.vcs.create"])
+        self.assertEqual(self.instrumentation.spans[0].attributes, {"provider": "_RepoClient", "repo_name": "repo"})
+
+    def test_recipe_create(self):
+        recipe = _Recipe(post_hooks=[_Hook()])
+        with tempfile.TemporaryDirectory() as tmp:
+            recipe.create(base_path=tmp)
+        (create,) = self.instrumentation.find("nskit.recipe.create")
+        (hook_span,) = self.instrumentation.find("nskit.recipe.hook")
+        self.assertIs(hook_span.parent, create)
+        self.assertEqual(hook_span.attributes["stage"], "post")
+        self.assertGreater(self.instrumentation.counter("nskit.mixer.template_renders"), 0)
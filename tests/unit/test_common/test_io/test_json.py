@@ -1,6 +1,8 @@
 import json as py_json
+import tempfile
 import unittest
-from io import StringIO
+from io import BytesIO, StringIO
+from pathlib import Path
 
 from nskit.common.io import json
 
@@ -36,3 +38,19 @@ class JSONTestCase(unittest.TestCase):
 
     def test_py_json_dumps(self):
         self.assertEqual(json.loads(py_json.dumps({"a": 1})), {"a": 1})
+
+    def test_loads_bytes(self):
+        self.assertEqual(json.loads('{"a": "é"}'.encode()), {"a": "é"})
+
+    def test_load_binary(self):
+        self.assertEqual(json.load(BytesIO(b'{"a": 1}')), {"a": 1})
+
+    def test_dumps_bytes(self):
+        self.assertEqual(json.dumps_bytes({"a": "é"}), '{"a":"é"}'.encode())
+
+    def test_dump_to_path(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "a.json"
+            json.dump_to_path({"a": "é"}, path)
+            self.assertEqual(path.read_bytes(), '{"a":"é"}'.encode())
+            self.assertEqual(json.loads(path.read_bytes()), {"a": "é"})
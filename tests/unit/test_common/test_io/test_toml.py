@@ -1,6 +1,6 @@
 import sys
 import unittest
-from io import StringIO
+from io import BytesIO, StringIO
 
 if sys.version_info.major <= 3 and sys.version_info.minor < 11:
     import tomlkit as py_toml
@@ -42,3 +42,24 @@ class TOMLTestCase(unittest.TestCase):
             self.assertEqual(py_toml.parse(toml.dumps({"a": 1})), {"a": 1})
         else:
             self.assertEqual(py_toml.loads(toml.dumps({"a": 1})), {"a": 1})
+
+    def test_round_trip_keeps_comments(self):
+        self.assertEqual(toml.dumps(toml.loads("# comment\na = 1\n")), "# comment\na = 1\n")
+
+
+class PlainTOMLTestCase(unittest.TestCase):
+    def test_plain_loads(self):
+        data = toml.plain_loads('a = 1\n[b]\nc = ["x"]\n')
+        self.assertEqual(data, {"a": 1, "b": {"c": ["x"]}})
+        self.assertIs(type(data), dict)
+        self.assertIs(type(data["b"]["c"]), list)
+
+    def test_plain_load_text(self):
+        self.assertEqual(toml.plain_load(StringIO("a = 1\n")), {"a": 1})
+
+    def test_plain_load_binary(self):
+        self.assertEqual(toml.plain_load(BytesIO("a = 'é'\n".encode())), {"a": "é"})
+
+    def test_plain_loads_invalid(self):
+        with self.assertRaises(ValueError):
+            toml.plain_loads("a = \n")
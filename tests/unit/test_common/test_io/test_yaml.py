@@ -1,5 +1,8 @@
+import tempfile
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from io import StringIO
+from pathlib import Path
 
 from nskit.common.io import yaml
 
@@ -29,3 +32,49 @@ class YAMLTestCase(unittest.TestCase):
         yaml.dump(yaml.load(s), s2)
         s2.seek(0)
         self.assertEqual(yaml.load(s2), {"a": 1})
+
+    def test_round_trip_keeps_comments(self):
+        self.assertEqual(yaml.dumps(yaml.loads("# comment\na: 1\n")), "# comment\na: 1\n")
+
+    def test_cached_instances(self):
+        self.assertIs(yaml._yaml("rt"), yaml._yaml("rt"))
+        self.assertIsNot(yaml._yaml("rt"), yaml._yaml("safe"))
+        # Instances aren't shared between threads
+        with ThreadPoolExecutor(1) as executor:
+            self.assertIsNot(executor.submit(yaml._yaml, "rt").result(), yaml._yaml("rt"))
+
+    def test_threaded(self):
+        with ThreadPoolExecutor(4) as executor:
+            results = list(executor.map(lambda i: yaml.loads(yaml.dumps({"a": i})), range(50)))
+        self.assertEqual(results, [{"a": i} for i in range(50)])
+
+
+class SafeYAMLTestCase(unittest.TestCase):
+    def test_safe_loads(self):
+        self.assertEqual(yaml.safe_loads("a: 1\nb: [x, y]\n"), {"a": 1, "b": ["x", "y"]})
+        self.assertIs(type(yaml.safe_loads("a: 1\n")), dict)
+
+    def test_safe_load(self):
+        self.assertEqual(yaml.safe_load(StringIO("a: 1\n")), {"a": 1})
+
+    def test_safe_dumps(self):
+        self.assertEqual(yaml.safe_dumps({"b": 1, "a": {"c": [1, 2]}}), "b: 1\na:\n  c:\n  - 1\n  - 2\n")
+
+    def test_safe_dump(self):
+        s = StringIO()
+        yaml.safe_dump({"b": 1, "a": 2}, s)
+        self.assertEqual(s.getvalue(), "b: 1\na: 2\n")
+
+    def test_safe_loads_invalid(self):
+        with self.assertRaises(yaml.YAMLError):
+            yaml.safe_loads("a: [1\n")
+
+    def test_safe_loads_unsafe_tag(self):
+        with self.assertRaises(yaml.YAMLError):
+            yaml.safe_loads("a: !!python/object/apply:os.getcwd []\n")
+
+    def test_safe_dump_to_path(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "a.yml"
+            yaml.safe_dump_to_path({"b": "é", "a": 2}, path)
+            self.assertEqual(path.read_bytes(), "b: é\na: 2\n".encode())
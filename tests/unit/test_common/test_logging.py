@@ -1,9 +1,19 @@
+import io
+import logging
+import sys
 import unittest
-from logging import LoggerAdapter
+from logging import LoggerAdapter, NullHandler
+from logging.handlers import QueueHandler
+from pathlib import Path
+from unittest.mock import patch
 
 from logzero.jsonlogger import JsonFormatter
 
-from nskit.common.logging import LibraryLoggerFactory, get_library_logger, get_logger
+from nskit.common.contextmanagers import Env
+from nskit.common.io import json
+from nskit.common.logging import LOGGER_REGISTRY, LibraryLoggerFactory, get_library_logger, get_logger
+from nskit.common.logging import logger as logger_module
+from nskit.common.logging.formatter import JsonLogFormatter
 
 
 class LoggerTestCase(unittest.TestCase):
@@ -29,3 +39,152 @@ class LoggerTestCase(unittest.TestCase):
         logger = get_library_logger("nskit", "0.0.0", "nskit.test")
         self.assertIsInstance(logger, LoggerAdapter)
         self.assertEqual(logger.extra, {"library": {"name": "nskit", "version": "0.0.0"}})
+
+
+class LoggerRegistryTestCase(unittest.TestCase):
+    def setUp(self):
+        LOGGER_REGISTRY.clear()
+        self.addCleanup(LOGGER_REGISTRY.clear)
+
+    def test_configured_once(self):
+        with patch.object(logger_module, "setup_logger", wraps=logger_module.setup_logger) as setup_logger:
+            first = get_logger("nskit.test.registry")
+            second = get_logger("nskit.test.registry")
+            setup_logger.assert_called_once()
+        self.assertIs(first.logger, second.logger)
+
+    def test_config_change(self):
+        with patch.object(logger_module, "setup_logger", wraps=logger_module.setup_logger) as setup_logger:
+            get_logger("nskit.test.registry", config={"json_format": True})
+            logger = get_logger("nskit.test.registry", config={"json_format": False})
+            self.assertEqual(setup_logger.call_count, 2)
+        self.assertNotIsInstance(logger.logger.handlers[0].formatter, JsonFormatter)
+
+    def test_environment_change(self):
+        with patch.object(logger_module, "setup_logger", wraps=logger_module.setup_logger) as setup_logger:
+            get_logger("nskit.test.registry")
+            with Env(override={"LOGLEVEL": "ERROR"}):
+                logger = get_logger("nskit.test.registry")
+            # Env logs too
+            calls = [call for call in setup_logger.call_args_list if call.args[0] == "nskit.test.registry"]
+            self.assertEqual(len(calls), 2)
+        self.assertEqual(logger.logger.level, 40)
+
+    def test_handlers_changed(self):
+        logger = get_logger("nskit.test.registry")
+        logger.logger.handlers = [NullHandler()]
+        with patch.object(logger_module, "setup_logger", wraps=logger_module.setup_logger) as setup_logger:
+            logger = get_logger("nskit.test.registry")
+            setup_logger.assert_called_once()
+        self.assertTrue(any(not isinstance(handler, NullHandler) for handler in logger.logger.handlers))
+
+    def test_config_copied(self):
+        logger = get_library_logger("nskit", "0.0.0", "nskit.test.registry", extra={"a": 1})
+        other = get_library_logger("nskit", "0.0.0", "nskit.test.registry")
+        self.assertEqual(logger.extra, {"a": 1, "library": {"name": "nskit", "version": "0.0.0"}})
+        self.assertEqual(other.extra, {"library": {"name": "nskit", "version": "0.0.0"}})
+
+
+class JsonLogFormatterTestCase(unittest.TestCase):
+    def _record(self, **kwargs):
+        return logging.LogRecord("nskit.test", logging.INFO, __file__, 1, "a %s", ("b",), None, **kwargs)
+
+    def test_format(self):
+        record = self._record()
+        record.extra = {"c": 1, "path": Path("d")}
+        data = json.loads(JsonLogFormatter().format(record))
+        self.assertEqual(data["message"], "a b")
+        self.assertEqual(data["levelname"], "INFO")
+        self.assertEqual(data["name"], "nskit.test")
+        self.assertEqual(data["extra"], {"c": 1, "path": "d"})
+        self.assertNotIn("exc_info", data)
+
+    def test_format_exception(self):
+        try:
+            raise ValueError("bad")
+        except ValueError:
+            record = logging.LogRecord("nskit.test", logging.ERROR, __file__, 1, "failed", (), sys.exc_info())
+        data = json.loads(JsonLogFormatter().format(record))
+        self.assertIn("ValueError: bad", data["exc_info"])
+
+    def test_logger(self):
+        LOGGER_REGISTRY.clear()
+        self.addCleanup(LOGGER_REGISTRY.clear)
+        logger = get_logger("nskit.test.orjson", config={"json_format": True, "json_formatter": "orjson"})
+        self.assertIsInstance(logger.logger.handlers[0].formatter, JsonLogFormatter)
+        with Env(override={"LOG_JSON_FORMATTER": "orjson"}):
+            logger = get_logger("nskit.test.orjson")
+        self.assertIsInstance(logger.logger.handlers[0].formatter, JsonLogFormatter)
+
+
+class QueuedLoggerTestCase(unittest.TestCase):
+    def setUp(self):
+        LOGGER_REGISTRY.clear()
+        self.addCleanup(LOGGER_REGISTRY.clear)
+        self.addCleanup(LOGGER_REGISTRY.stop_queue)
+        self.stream = io.StringIO()
+        # Start from a fresh logger (pytest attaches its capture handlers to non-propagating loggers)
+        LOGGER_REGISTRY._dispatcher.handlers.pop("nskit.test.queue", None)
+        logging.getLogger("nskit.test.queue").handlers = []
+
+    def _get_logger(self, queue=True):
+        logger = get_logger("nskit.test.queue", config={"queue": queue, "json_formatter": "orjson"})
+        for handler in LOGGER_REGISTRY._dispatcher.handlers.get("nskit.test.queue", logger.logger.handlers):
+            if isinstance(handler, logging.StreamHandler):
+                handler.setStream(self.stream)
+        return logger
+
+    def test_queued(self):
+        logger = self._get_logger()
+        self.assertEqual(len(logger.logger.handlers), 1)
+        self.assertIsInstance(logger.logger.handlers[0], QueueHandler)
+        logger.info("queued", a=1)
+        LOGGER_REGISTRY.stop_queue()
+        data = json.loads(self.stream.getvalue())
+        self.assertEqual(data["message"], "queued")
+        self.assertEqual(data["extra"]["a"], 1)
+        # Set up again (with a new listener) on next use
+        logger = self._get_logger()
+        logger.info("again")
+        LOGGER_REGISTRY.stop_queue()
+        self.assertEqual(len(self.stream.getvalue().splitlines()), 2)
+
+    def _log_exception(self, queue):
+        self.stream.seek(0)
+        self.stream.truncate()
+        logger = self._get_logger(queue=queue)
+        try:
+            raise ValueError("a")
+        except ValueError:
+            logger.error("failed %s", "b", exc_info=True, c=1)
+        LOGGER_REGISTRY.stop_queue()
+        return json.loads(self.stream.getvalue())
+
+    def test_queued_exception(self):
+        queued = self._log_exception(queue=True)
+        unqueued = self._log_exception(queue=False)
+        self.assertEqual(queued["message"], "failed b")
+        self.assertIn("ValueError: a", queued["exc_info"])
+        self.assertEqual(queued["extra"]["c"], 1)
+        self.assertEqual(
+            {key: value for key, value in queued.items() if key not in ("asctime", "lineno")},
+            {key: value for key, value in unqueued.items() if key not in ("asctime", "lineno")},
+        )
+
+    def test_stop_queue_keeps_logging(self):
+        logger = self._get_logger()
+        logger.info("queued")
+        LOGGER_REGISTRY.stop_queue()
+        # The logger is still held (e.g. at module level), so it is now unqueued
+        self.assertNotIsInstance(logger.logger.handlers[0], QueueHandler)
+        logger.info("after")
+        self.assertEqual(
+            [json.loads(line)["message"] for line in self.stream.getvalue().splitlines()], ["queued", "after"]
+        )
+
+    def test_unqueued(self):
+        self._get_logger()
+        logger = self._get_logger(queue=False)
+        self.assertNotIn("nskit.test.queue", LOGGER_REGISTRY._dispatcher.handlers)
+        self.assertEqual(len(logger.logger.handlers), 1)
+        self.assertNotIsInstance(logger.logger.handlers[0], QueueHandler)
@@ -0,0 +1,197 @@
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from nskit.common import process
+from nskit.common.contextmanagers import Env
+from nskit.common.instrumentation import InMemoryInstrumentation, set_instrumentation
+from nskit.common.process import CommandRecord, ProcessStats, ProcessTimeouts, operation_name, recording
+from nskit.mixer.hooks.git import GitInit
+
+_PYTHON = [sys.executable, "-c"]
+
+
+class OperationNameTestCase(unittest.TestCase):
+    def test_operation_name(self):
+        self.assertEqual(operation_name(["git", "commit", "-m", "a"]), "git commit")
+        self.assertEqual(operation_name(["git", "-C", "path", "status"]), "git status")
+        self.assertEqual(operation_name(["/usr/bin/docker", "--version"]), "docker")
+        self.assertEqual(operation_name(["docker.exe", "pull", "a"]), "docker pull")
+        self.assertEqual(operation_name([Path("/venv/bin/python"), "-m", "pip", "install", "a"]), "pip install")
+        self.assertEqual(operation_name(["git"]), "git")
+        self.assertEqual(operation_name(["curl", "-L", "-o", "/tmp/tmpabc.tar.gz", "https://a/b"]), "curl")
+        self.assertEqual(operation_name(["python", "-m", "venv", ".venv"]), "venv")
+        self.assertEqual(operation_name(["pre-commit", "install"]), "pre-commit install")
+        self.assertEqual(operation_name([]), "")
+
+
+class ProcessStatsTestCase(unittest.TestCase):
+    def test_stats(self):
+        stats = ProcessStats(maxlen=2)
+        stats.record(CommandRecord("git status", ("git", "status"), 1.0, 0))
+        stats.record(CommandRecord("git commit", ("git", "commit"), 2.0, 1))
+        stats.record(CommandRecord("gitlab", ("gitlab",), 4.0, None, timed_out=True))
+        self.assertEqual(stats.counts(), {"git status": 1, "git commit": 1, "gitlab": 1})
+        self.assertEqual(stats.invocations("git"), 2)
+        self.assertEqual(stats.invocations("git commit"), 1)
+        self.assertEqual(stats.invocations(), 3)
+        self.assertEqual(stats.failures(), 2)
+        self.assertEqual(stats.duration("git"), 3.0)
+        self.assertEqual([record.operation for record in stats.records], ["git commit", "gitlab"])
+        stats.clear()
+        self.assertEqual(stats.invocations(), 0)
+        self.assertEqual(stats.records, [])
+
+
+class RunnerTestCase(unittest.TestCase):
+    def test_run(self):
+        with recording() as stats:
+            result = process.run(_PYTHON + ["print('a')"], capture_output=True, text=True, operation="test")
+        self.assertEqual(result.stdout, "a\n")
+        (record,) = stats.records
+        self.assertEqual((record.operation, record.returncode, record.timed_out), ("test", 0, False))
+        self.assertGreater(record.duration, 0)
+        self.assertGreaterEqual(process.PROCESS_STATS.invocations("test"), 1)
+
+    def test_failure(self):
+        with recording() as stats:
+            with self.assertRaises(subprocess.CalledProcessError):
+                process.check_call(_PYTHON + ["raise SystemExit(3)"], operation="test")
+            self.assertEqual(process.call(_PYTHON + ["raise SystemExit(2)"], operation="test"), 2)
+        self.assertEqual([record.returncode for record in stats.records], [3, 2])
+        self.assertEqual(stats.failures("test"), 2)
+
+    def test_not_found(self):
+        with recording() as stats:
+            with self.assertRaises(FileNotFoundError):
+                process.run(["nskit-does-not-exist"])
+        self.assertEqual(stats.invocations("nskit-does-not-exist"), 1)
+        self.assertIsNone(stats.records[0].returncode)
+
+    def test_timeout(self):
+        with recording() as stats:
+            with self.assertRaises(subprocess.TimeoutExpired):
+                process.run(_PYTHON + ["import time; time.sleep(5)"], timeout=0.1, operation="test")
+        self.assertTrue(stats.records[0].timed_out)
+
+    def test_default_timeout(self):
+        with patch.object(process.subprocess, "run") as mock_run:
+            with Env(override={"NSKIT_SUBPROCESS_TIMEOUT": "30"}):
+                process.run(["git", "status"])
+                process.run(["git", "status"], timeout=5)
+                process.run(["pip", "install", "a"])
+            with Env(override={"NSKIT_SUBPROCESS_TIMEOUT": "0"}):
+                process.run(["git", "status"])
+            with Env(override={"NSKIT_SUBPROCESS_TIMEOUT": "invalid"}):
+                process.run(["git", "status"])
+            with Env(remove=["NSKIT_SUBPROCESS_TIMEOUT"]):
+                process.run(["git", "status"])
+                process.run(["git", "clone", "url"])
+                process.run(["python", "-m", "pip", "install", "a"])
+                process.run(["pre_commit", "install"])
+                process.run(["unknown"])
+        self.assertEqual(
+            [call.kwargs for call in mock_run.call_args_list],
+            [
+                {"timeout": 30.0},
+                {"timeout": 5},
+                {"timeout": 30.0},
+                {},
+                {"timeout": 60},
+                {"timeout": 60},
+                {"timeout": 600},
+                {},
+                {},
+                {},
+            ],
+        )
+
+    def test_git_commit_no_default_timeout(self):
+        # Commits can run pre-commit hooks, which install their environments on first use, so they aren't killed
+        with (
+            patch.object(process.subprocess, "check_call") as mock_check_call,
+            Env(remove=["NSKIT_SUBPROCESS_TIMEOUT"]),
+        ):
+            process.check_call(["git", "add", "."])
+            process.check_call(["git", "commit", "-m", "x"])
+            process.check_call(["git", "-C", "repo", "commit", "--no-verify", "-m", "x"])
+            process.check_call(["git", "status"])
+        self.assertEqual([call.kwargs for call in mock_check_call.call_args_list], [{}, {}, {}, {"timeout": 60}])
+
+    def test_process_timeouts(self):
+        timeouts = ProcessTimeouts(default=10, operations={"git": 5, "git clone": None})
+        self.assertEqual(timeouts.get("git status"), 5)
+        self.assertIsNone(timeouts.get("git clone"))
+        self.assertEqual(timeouts.get("gitlab"), 10)
+        self.assertEqual(ProcessTimeouts().get("docker pull"), None)
+        self.assertEqual(ProcessTimeouts().get("docker image"), 60)
+
+    def test_popen_timeout(self):
+        with recording() as stats:
+            with self.assertRaises(subprocess.TimeoutExpired):
+                with process.popen(_PYTHON + ["import time; time.sleep(5)"], timeout=0.1, operation="test"):
+                    pass
+        (record,) = stats.records
+        self.assertTrue(record.timed_out)
+
+    def test_popen(self):
+        with recording() as stats:
+            with process.popen(_PYTHON + ["import sys; sys.exit(len(sys.stdin.read()))"], stdin=subprocess.PIPE) as p:
+                p.stdin.write(b"abc")
+                p.stdin.close()
+        self.assertEqual(p.returncode, 3)
+        self.assertEqual(stats.records[0].returncode, 3)
+
+    def test_instrumentation(self):
+        instrumentation = InMemoryInstrumentation()
+        set_instrumentation(instrumentation)
+        self.addCleanup(set_instrumentation, None)
+        process.check_output(_PYTHON + ["pass"], operation="test")
+        (record,) = instrumentation.find("nskit.subprocess")
+        self.assertEqual(record.attributes, {"operation": "test", "returncode": 0})
+        self.assertEqual(instrumentation.counter("nskit.subprocess.invocations", operation="test", succeeded=True), 1)
+
+    def test_cached_output(self):
+        process.clear_cached_outputs()
+        self.addCleanup(process.clear_cached_outputs)
+        with recording() as stats:
+            first = process.cached_output(_PYTHON + ["print(1)"])
+            second = process.cached_output(_PYTHON + ["print(1)"])
+            with Env(override={"NSKIT_CACHE": "0"}):
+                process.cached_output(_PYTHON + ["print(1)"])
+        self.assertEqual(first, second)
+        self.assertEqual(stats.invocations(), 2)
+
+    def test_cached_output_env(self):
+        process.clear_cached_outputs()
+        self.addCleanup(process.clear_cached_outputs)
+        code = ["import os; print(os.environ['NSKIT_TEST_VALUE'])"]
+        with recording() as stats:
+            a = process.cached_output(_PYTHON + code, env={**os.environ, "NSKIT_TEST_VALUE": "a"}, text=True)
+            b = process.cached_output(_PYTHON + code, env={**os.environ, "NSKIT_TEST_VALUE": "b"}, text=True)
+            again = process.cached_output(_PYTHON + code, env={**os.environ, "NSKIT_TEST_VALUE": "a"}, text=True)
+        self.assertEqual((a, b, again), ("a\n", "b\n", "a\n"))
+        self.assertEqual(stats.invocations(), 2)
+
+    def test_cached_output_unhashable(self):
+        with self.assertRaisesRegex(TypeError, "bytearray"):
+            process.cached_output(_PYTHON + ["pass"], input=bytearray(b"a"))
+
+
+class GitInitTestCase(unittest.TestCase):
+    def test_git_invocations(self):
+        process.clear_cached_outputs()
+        self.addCleanup(process.clear_cached_outputs)
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = [Path(tmp) / "a", Path(tmp) / "b"]
+            with recording() as stats:
+                for path in paths:
+                    path.mkdir()
+                    GitInit()(path, {})
+        # git version is only run once
+        self.assertEqual(stats.invocations("git version"), 1)
+        self.assertLessEqual(stats.invocations("git"), 7)
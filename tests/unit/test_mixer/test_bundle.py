@@ -0,0 +1,124 @@
+"""Tests for recipe bundles (nskit.mixer.bundle)."""
+
+import json
+import unittest
+import zipfile
+from pathlib import Path
+from unittest.mock import patch
+
+import jinja2
+
+from nskit.common.contextmanagers import ChDir
+from nskit.mixer import File, Folder, Recipe
+from nskit.mixer import __file__ as mixer_init
+from nskit.mixer.bundle import BundleError, build_bundle, load_bundle
+from nskit.mixer.components.license_file import get_license_filename
+from nskit.mixer.utilities import RENDER_MEMO
+
+
+def _content(context):
+    return "callable {{value}}"
+
+
+class BundleRecipe(Recipe):
+    value: str = "a"
+    contents: list = [
+        File(name="a.txt", content="{{value}}\n"),
+        File(name="resource.py", content="nskit.mixer:__init__.py"),
+        File(name="static.py", content="nskit.mixer:__init__.py", static=True),
+        File(name="callable.txt", content=_content),
+        Folder(
+            name="{{value}}_folder",
+            when="value != 'skip'",
+            contents=[File(name="b.bin", content=b"\x00\x01"), File(name="COPYING", content="x")],
+        ),
+    ]
+
+
+class BundleTestCase(unittest.TestCase):
+    def test_round_trip(self):
+        with ChDir():
+            path = build_bundle(BundleRecipe, "recipe.nskit-bundle")
+            bundle = load_bundle(path)
+            self.assertEqual(bundle.name, "BundleRecipe")
+            self.assertIs(bundle.recipe_class, BundleRecipe)
+            self.assertIn("value", [field["name"] for field in bundle.fields["fields"]])
+            expected = BundleRecipe(name="out", value="b").dryrun(base_path=Path.cwd())
+            recipe = bundle.recipe(name="out", value="b")
+            tree = recipe.dryrun(base_path=Path.cwd())
+            # Static files map to their (extracted) source, so compare them separately
+            static_path = Path.cwd() / "out" / "static.py"
+            self.assertEqual(tree[Path.cwd() / "out"].pop(static_path).read_bytes(), Path(mixer_init).read_bytes())
+            expected[Path.cwd() / "out"].pop(static_path)
+            self.assertEqual(tree, expected)
+            self.assertEqual(recipe.extension_name, "BundleRecipe")
+            recipe.create(base_path=Path.cwd())
+            self.assertEqual(Path("out/b_folder/b.bin").read_bytes(), b"\x00\x01")
+            bundle.cleanup()
+
+    def test_context_manager(self):
+        with ChDir():
+            path = build_bundle(BundleRecipe, "recipe.nskit-bundle")
+            with load_bundle(path) as bundle:
+                bundle.recipe(name="out").create(base_path=Path.cwd())
+                static_dir = bundle._static_dir
+                self.assertTrue(static_dir.exists())
+            self.assertFalse(static_dir.exists())
+            self.assertTrue(Path("out/static.py").exists())
+
+    def test_templates_precompiled(self):
+        with ChDir():
+            path = build_bundle(BundleRecipe, "recipe.nskit-bundle")
+            RENDER_MEMO.clear()
+            load_bundle(path)
+            # The templates are registered, so rendering doesn't compile them again
+            self.assertGreaterEqual(len(RENDER_MEMO._templates), 3)
+
+    def test_templates_not_parsed(self):
+        with ChDir():
+            path = build_bundle(BundleRecipe, "recipe.nskit-bundle")
+            RENDER_MEMO.clear()
+            with patch.object(
+                jinja2.Environment, "parse", autospec=True, side_effect=jinja2.Environment.parse
+            ) as parse:
+                bundle = load_bundle(path)
+                bundle.recipe(name="out", value="b").dryrun(base_path=Path.cwd())
+            bundle.cleanup()
+            # Only the template returned by the content callable (not known when bundling) is parsed
+            self.assertEqual([c.args[1] for c in parse.call_args_list], ["callable {{value}}"])
+
+    def test_manifest_verified(self):
+        with ChDir():
+            path = build_bundle(BundleRecipe, "recipe.nskit-bundle")
+            with zipfile.ZipFile(path) as archive:
+                members = {name: archive.read(name) for name in archive.namelist()}
+            metadata = json.loads(members["bundle.json"])
+            template = next(name for name in members if name.endswith(".jinja"))
+            members[template] = b"tampered"
+            with zipfile.ZipFile(path, "w") as archive:
+                for name, data in members.items():
+                    archive.writestr(name, data)
+            self.assertIn(template, metadata["manifest"])
+            with self.assertRaises(BundleError):
+                load_bundle(path)
+
+    def test_unbundleable_callable(self):
+        class LambdaRecipe(Recipe):
+            contents: list = [File(name="a.txt", content=lambda context: "a")]
+
+        with ChDir():
+            with self.assertRaises(BundleError):
+                build_bundle(LambdaRecipe, "recipe.nskit-bundle")
+
+    def test_unknown_recipe(self):
+        with ChDir():
+            with self.assertRaises(BundleError):
+                build_bundle("missing", "recipe.nskit-bundle")
+
+    def test_builtin_recipe(self):
+        with ChDir():
+            bundle = load_bundle(build_bundle("python_package", "package.nskit-bundle"))
+            self.assertEqual(bundle.name, "python_package")
+            self.assertIn(
+                f"{get_license_filename.__module__}:get_license_filename", json.dumps(bundle.metadata["tree"])
+            )
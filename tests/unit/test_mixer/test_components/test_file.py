@@ -1,9 +1,9 @@
 import unittest
 from pathlib import Path
 
-from nskit.common.contextmanagers import ChDir
+from nskit.common.contextmanagers import ChDir, Env
 from nskit.mixer.components.file import File
-from nskit.mixer.utilities import Resource
+from nskit.mixer.utilities import Resource, StaticSource
 
 
 class FileTestCase(unittest.TestCase):
@@ -153,3 +153,55 @@ class FileTestCase(unittest.TestCase):
     def test_define_with_resource_string(self):
         f = File(name="test.txt", content="nskit.mixer:__init__.py")
         self.assertNotEqual(f.render_content({}), "nskit.mixer:__init__.py")
+
+    def test_when_false(self):
+        def content(context):
+            raise AssertionError("Content should not be rendered")
+
+        f = File(name="test.txt", content=content, when="include")
+        with ChDir():
+            self.assertEqual(f.write(Path.cwd(), {"include": False}), {})
+            self.assertFalse(Path("test.txt").exists())
+            self.assertEqual(f.dryrun(Path.cwd(), {"include": False}), {})
+            self.assertEqual(f.validate(Path.cwd(), {"include": False}), ([], [], []))
+            self.assertEqual(f.dependencies(Path.cwd(), {"include": False}), {})
+
+    def test_when_true(self):
+        f = File(name="test.txt", content="a", when="include")
+        with ChDir():
+            self.assertEqual(f.write(Path.cwd(), {"include": True}), {Path("test.txt").absolute(): "a"})
+            self.assertEqual(f.dependencies(Path.cwd(), {"include": True}), {Path("test.txt").absolute(): {"include"}})
+
+    def test_static_path(self):
+        with ChDir():
+            Path("asset.bin").write_bytes(b"\x00\xff{{a}}")
+            f = File(name="out.bin", content=Path("asset.bin").absolute(), static=True)
+            expected = {Path("out.bin").absolute(): StaticSource(Path("asset.bin").absolute())}
+            self.assertEqual(f.dryrun(Path.cwd(), {"a": 1}), expected)
+            self.assertEqual(f.write(Path.cwd(), {"a": 1}), expected)
+            self.assertEqual(Path("out.bin").read_bytes(), b"\x00\xff{{a}}")
+            self.assertEqual(f.render_content({"a": 1}), b"\x00\xff{{a}}")
+            self.assertEqual(f.validate(Path.cwd(), {}), ([], [], [Path("out.bin").absolute()]))
+            Path("out.bin").write_bytes(b"changed")
+            self.assertEqual(f.validate(Path.cwd(), {}), ([], [Path("out.bin").absolute()], []))
+            self.assertEqual(f.template_variables(), frozenset())
+
+    def test_static_resource(self):
+        with ChDir():
+            f = File(name="out.py", content="nskit.mixer:__init__.py", static=True)
+            value = f.write(Path.cwd(), {})[Path("out.py").absolute()]
+            self.assertEqual(Path("out.py").read_text(), Resource("nskit.mixer:__init__.py").load())
+            # The value is a marker, not the resource string (which could be mistaken for the content)
+            self.assertNotIsInstance(value, str)
+            self.assertEqual(value, StaticSource(Resource("nskit.mixer:__init__.py")))
+            self.assertEqual(value.read_bytes(), Path("out.py").read_bytes())
+
+    def test_static_requires_path_or_resource(self):
+        with self.assertRaises(ValueError):
+            File(name="out.txt", content="abc", static=True)
+
+    def test_ignores_environment(self):
+        with Env(override={"CONTENT": "from env", "WHEN": "false"}):
+            f = File(name="test.txt")
+        self.assertEqual(f.content, "")
+        self.assertIsNone(f.when)
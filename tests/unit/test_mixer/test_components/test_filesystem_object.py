@@ -1,8 +1,8 @@
 import unittest
-from pathlib import Path
+from pathlib import Path, PurePath
 from unittest.mock import patch
 
-from nskit.mixer.components.filesystem_object import FileSystemObject, TemplateStr
+from nskit.mixer.components.filesystem_object import FileSystemObject, PathSelector, TemplateStr
 
 
 class TemplateStrTestCase(unittest.TestCase):
@@ -16,6 +16,64 @@ class TemplateStrTestCase(unittest.TestCase):
         self.assertEqual(t({"b": 3}), "a3")
 
 
+class PathSelectorTestCase(unittest.TestCase):
+    def setUp(self):
+        self.root = Path("root").absolute()
+
+    def test_literal(self):
+        selector = PathSelector(self.root, ["a/b.txt", PurePath("c.txt")])
+        self.assertTrue(selector.includes_file(self.root / "a" / "b.txt"))
+        self.assertTrue(selector.includes_file(self.root / "c.txt"))
+        self.assertFalse(selector.includes_file(self.root / "a" / "c.txt"))
+        self.assertTrue(selector.includes_folder(self.root))
+        self.assertTrue(selector.includes_folder(self.root / "a"))
+        self.assertFalse(selector.includes_folder(self.root / "b"))
+        self.assertFalse(selector.includes_file(Path("other/c.txt").absolute()))
+
+    def test_literal_folder(self):
+        selector = PathSelector(self.root, ["src/pkg", PurePath("docs")])
+        self.assertTrue(selector.includes_folder(self.root / "src" / "pkg"))
+        self.assertTrue(selector.includes_folder(self.root / "src" / "pkg" / "sub"))
+        self.assertTrue(selector.includes_file(self.root / "src" / "pkg" / "__init__.py"))
+        self.assertTrue(selector.includes_file(self.root / "src" / "pkg" / "sub" / "a.py"))
+        self.assertTrue(selector.includes_file(self.root / "docs" / "index.md"))
+        self.assertFalse(selector.includes_file(self.root / "src" / "other.py"))
+        self.assertFalse(selector.includes_file(self.root / "src" / "pkg2" / "a.py"))
+        self.assertFalse(selector.includes_folder(self.root / "src" / "pkg2"))
+
+    def test_nothing_selected(self):
+        selector = PathSelector(self.root, [])
+        self.assertTrue(selector.includes_folder(self.root))
+        self.assertFalse(selector.includes_folder(self.root / "a"))
+        self.assertFalse(selector.includes_file(self.root / "a.txt"))
+
+    def test_glob(self):
+        selector = PathSelector(self.root, ["src/*.py"])
+        self.assertTrue(selector.includes_file(self.root / "src" / "a.py"))
+        self.assertFalse(selector.includes_file(self.root / "src" / "pkg" / "a.py"))
+        self.assertFalse(selector.includes_file(self.root / "a.py"))
+        self.assertTrue(selector.includes_folder(self.root / "src"))
+        self.assertFalse(selector.includes_folder(self.root / "docs"))
+        self.assertFalse(selector.includes_folder(self.root / "src" / "pkg" / "sub"))
+
+    def test_recursive_glob(self):
+        selector = PathSelector(self.root, ["**/*.toml", "docs/**"])
+        self.assertTrue(selector.includes_file(self.root / "pyproject.toml"))
+        self.assertTrue(selector.includes_file(self.root / "a" / "b" / "c.toml"))
+        self.assertFalse(selector.includes_file(self.root / "a" / "b" / "c.txt"))
+        self.assertTrue(selector.includes_folder(self.root / "a" / "b"))
+        self.assertTrue(selector.includes_file(self.root / "docs" / "guides" / "index.md"))
+
+    def test_literal_path_not_glob(self):
+        selector = PathSelector(self.root, [PurePath("[a].txt")])
+        self.assertTrue(selector.includes_file(self.root / "[a].txt"))
+        self.assertFalse(selector.includes_file(self.root / "a.txt"))
+        # Strings are treated as patterns, but still match literally
+        selector = PathSelector(self.root, ["[a].txt"])
+        self.assertTrue(selector.includes_file(self.root / "[a].txt"))
+        self.assertTrue(selector.includes_file(self.root / "a.txt"))
+
+
 class FileSystemObjectTestCase(unittest.TestCase):
     def setUp(self):
         self._patch = patch.object(FileSystemObject, "__abstractmethods__", set())
@@ -114,3 +172,24 @@ class FileSystemObjectTestCase(unittest.TestCase):
     def test_validate(self):
         with self.assertRaises(NotImplementedError):
             FileSystemObject(name="a").validate(None, {})
+
+    def test_is_included_default(self):
+        f = FileSystemObject(name="a")
+        self.assertTrue(f.is_included({}))
+
+    def test_is_included_expression(self):
+        f = FileSystemObject(name="a", when="repo.docker and language == 'python'")
+        self.assertTrue(f.is_included({"repo": {"docker": True}, "language": "python"}))
+        self.assertFalse(f.is_included({"repo": {"docker": False}, "language": "python"}))
+        self.assertFalse(f.is_included({}))
+
+    def test_is_included_callable(self):
+        f = FileSystemObject(name="a", when=lambda context: context.get("b"))
+        self.assertTrue(f.is_included({"b": 1}))
+        self.assertFalse(f.is_included({"b": 0}))
+
+    def test_template_variables_when(self):
+        self.assertEqual(
+            FileSystemObject(name="{{a}}", when="b and c.d").template_variables(), frozenset({"a", "b", "c"})
+        )
+        self.assertIsNone(FileSystemObject(name="a", when=lambda context: True).template_variables())
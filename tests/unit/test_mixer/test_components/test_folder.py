@@ -4,6 +4,7 @@ from pathlib import Path
 
 from nskit.common.contextmanagers import ChDir
 from nskit.mixer.components.file import File
+from nskit.mixer.components.filesystem_object import PathSelector
 from nskit.mixer.components.folder import Folder
 
 
@@ -208,3 +209,67 @@ class FolderTestCase(unittest.TestCase):
             out,
             "test = Folder(name: test):\n|- folder = Folder(id: a, name: folder):\n  |- test{{a}}.txt = File(id: b, name <TemplateStr>: test{{a}}.txt)\n|- folder2 = Folder(id: b, name: folder2):\n  |- test2.txt = File(id: b, name: test2.txt)",
         )
+
+    def test_write_selector(self):
+        with ChDir():
+            selector = PathSelector(Path.cwd() / "test", ["folder2/test2.txt"])
+            path_contents = self._folder.write(Path.cwd(), {"a": 1}, selector=selector)
+            self.assertFalse(Path("test/folder").exists())
+            with open("test/folder2/test2.txt") as fp:
+                self.assertEqual(fp.read(), "test21")
+            self.assertEqual(
+                path_contents,
+                {
+                    Path("test").absolute(): {
+                        Path("test/folder2").absolute(): {Path("test/folder2/test2.txt").absolute(): "test21"}
+                    }
+                },
+            )
+
+    def test_dryrun_selector_empty(self):
+        self.assertEqual(self._folder.dryrun(Path.cwd(), {"a": 1}, selector=PathSelector(Path.cwd(), [])), {})
+
+    def test_dependencies(self):
+        folder = Folder(
+            name="test",
+            contents=[
+                Folder(name="{{b}}", contents=[File(name="test{{a}}.txt", content="{{c}}")]),
+                File(name="static.txt", content="static"),
+                File(name="callable.txt", content=lambda context: "x"),
+            ],
+        )
+        dependencies = folder.dependencies(Path.cwd(), {"a": 1, "b": "x"})
+        self.assertEqual(
+            dependencies,
+            {
+                Path("test/x/test1.txt").absolute(): frozenset({"a", "b", "c"}),
+                Path("test/static.txt").absolute(): frozenset(),
+                Path("test/callable.txt").absolute(): None,
+            },
+        )
+
+    def test_when_false_skips_subtree(self):
+        folder = Folder(
+            name="test",
+            contents=[
+                Folder(name="docker", when="docker", contents=[File(name="Dockerfile", content="FROM {{image}}")]),
+                File(name="a.txt", content="a"),
+            ],
+        )
+        with ChDir():
+            self.assertEqual(
+                folder.write(Path.cwd(), {"docker": False}),
+                {Path("test").absolute(): {Path("test/a.txt").absolute(): "a"}},
+            )
+            self.assertFalse(Path("test/docker").exists())
+            missing, errors, ok = folder.validate(Path.cwd(), {"docker": False})
+            self.assertEqual(missing, [])
+            self.assertEqual(errors, [])
+            self.assertNotIn(Path("test/docker").absolute(), ok)
+            self.assertEqual(
+                folder.dependencies(Path.cwd(), {"docker": True}),
+                {
+                    Path("test/docker/Dockerfile").absolute(): frozenset({"docker", "image"}),
+                    Path("test/a.txt").absolute(): frozenset(),
+                },
+            )
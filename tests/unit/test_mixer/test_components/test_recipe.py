@@ -3,14 +3,17 @@ from __future__ import annotations
 import os
 import unittest
 from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 from nskit import __version__
 from nskit.common.configuration import BaseConfiguration
-from nskit.common.contextmanagers import ChDir, TestExtension
+from nskit.common.contextmanagers import ChDir, Env, TestExtension
 from nskit.common.io import yaml
 from nskit.mixer.components.file import File
+from nskit.mixer.components.filesystem_object import PathSelector
 from nskit.mixer.components.folder import Folder
 from nskit.mixer.components.recipe import Recipe
+from nskit.mixer.utilities import io_bound, io_requests
 
 
 class RecipeTestCase(unittest.TestCase):
@@ -154,6 +157,27 @@ class RecipeTestCase(unittest.TestCase):
             },
         )
 
+    def test_affected_paths(self):
+        with ChDir():
+            self.assertEqual(
+                self._complex_recipe.affected_paths({"x"}),
+                {Path("test/folder/test1.txt").absolute(), Path("test/folder2/test2.txt").absolute()},
+            )
+            self.assertEqual(self._complex_recipe.affected_paths({"y"}), set())
+
+    def test_rerender(self):
+        recipe = Recipe(
+            name="test",
+            contents=[File(name="a.txt", content="{{a}}"), File(name="b.txt", content="{{b}}")],
+        )
+        with ChDir():
+            recipe.create(a=1, b=1)
+            Path("test/b.txt").write_text("edited")
+            content = recipe.rerender({"a"}, a=2, b=2)
+            self.assertEqual(content, {Path("test").absolute(): {Path("test/a.txt").absolute(): "2"}})
+            self.assertEqual(Path("test/a.txt").read_text(), "2")
+            self.assertEqual(Path("test/b.txt").read_text(), "edited")
+
     def test_dryrun_no_override(self):
         self.assertEqual(
             self._complex_recipe.dryrun(Path(".")),
@@ -176,6 +200,97 @@ class RecipeTestCase(unittest.TestCase):
             },
         )
 
+    def test_dryrun_paths(self):
+        with patch.object(File, "render_content", autospec=True, side_effect=File.render_content) as render_content:
+            self.assertEqual(
+                self._complex_recipe.dryrun(Path("."), paths=["folder2/*.txt"]),
+                {Path("test"): {Path("test/folder2"): {Path("test/folder2/test2.txt"): "test21"}}},
+            )
+        # The unselected files are not rendered
+        self.assertEqual([call.args[0].name for call in render_content.call_args_list], ["test2.txt"])
+
+    def test_dryrun_paths_and_selector(self):
+        with self.assertRaises(ValueError):
+            self._complex_recipe.dryrun(Path("."), selector=PathSelector(Path("test"), []), paths=["a"])
+
+    def test_create_paths(self):
+        with ChDir():
+            content = self._complex_recipe.create(paths=["folder/test1.txt"])
+            self.assertEqual(
+                content,
+                {
+                    Path("test").absolute(): {
+                        Path("test/folder").absolute(): {Path("test/folder/test1.txt").absolute(): "test"}
+                    }
+                },
+            )
+            self.assertTrue(Path("test/folder/test1.txt").exists())
+            self.assertFalse(Path("test/folder2").exists())
+
+    def test_create_paths_folder(self):
+        with ChDir():
+            content = self._complex_recipe.create(paths=["folder2"])
+            self.assertEqual(
+                content,
+                {
+                    Path("test").absolute(): {
+                        Path("test/folder2").absolute(): {Path("test/folder2/test2.txt").absolute(): "test21"}
+                    }
+                },
+            )
+            self.assertFalse(Path("test/folder").exists())
+
+    def test_create_paths_no_match(self):
+        """The hooks are still run, and the batch file written, if no files are selected."""
+        hook = MagicMock(side_effect=lambda recipe_path, context, **kwargs: (recipe_path, context))
+        self._complex_recipe.post_hooks = [hook]
+        with ChDir():
+            content = self._complex_recipe.create(paths=["missing.txt"])
+            self.assertEqual(content, {Path("test").absolute(): {}})
+            hook.assert_called_once()
+            self.assertTrue(Path("test/.recipe-batch.yaml").exists())
+            self.assertEqual(self._complex_recipe.create(paths=[]), {Path("test").absolute(): {}})
+            self.assertEqual(hook.call_count, 2)
+
+    def test_create_when_false(self):
+        hook = MagicMock()
+        self._complex_recipe.when = "x.a == 2"
+        self._complex_recipe.post_hooks = [hook]
+        with ChDir():
+            self.assertEqual(self._complex_recipe.create(), {})
+            self.assertFalse(Path("test").exists())
+        hook.assert_not_called()
+
+    def test_prefetch_io_bound_content(self):
+        calls = []
+
+        @io_bound
+        def fetch(key):
+            calls.append(key)
+            return f"{key} content"
+
+        @io_requests(lambda context: [(fetch, (context["key"],))])
+        def content(context):
+            return fetch(context["key"])
+
+        recipe = Recipe(
+            name="test",
+            contents=[
+                File(name="a.txt", content=content),
+                Folder(name="b", contents=[File(name="b.txt", content=content)]),
+            ],
+        )
+        self.assertEqual(
+            recipe.dryrun(Path("."), key="x"),
+            {Path("test"): {Path("test/a.txt"): "x content", Path("test/b"): {Path("test/b/b.txt"): "x content"}}},
+        )
+        # Fetched once, ahead of rendering
+        self.assertEqual(calls, ["x"])
+        # Unselected files are not fetched
+        calls.clear()
+        recipe.dryrun(Path("."), paths=["other.txt"], key="y")
+        self.assertEqual(calls, [])
+
     def test_validate_ok(self):
         with ChDir():
             self._complex_recipe.create(Path.cwd())
@@ -317,3 +432,8 @@ class RecipeTestCase(unittest.TestCase):
             out,
             f"test = TestRecipe(name: test):\n|- folder = Folder(id: a, name: folder):\n  |- test1.txt = File(id: b, name <TemplateStr>: test{{{{x.a}}}}.txt)\n|- folder2 = Folder(id: b, name: folder2):\n  |- test2.txt = File(id: b, name: test2.txt)\n\nContext: {{'x': {{'a': 1, 'random_property': 'abacus'}}, 'recipe': {{'name': '{expected_module}:TestRecipe', 'version': None, 'extension_name': 'TestRecipe'}}}}",
         )
+
+    def test_settings_from_environment(self):
+        with Env(override={"VERSION": "1.2.3"}):
+            recipe = Recipe(name="test", contents=[File(name="a.txt", content="{{version}}")])
+        self.assertEqual(recipe.version, "1.2.3")
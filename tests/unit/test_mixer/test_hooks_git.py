@@ -0,0 +1,149 @@
+"""Tests for git hooks."""
+
+import os
+import subprocess  # nosec B404
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import Any
+
+from nskit.mixer.components import File, Folder, Hook, Recipe
+from nskit.mixer.hooks.git import GitInit, GitInitialCommit
+
+
+def _git(path: Path, *args: str) -> str:
+    return subprocess.check_output(["git", *args], cwd=path).decode()  # nosec B603, B607
+
+
+class TestGitInit(unittest.TestCase):
+    """Tests for GitInit."""
+
+    def test_threaded(self):
+        """Repos can be initialised from several threads without changing the working directory."""
+        cwd = os.getcwd()
+        with TemporaryDirectory() as tmp:
+            paths = [Path(tmp) / str(i) for i in range(4)]
+            for path in paths:
+                path.mkdir()
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                list(executor.map(lambda path: GitInit()(path, {"git": {"initial_branch_name": path.name}}), paths))
+            self.assertEqual(os.getcwd(), cwd)
+            for path in paths:
+                self.assertEqual(_git(path, "symbolic-ref", "--short", "HEAD").strip(), path.name)
+
+
+class TestGitInitialCommit(unittest.TestCase):
+    """Tests for GitInitialCommit."""
+
+    def _recipe(self, post_hooks):
+        return Recipe(
+            name="project",
+            post_hooks=post_hooks,
+            contents=[
+                File(name="README.md", content="# Project\n"),
+                File(name="data.bin", content=b"\x00\x01"),
+                Folder(name="src", contents=[File(name="main.py", content="print('hi')\n")]),
+            ],
+        )
+
+    def test_initial_commit(self):
+        """The rendered files are committed, and the working tree is clean."""
+        with TemporaryDirectory() as tmp:
+            result = self._recipe([GitInit(), GitInitialCommit(message="Generated")]).create(Path(tmp))
+            project = next(iter(result))
+            self.assertEqual(_git(project, "log", "--format=%s %an <%ae>").strip(), "Generated nskit <nskit@noreply>")
+            self.assertEqual(
+                _git(project, "ls-tree", "-r", "--name-only", "HEAD").split(), ["README.md", "data.bin", "src/main.py"]
+            )
+            self.assertEqual(_git(project, "show", "HEAD:README.md"), "# Project\n")
+            # Only the recipe batch file (written after the hooks) is untracked
+            self.assertEqual(_git(project, "status", "--porcelain").strip(), "?? .recipe-batch.yaml")
+
+    def test_text_as_rendered(self):
+        """Text with non-ASCII characters and CRLF line endings is committed as written, leaving the tree clean."""
+        recipe = Recipe(
+            name="project",
+            post_hooks=[GitInit(), GitInitialCommit()],
+            contents=[File(name="notes.txt", content="caf\u00e9\r\nline\n")],
+        )
+        with TemporaryDirectory() as tmp:
+            project = next(iter(recipe.create(Path(tmp))))
+            committed = subprocess.check_output(["git", "show", "HEAD:notes.txt"], cwd=project)  # nosec B603, B607
+            self.assertEqual((project / "notes.txt").read_bytes(), committed)
+            self.assertEqual(_git(project, "status", "--porcelain").strip(), "?? .recipe-batch.yaml")
+
+    def test_static(self):
+        """Static files are committed from their source."""
+        with TemporaryDirectory() as tmp:
+            source = Path(tmp) / "logo.bin"
+            source.write_bytes(b"\x89PNG\x00")
+            recipe = Recipe(
+                name="project",
+                post_hooks=[GitInit(), GitInitialCommit()],
+                contents=[File(name="logo.bin", content=source, static=True)],
+            )
+            project = next(iter(recipe.create(Path(tmp))))
+            committed = subprocess.check_output(["git", "show", "HEAD:logo.bin"], cwd=project)  # nosec B603, B607
+            self.assertEqual(committed, b"\x89PNG\x00")
+
+    def test_unexpected_value(self):
+        """Values that aren't rendered content are rejected, rather than committed as text."""
+        with TemporaryDirectory() as tmp:
+            project = Path(tmp)
+            GitInit()(project, {})
+            (project / "a.txt").write_text("a")
+            with self.assertRaises(TypeError):
+                GitInitialCommit()(project, {}, rendered={project: {project / "a.txt": 1}})
+
+    def test_include_untracked(self):
+        """Other untracked files are committed from disk, ignored files are not."""
+        with TemporaryDirectory() as tmp:
+            project = Path(tmp)
+            GitInit()(project, {})
+            (project / ".gitignore").write_text("*.log\n")
+            (project / "README.md").write_text("# Project\n")
+            (project / "config.yaml").write_text("name: project\n")
+            (project / "debug.log").write_text("ignored\n")
+            rendered = {project: {project / ".gitignore": "*.log\n", project / "README.md": "# Project\n"}}
+            GitInitialCommit(include_untracked=True)(project, {}, rendered=rendered)
+            self.assertEqual(
+                _git(project, "ls-tree", "-r", "--name-only", "HEAD").split(),
+                [".gitignore", "README.md", "config.yaml"],
+            )
+            self.assertEqual(_git(project, "status", "--porcelain").strip(), "")
+
+    def test_executable_mode(self):
+        """Executable files keep their mode."""
+
+        class ChmodHook(Hook):
+            def call(self, recipe_path: Path, context: dict[str, Any]):
+                (recipe_path / "src" / "main.py").chmod(0o755)
+
+        with TemporaryDirectory() as tmp:
+            result = self._recipe([GitInit(), ChmodHook(), GitInitialCommit()]).create(Path(tmp))
+            project = next(iter(result))
+            self.assertIn("100755", _git(project, "ls-tree", "HEAD", "src/main.py"))
+
+    def test_not_a_repo(self):
+        """Nothing happens without a git repo."""
+        with TemporaryDirectory() as tmp:
+            result = self._recipe([GitInitialCommit()]).create(Path(tmp))
+            self.assertFalse((next(iter(result)) / ".git").exists())
+
+    def test_existing_commits(self):
+        """Repos that already have commits are left alone."""
+        with TemporaryDirectory() as tmp:
+            recipe = self._recipe([GitInit(), GitInitialCommit()])
+            project = next(iter(recipe.create(Path(tmp))))
+            head = _git(project, "rev-parse", "HEAD")
+            GitInitialCommit()(project, {}, rendered={project: {project / "other.txt": "other"}})
+            self.assertEqual(_git(project, "rev-parse", "HEAD"), head)
+
+    def test_no_rendered(self):
+        """Nothing is committed without the rendered files."""
+        with TemporaryDirectory() as tmp:
+            project = Path(tmp)
+            GitInit()(project, {})
+            GitInitialCommit()(project, {})
+            self.assertFalse((project / ".git" / "refs" / "heads" / "main").exists())
@@ -1,8 +1,22 @@
 """Tests for the reusable recipe test harness (nskit.mixer.testing)."""
 
+import hashlib
+import json
 import unittest
+from pathlib import Path
 
-from nskit.mixer.testing import check_recipe, check_recipes, list_recipes
+from nskit.common.contextmanagers import ChDir, Env
+from nskit.mixer import File, Folder, Recipe
+from nskit.mixer import __file__ as mixer_init
+from nskit.mixer.testing import (
+    GOLDEN_UPDATE_ENV_VAR,
+    build_manifest,
+    check_manifest,
+    check_recipe,
+    check_recipes,
+    list_recipes,
+)
+from nskit.mixer.utilities import Resource
 
 _REPO = {
     "owner": "Joe Bloggs",
@@ -56,3 +70,110 @@ class TestMixerTesting(unittest.TestCase):
 
 if __name__ == "__main__":
     unittest.main()
+
+
+class _ManifestRecipe(Recipe):
+    value: str = "a"
+    contents: list = [
+        File(name="a.txt", content="{{value}}\nline\n"),
+        Folder(name="sub", contents=[File(name="b.bin", content=b"\x00\x01")]),
+    ]
+
+
+class TestCheckManifest(unittest.TestCase):
+    """Tests for the golden manifest snapshot check."""
+
+    def test_build_manifest(self):
+        tree = {Path("/r"): {Path("/r/a.txt"): "abc", Path("/r/sub"): {Path("/r/sub/b.bin"): b"\x00"}}}
+        self.assertEqual(
+            build_manifest(tree),
+            {
+                "a.txt": {"size": 3, "sha256": hashlib.sha256(b"abc").hexdigest()},
+                "sub/b.bin": {"size": 1, "sha256": hashlib.sha256(b"\x00").hexdigest()},
+            },
+        )
+
+    def test_update_then_match(self):
+        with ChDir():
+            golden = Path("golden/recipe.json")
+            result = check_manifest(_ManifestRecipe, {"name": "r"}, golden=golden, update=True)
+            self.assertTrue(result.updated)
+            self.assertTrue(result.ok, result.summary())
+            self.assertEqual(sorted(json.loads(golden.read_text())), ["a.txt", "sub/b.bin"])
+            result = check_manifest(_ManifestRecipe, {"name": "r"}, golden=golden, update=False)
+            self.assertTrue(result.ok, result.summary())
+
+    def test_update_from_env(self):
+        with ChDir():
+            with Env(override={GOLDEN_UPDATE_ENV_VAR: "1"}):
+                result = check_manifest(_ManifestRecipe, {"name": "r"}, golden="golden.json")
+            self.assertTrue(result.updated)
+            self.assertTrue(Path("golden.json").exists())
+
+    def test_mismatch_with_diff(self):
+        with ChDir():
+            check_manifest(_ManifestRecipe, {"name": "r"}, golden="golden.json", contents_dir="golden", update=True)
+            self.assertEqual(Path("golden/sub/b.bin").read_bytes(), b"\x00\x01")
+            result = check_manifest(
+                _ManifestRecipe, {"name": "r", "value": "b"}, golden="golden.json", contents_dir="golden", update=False
+            )
+            self.assertFalse(result.ok)
+            self.assertEqual(list(result.changed), ["a.txt"])
+            self.assertIn("-a\n+b", result.changed["a.txt"])
+            self.assertIn("changed file: a.txt", result.summary())
+
+    def test_update_prunes_contents(self):
+        with ChDir():
+            Path("golden/old").mkdir(parents=True)
+            Path("golden/old/stale.txt").write_text("stale")
+            Path("golden/stale.txt").write_text("stale")
+            check_manifest(
+                _ManifestRecipe, {"name": "r"}, golden="golden/recipe.json", contents_dir="golden", update=True
+            )
+            self.assertEqual(
+                sorted(path.relative_to("golden").as_posix() for path in Path("golden").rglob("*")),
+                ["a.txt", "recipe.json", "sub", "sub/b.bin"],
+            )
+
+    def test_static(self):
+        """Static files are hashed and copied from their source."""
+        resource = Resource("nskit.mixer:__init__.py")
+        data = Path(mixer_init).read_bytes()
+
+        class StaticRecipe(_ManifestRecipe):
+            contents: list = [
+                *_ManifestRecipe.model_fields["contents"].default,
+                File(name="c.py", content=resource, static=True),
+            ]
+
+        with ChDir():
+            result = check_manifest(
+                StaticRecipe, {"name": "r"}, golden="golden.json", contents_dir="golden", update=True
+            )
+            self.assertTrue(result.ok, result.summary())
+            self.assertEqual(
+                json.loads(Path("golden.json").read_text())["c.py"],
+                {"size": len(data), "sha256": hashlib.sha256(data).hexdigest()},
+            )
+            self.assertEqual(Path("golden/c.py").read_bytes(), data)
+            result = check_manifest(
+                StaticRecipe, {"name": "r"}, golden="golden.json", contents_dir="golden", update=False
+            )
+            self.assertTrue(result.ok, result.summary())
+
+    def test_build_manifest_unexpected_value(self):
+        with self.assertRaises(TypeError):
+            build_manifest({Path("/r"): {Path("/r/a.txt"): 1}})
+
+    def test_missing_and_unexpected(self):
+        with ChDir():
+            Path("golden.json").write_text('{"c.txt": {"size": 0, "sha256": ""}}')
+            result = check_manifest(_ManifestRecipe, {"name": "r"}, golden="golden.json", update=False)
+            self.assertEqual(result.missing, ["c.txt"])
+            self.assertEqual(result.unexpected, ["a.txt", "sub/b.bin"])
+
+    def test_missing_golden(self):
+        with ChDir():
+            result = check_manifest(_ManifestRecipe, {"name": "r"}, golden="golden.json", update=False)
+            self.assertFalse(result.ok)
+            self.assertIn("does not exist", result.error)
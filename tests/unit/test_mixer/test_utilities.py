@@ -1,18 +1,30 @@
+import threading
 import unittest
+from functools import lru_cache
+from pathlib import Path
 from unittest.mock import DEFAULT, MagicMock, call, patch
 
 from jinja2 import ChoiceLoader
 from jinja2.sandbox import SandboxedEnvironment
 from pydantic import TypeAdapter, ValidationError
 
-from nskit.common.contextmanagers import Env, TestExtension
+from nskit.common.contextmanagers import ChDir, Env, TestExtension
 from nskit.mixer import __file__ as init_filepath
 from nskit.mixer.utilities import (
     JINJA_ENVIRONMENT_FACTORY,
+    RENDER_MEMO,
     Resource,
     TemplateNotFound,
     _EnvironmentFactory,
     _PkgResourcesTemplateLoader,
+    _RenderMemo,
+    changed_context_keys,
+    copy_static,
+    io_bound,
+    io_requests,
+    prefetch,
+    prefetched,
+    template_variables,
 )
 
 
@@ -210,3 +222,189 @@ class EnvironmentFactoryTestCase(unittest.TestCase):
         self.assertIsInstance(environment, SandboxedEnvironment)
         self.assertIsInstance(environment.loader, ChoiceLoader)
         self.assertIsInstance(environment.loader.loaders[0], _PkgResourcesTemplateLoader)
+
+
+class TemplateVariablesTestCase(unittest.TestCase):
+    def test_variables(self):
+        self.assertEqual(template_variables("{{a}} {{b.c}} {% set d = 1 %}{{d}}"), frozenset({"a", "b"}))
+
+    def test_static(self):
+        self.assertEqual(template_variables("static"), frozenset())
+
+    def test_include_unknown(self):
+        self.assertIsNone(template_variables('{% include "nskit.mixer:__init__.py" %}{{a}}'))
+
+    def test_changed_context_keys(self):
+        self.assertEqual(changed_context_keys({"a": 1, "b": 2, "c": 3}, {"a": 1, "b": 3, "d": 4}), {"b", "c", "d"})
+
+
+class RenderMemoTestCase(unittest.TestCase):
+    def setUp(self):
+        self.environment = _EnvironmentFactory.default_environment()
+        self.memo = _RenderMemo()
+        self.memo.enabled = True
+
+    def test_render_memoised(self):
+        self.assertEqual(self.memo.render(self.environment, "{{a}}", {"a": 1, "b": 2}), "1")
+        self.assertEqual((self.memo.hits, self.memo.misses), (0, 1))
+        # Unreferenced keys don't affect the memo
+        self.assertEqual(self.memo.render(self.environment, "{{a}}", {"a": 1, "b": 3}), "1")
+        self.assertEqual((self.memo.hits, self.memo.misses), (1, 1))
+        self.assertEqual(self.memo.render(self.environment, "{{a}}", {"a": 2, "b": 3}), "2")
+        self.assertEqual((self.memo.hits, self.memo.misses), (1, 2))
+
+    def test_render_unhashable_values(self):
+        context = {"a": object()}
+        self.memo.render(self.environment, "{{a is defined}}", context)
+        self.memo.render(self.environment, "{{a is defined}}", context)
+        self.assertEqual((self.memo.hits, self.memo.misses), (0, 0))
+
+    def test_builtin_recipe_memoised(self):
+        from nskit.recipes.python.package import PackageRecipe
+
+        repo = {"owner": "a", "email": "a@b.com", "url": "https://www.test.com"}
+        RENDER_MEMO.clear()
+        self.addCleanup(RENDER_MEMO.clear)
+        with (
+            patch.object(RENDER_MEMO, "enabled", True),
+            patch.object(_RenderMemo, "_key", side_effect=_RenderMemo._key) as key,
+        ):
+            first = PackageRecipe(name="a", repo=repo).dryrun(base_path=Path("out"))
+            misses, hits, calls = RENDER_MEMO.misses, RENDER_MEMO.hits, key.call_count
+            second = PackageRecipe(name="a", repo=repo).dryrun(base_path=Path("out"))
+        self.assertEqual(first, second)
+        keys = [_RenderMemo._key(*c.args) for c in key.call_args_list[calls:]]
+        # Only templates extending others can't be memoised, everything else is served from the memo
+        self.assertEqual(
+            [
+                c.args[1][:40]
+                for c, k in zip(key.call_args_list[calls:], keys)
+                if k is None and "extends" not in c.args[1]
+            ],
+            [],
+        )
+        self.assertGreater(len([k for k in keys if k is not None]), len(keys) // 2)
+        self.assertEqual(RENDER_MEMO.misses, misses)
+        self.assertEqual(RENDER_MEMO.hits - hits, len([k for k in keys if k is not None]))
+
+    def test_render_non_deterministic_global(self):
+        self.memo.render(self.environment, "{{lipsum(1)}}", {})
+        self.assertEqual((self.memo.hits, self.memo.misses), (0, 0))
+
+    def test_render_disabled(self):
+        self.memo.enabled = False
+        self.memo.render(self.environment, "{{a}}", {"a": 1})
+        self.memo.render(self.environment, "{{a}}", {"a": 1})
+        self.assertEqual((self.memo.hits, self.memo.misses), (0, 0))
+
+    def test_render_keeps_value_types(self):
+        self.assertEqual(self.memo.render(self.environment, "{{x}}", {"x": [1, 2]}), "[1, 2]")
+        self.assertEqual(self.memo.render(self.environment, "{{x}}", {"x": (1, 2)}), "(1, 2)")
+        self.assertEqual(self.memo.render(self.environment, "{{x.name}}", {"x": "a/b"}), "")
+        self.assertEqual(self.memo.render(self.environment, "{{x.name}}", {"x": Path("a/b")}), "b")
+        self.assertEqual(self.memo.render(self.environment, "{{x}}", {"x": {"a": 1}}), "{'a': 1}")
+        self.assertEqual(self.memo.render(self.environment, "{{x}}", {"x": {"list": [1]}}), "{'list': [1]}")
+        self.assertEqual((self.memo.hits, self.memo.misses), (0, 6))
+        self.memo.render(self.environment, "{{x.name}}", {"x": Path("a/b")})
+        self.assertEqual(self.memo.hits, 1)
+
+    def test_parsed_once(self):
+        with patch.object(self.environment, "parse", wraps=self.environment.parse) as parse:
+            for i in range(3):
+                self.memo.render(self.environment, "{{a}}", {"a": i})
+            self.assertEqual(self.memo.template_info(self.environment, "{{a}}").variables, frozenset({"a"}))
+        self.assertEqual(parse.call_count, 1)
+
+    def test_template_cached(self):
+        template = self.memo.get_template(self.environment, "{{a}}")
+        self.assertIs(self.memo.get_template(self.environment, "{{a}}"), template)
+        self.assertIsNot(self.memo.get_template(_EnvironmentFactory.default_environment(), "{{a}}"), template)
+
+    def test_maxsize(self):
+        self.memo.maxsize = 2
+        for i in range(3):
+            self.memo.render(self.environment, "{{a}}", {"a": i})
+        self.assertEqual(len(self.memo._rendered), 2)
+        self.memo.clear()
+        self.assertEqual(len(self.memo._rendered), 0)
+        self.assertEqual(len(self.memo._templates), 0)
+
+
+class CopyStaticTestCase(unittest.TestCase):
+    def test_copy(self):
+        with ChDir():
+            data = bytes(range(256)) * 1024
+            Path("source.bin").write_bytes(data)
+            copy_static(Path("source.bin"), Path("destination.bin"))
+            self.assertEqual(Path("destination.bin").read_bytes(), data)
+
+    def test_copy_fallback(self):
+        with ChDir():
+            Path("source.bin").write_bytes(b"abc")
+            with (
+                patch("nskit.mixer.utilities._reflink", return_value=False),
+                patch("nskit.mixer.utilities._copy_file_range", return_value=False),
+            ):
+                copy_static(Path("source.bin"), Path("destination.bin"))
+            self.assertEqual(Path("destination.bin").read_bytes(), b"abc")
+
+
+class PrefetchTestCase(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+
+        @io_bound
+        def fetch(key):
+            self.calls.append(key)
+            if key == "bad":
+                raise ValueError(key)
+            return key.upper()
+
+        self.fetch = fetch
+
+    def test_not_prefetched(self):
+        self.assertEqual(self.fetch("a"), "A")
+        self.assertEqual(self.calls, ["a"])
+
+    def test_prefetch_deduplicates(self):
+        results = prefetch([(self.fetch, ("a",)), (self.fetch, ("b",)), (self.fetch, ("a",))])
+        self.assertEqual(sorted(self.calls), ["a", "b"])
+        with prefetched(results):
+            self.assertEqual(self.fetch("a"), "A")
+            self.assertEqual(self.fetch("b"), "B")
+            # Not prefetched, so called directly
+            self.assertEqual(self.fetch("c"), "C")
+        self.assertEqual(sorted(self.calls), ["a", "b", "c"])
+
+    def test_prefetch_concurrent(self):
+        barrier = threading.Barrier(3, timeout=5)
+
+        @io_bound
+        def wait(key):
+            # Only completes if all the requests are in flight at the same time
+            barrier.wait()
+            return key
+
+        results = prefetch([(wait, (key,)) for key in range(3)])
+        self.assertEqual(results, {(wait, (key,)): (True, key) for key in range(3)})
+
+    def test_prefetch_error(self):
+        results = prefetch([(self.fetch, ("bad",))])
+        with prefetched(results):
+            with self.assertRaises(ValueError):
+                self.fetch("bad")
+        self.assertEqual(self.calls, ["bad"])
+
+    def test_io_requests(self):
+        @io_requests(lambda context: [(self.fetch, (context["key"],))])
+        def content(context):
+            return self.fetch(context["key"])
+
+        self.assertEqual(list(content.io_requests({"key": "a"})), [(self.fetch, ("a",))])
+
+    def test_wrapped_attributes(self):
+        fetch = io_bound(lru_cache(str.upper))
+        self.assertEqual(fetch("a"), "A")
+        self.assertEqual(fetch.cache_info().currsize, 1)
+        fetch.cache_clear()
+        self.assertEqual(fetch.cache_info().currsize, 0)
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import importlib
+import os
+import sys
+import tempfile
+import textwrap
+import unittest
+import uuid
+from pathlib import Path
+from unittest.mock import patch
+
+from nskit.mixer.components.file import File
+from nskit.mixer.utilities import StaticSource
+from nskit.mixer.watch import RecipeWatcher, _write_if_changed
+
+RECIPE_MODULE = """
+from pathlib import Path
+
+from nskit.mixer import File, Folder, Recipe
+
+HERE = Path(__file__).parent
+EXTRA = "{extra}"
+
+
+class WatchRecipe(Recipe):
+    title: str = "default"
+    contents: list[File | Folder] = [
+        File(name="README.md", content=HERE / "readme.jinja"),
+        File(name="title.txt", content="{{{{ title }}}}"),
+        Folder(name="static", contents=[File(name="fixed.txt", content="fixed")]),
+        File(name="{{{{ title }}}}.cfg", content="named"),
+        File(name="extra.txt", content=EXTRA),
+    ]
+"""
+
+
+class RecipeWatcherTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tempdir = tempfile.TemporaryDirectory()
+        self.root = Path(self._tempdir.name)
+        self.module_name = f"nskit_watch_{uuid.uuid4().hex}"
+        self.package = self.root / "src" / self.module_name
+        self.package.mkdir(parents=True)
+        self._write(self.package / "__init__.py", RECIPE_MODULE.format(extra="one"))
+        self._write(self.package / "readme.jinja", "# {{ title }}\n")
+        self.inputs = self.root / "inputs.yml"
+        self._write(self.inputs, "name: project\ntitle: first\n")
+        self.output = self.root / "out" / "project"
+        sys.path.insert(0, str(self.root / "src"))
+        self._patch = patch(
+            "nskit.mixer.components.recipe.load_extension",
+            lambda entrypoint, name: importlib.import_module(self.module_name).WatchRecipe,
+        )
+        self._patch.start()
+        self.watcher = RecipeWatcher("watch", self.output, self.inputs, interval=0)
+
+    def tearDown(self):
+        self._patch.stop()
+        sys.path.remove(str(self.root / "src"))
+        sys.modules.pop(self.module_name, None)
+        self._tempdir.cleanup()
+
+    @staticmethod
+    def _write(path: Path, content: str):
+        path.write_text(textwrap.dedent(content))
+        # Make sure the change is visible even on filesystems with coarse timestamps
+        stat = path.stat() if path.exists() else None
+        if stat is not None:
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    def test_render(self):
+        update = self.watcher.render()
+        self.assertEqual((self.output / "README.md").read_text(), "# first\n")
+        self.assertEqual((self.output / "title.txt").read_text(), "first")
+        self.assertEqual((self.output / "static" / "fixed.txt").read_text(), "fixed")
+        self.assertEqual(len(update.written), 5)
+        # Re-rendering unchanged content doesn't rewrite anything
+        self.assertEqual(self.watcher.render().written, [])
+
+    def test_poll_no_changes(self):
+        self.watcher.render()
+        self.assertIsNone(self.watcher.poll())
+
+    def test_template_change(self):
+        self.watcher.render()
+        self._write(self.package / "readme.jinja", "# {{ title }} changed\n")
+        with patch.object(File, "render_content", autospec=True, side_effect=File.render_content) as render_content:
+            update = self.watcher.poll()
+        self.assertEqual(update.written, [self.output / "README.md"])
+        self.assertEqual((self.output / "README.md").read_text(), "# first changed\n")
+        # Only the file using the changed template is rendered
+        self.assertEqual([call.args[0].name for call in render_content.call_args_list], ["README.md"])
+
+    def test_inputs_change(self):
+        self.watcher.render()
+        self._write(self.inputs, "name: project\ntitle: second\n")
+        update = self.watcher.poll()
+        self.assertEqual(
+            set(update.written),
+            {self.output / "README.md", self.output / "title.txt", self.output / "second.cfg"},
+        )
+        self.assertEqual(update.removed, [self.output / "first.cfg"])
+        self.assertFalse((self.output / "first.cfg").exists())
+        self.assertEqual((self.output / "title.txt").read_text(), "second")
+
+    def test_module_change(self):
+        self.watcher.render()
+        self._write(self.package / "__init__.py", RECIPE_MODULE.format(extra="two"))
+        update = self.watcher.poll()
+        self.assertEqual(update.written, [self.output / "extra.txt"])
+        self.assertEqual((self.output / "extra.txt").read_text(), "two")
+
+    def test_watched_paths(self):
+        """Only the recipe module's folder and its template folders are watched, not the whole package."""
+        recipes = self.package / "recipes"
+        templates = self.package / "templates"
+        recipes.mkdir()
+        templates.mkdir()
+        module = RECIPE_MODULE.format(extra="one").replace(
+            "HERE = Path(__file__).parent", 'HERE = Path(__file__).parent.parent / "templates"'
+        )
+        self._write(recipes / "__init__.py", module)
+        self._write(templates / "readme.jinja", "# {{ title }}\n")
+        with patch(
+            "nskit.mixer.components.recipe.load_extension",
+            lambda entrypoint, name: importlib.import_module(f"{self.module_name}.recipes").WatchRecipe,
+        ):
+            watcher = RecipeWatcher("watch", self.output, self.inputs, interval=0)
+            watcher.render()
+            self.assertEqual(
+                sorted(watcher.watched_paths()), sorted([self.inputs, recipes.resolve(), templates.resolve()])
+            )
+            self._write(self.package / "unrelated.txt", "unrelated")
+            self.assertIsNone(watcher.poll())
+            self._write(templates / "readme.jinja", "# {{ title }} changed\n")
+            self.assertEqual(watcher.poll().written, [self.output / "README.md"])
+        sys.modules.pop(f"{self.module_name}.recipes", None)
+
+    def test_run_recovers_from_errors(self):
+        updates = []
+        stops = iter([False, False, True])
+        with patch.object(RecipeWatcher, "poll", side_effect=[ValueError("bad template"), None]) as poll:
+            self.watcher.run(callback=updates.append, should_stop=lambda: next(stops))
+        self.assertEqual(poll.call_count, 2)
+        # Only the initial render
+        self.assertEqual(len(updates), 1)
+        self.assertTrue((self.output / "README.md").exists())
+
+
+class WriteIfChangedTestCase(unittest.TestCase):
+    def test_static(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            source = Path(tmp) / "source.bin"
+            source.write_bytes(b"\x00\x01")
+            path = Path(tmp) / "out.bin"
+            self.assertTrue(_write_if_changed(path, StaticSource(source)))
+            self.assertEqual(path.read_bytes(), b"\x00\x01")
+            self.assertFalse(_write_if_changed(path, StaticSource(source)))
+            source.write_bytes(b"\x02")
+            self.assertTrue(_write_if_changed(path, StaticSource(source)))
+            self.assertEqual(path.read_bytes(), b"\x02")
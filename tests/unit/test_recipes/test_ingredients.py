@@ -0,0 +1,123 @@
+"""Tests for the lazily built recipe ingredients."""
+
+import subprocess
+import sys
+import textwrap
+import unittest
+
+from nskit.mixer import File, Folder
+
+_INGREDIENT_MODULES = [
+    "nskit.recipes.common.ingredients",
+    "nskit.recipes.python.ingredients",
+    "nskit.recipes.python.ingredients.api",
+    "nskit.recipes.python.ingredients.docker",
+    "nskit.recipes.python.ingredients.docs",
+    "nskit.recipes.python.ingredients.package",
+    "nskit.recipes.python.ingredients.recipe",
+    "nskit.recipes.python.ingredients.tools",
+]
+
+
+class IngredientsImportTestCase(unittest.TestCase):
+    """Importing recipes should not build the ingredient models."""
+
+    def _run(self, code):
+        result = subprocess.run(  # nosec B603
+            [sys.executable, "-c", textwrap.dedent(code)], capture_output=True, text=True, timeout=120
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        return result.stdout.strip()
+
+    def test_import_nskit_does_not_import_ingredients(self):
+        output = self._run(
+            """
+            import sys
+            import nskit
+            print(sorted(m for m in sys.modules if ".ingredients" in m))
+            """
+        )
+        self.assertEqual(output, "[]")
+
+    def test_import_recipes_does_not_build_ingredients(self):
+        output = self._run(
+            f"""
+            import importlib
+            import nskit.recipes.python.api, nskit.recipes.python.package, nskit.recipes.recipe
+            for name in {_INGREDIENT_MODULES!r}:
+                module = importlib.import_module(name)
+                for attribute in module._ingredients._factories:
+                    if module._ingredients.materialised(attribute):
+                        print(name, attribute)
+            """
+        )
+        self.assertEqual(output, "")
+
+    def test_reload_rebuilds(self):
+        output = self._run(
+            """
+            import importlib
+            from nskit.recipes.python.ingredients import tools
+            gitignore = tools.gitignore
+            importlib.reload(tools)
+            print(tools._ingredients.materialised("gitignore"), tools.gitignore is gitignore)
+            """,
+        )
+        self.assertEqual(output, "False False")
+
+
+class IngredientsTestCase(unittest.TestCase):
+    def test_access_builds_once(self):
+        from nskit.recipes.python.ingredients import tools
+
+        gitignore = tools.gitignore
+        self.assertIsInstance(gitignore, File)
+        self.assertTrue(tools._ingredients.materialised("gitignore"))
+        self.assertIs(tools.gitignore, gitignore)
+
+    def test_alias(self):
+        from nskit.recipes.python import ingredients
+        from nskit.recipes.python.ingredients import tools
+
+        self.assertIs(ingredients.gitignore, tools.gitignore)
+        self.assertIn("gitignore", dir(ingredients))
+
+    def test_factory_names(self):
+        import importlib
+
+        for name in _INGREDIENT_MODULES:
+            module = importlib.import_module(name)
+            for attribute, factory in module._ingredients._factories.items():
+                with self.subTest(module=name, attribute=attribute):
+                    # Factories are named after the attribute with a single leading underscore (or are aliases)
+                    self.assertIn(factory.__name__, (f"_{attribute}", "factory"))
+
+    def test_missing(self):
+        from nskit.recipes.python import ingredients
+
+        with self.assertRaises(AttributeError):
+            ingredients.not_an_ingredient
+
+    def test_taskfiles_folder(self):
+        from nskit.recipes.common import ingredients as common_ingredients
+        from nskit.recipes.python.ingredients import docker, package, tools
+
+        self.assertIsInstance(tools.taskfiles_folder, Folder)
+        self.assertEqual([u.name for u in common_ingredients.taskfiles_folder.contents], ["common.yml"])
+        self.assertEqual([u.name for u in tools.taskfiles_folder.contents], ["common.yml", "python-common.yml"])
+        self.assertEqual(
+            [u.name for u in docker.taskfiles_folder.contents],
+            ["common.yml", "python-common.yml", "python-package.yml"],
+        )
+        self.assertEqual(
+            [u.name for u in package.taskfiles_folder.contents],
+            ["common.yml", "python-common.yml", "python-package.yml"],
+        )
+
+    def test_recipe_contents_not_shared(self):
+        from nskit.recipes.python.package import PackageRecipe
+
+        recipe1 = PackageRecipe(name="a", repo={"owner": "a", "email": "a@b.com", "url": "https://www.test.com"})
+        recipe2 = PackageRecipe(name="b", repo={"owner": "a", "email": "a@b.com", "url": "https://www.test.com"})
+        self.assertEqual(recipe1.contents, recipe2.contents)
+        self.assertIsNot(recipe1.contents[0], recipe2.contents[0])
@@ -0,0 +1,32 @@
+import unittest
+
+from nskit.recipes.python import PyRepoMetadata
+
+
+class PyRepoMetadataTestCase(unittest.TestCase):
+    def setUp(self):
+        self.repo = PyRepoMetadata(owner="a", email="a@b.com", url="https://www.test.com")
+        self.repo.name = "a.b-c"
+
+    def test_names(self):
+        self.assertEqual(self.repo.py_name, "a.b.c")
+        self.assertEqual(self.repo.py_root, "a")
+        self.assertEqual(self.repo.src_path, "a/b/c")
+        self.assertEqual(self.repo.module_depth, 3)
+
+    def test_name_change(self):
+        self.assertEqual(self.repo.py_name, "a.b.c")
+        self.repo.name = "x"
+        self.assertEqual(self.repo.py_name, "x")
+        self.assertEqual(self.repo.module_depth, 1)
+
+    def test_separator_change(self):
+        self.repo.name = "a_b"
+        self.assertEqual(self.repo.py_name, "a_b")
+        self.repo.repo_separator = "_"
+        self.assertEqual(self.repo.py_name, "a.b")
+
+    def test_model_dump(self):
+        dumped = self.repo.model_dump()
+        self.assertEqual(dumped["py_name"], "a.b.c")
+        self.assertEqual(dumped["src_path"], "a/b/c")
@@ -51,7 +51,7 @@ class TestRepositoryClient(unittest.TestCase):
             subprocess.run(["git", "commit", "-m", "init", "--no-verify"], cwd=project, capture_output=True, check=True)
 
             client = RepositoryClient(vcs_client=vcs)
-            with patch("nskit.recipes.repository_client.subprocess.run") as mock_run:
+            with patch("nskit.common.process.subprocess.run") as mock_run:
                 mock_run.return_value = MagicMock(returncode=0)
                 info = client.create_and_push("my-repo", project, description="desc")
 
@@ -71,7 +71,7 @@ class TestRepositoryClient(unittest.TestCase):
         vcs.get_clone_url.return_value = "https://github.com/org/my-repo.git"
 
         client = RepositoryClient(vcs_client=vcs)
-        with patch("nskit.recipes.repository_client.subprocess.run") as mock_run:
+        with patch("nskit.common.process.subprocess.run") as mock_run:
             mock_run.side_effect = subprocess.CalledProcessError(1, "git push")
             with self.assertRaises(subprocess.CalledProcessError):
                 client.create_and_push("my-repo", Path("/tmp/fake"))
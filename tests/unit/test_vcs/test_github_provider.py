@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import base64
 import unittest
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 from fastcore.net import HTTP404NotFoundError
 from pydantic import ValidationError
 
+from nskit.common import process
+from nskit.common.io import json
 from nskit.vcs.providers.github import GithubRepoClient, GithubSettings
 from nskit.vcs.providers.github import provider as github_module
 from nskit.vcs.providers.github.rulesets import Enforcement, Ruleset
@@ -228,18 +231,18 @@ class TestGhCliToken(unittest.TestCase):
     def test_returns_token_on_success(self) -> None:
         """A successful gh call yields the trimmed token."""
         completed = MagicMock(returncode=0, stdout="gho_abc123\n")
-        with patch.object(github_module.subprocess, "run", return_value=completed):
+        with patch.object(process.subprocess, "run", return_value=completed):
             self.assertEqual(github_module.gh_cli_token(), "gho_abc123")
 
     def test_returns_none_when_gh_missing(self) -> None:
         """A missing gh binary yields None rather than raising."""
-        with patch.object(github_module.subprocess, "run", side_effect=FileNotFoundError):
+        with patch.object(process.subprocess, "run", side_effect=FileNotFoundError):
             self.assertIsNone(github_module.gh_cli_token())
 
     def test_returns_none_when_not_authenticated(self) -> None:
         """A non-zero exit yields None."""
         completed = MagicMock(returncode=1, stdout="")
-        with patch.object(github_module.subprocess, "run", return_value=completed):
+        with patch.object(process.subprocess, "run", return_value=completed):
             self.assertIsNone(github_module.gh_cli_token())
 
     def test_not_used_unless_opted_in(self) -> None:
@@ -278,16 +281,23 @@ class TestTopics(GithubRepoClientTestCase):
         self.api.repos.replace_all_topics.assert_called_once_with(self.org, "repo", names=[])
 
 
+def _payload(call) -> Any:
+    """The JSON payload of a raw API call (pre-encoded to bytes on ghapi 2.x)."""
+    data = call.kwargs["data"]
+    return json.loads(data) if isinstance(data, bytes) else data
+
+
 class TestCustomProperties(GithubRepoClientTestCase):
     """Repository custom properties."""
 
     def test_set_custom_properties_sends_patch(self) -> None:
         """Custom properties are set via PATCH /orgs/{org}/properties/values."""
         self.client.set_custom_properties("repo", {"team": "platform", "tier": "internal"})
-        self.api.assert_called_once_with(
-            "/orgs/acme/properties/values",
-            "PATCH",
-            data={
+        self.api.assert_called_once()
+        self.assertEqual(self.api.call_args.args, ("/orgs/acme/properties/values", "PATCH"))
+        self.assertEqual(
+            _payload(self.api.call_args),
+            {
                 "repository_names": ["repo"],
                 "properties": [
                     {"property_name": "team", "value": "platform"},
@@ -299,9 +309,8 @@ class TestCustomProperties(GithubRepoClientTestCase):
     def test_set_single_property(self) -> None:
         """A single property is wrapped correctly."""
         self.client.set_custom_properties("repo", {"language": "python"})
-        _, kwargs = self.api.call_args
         self.assertEqual(
-            kwargs["data"]["properties"],
+            _payload(self.api.call_args)["properties"],
             [{"property_name": "language", "value": "python"}],
         )
 
@@ -331,10 +340,10 @@ class TestConfigureWithTopicsAndProperties(GithubRepoClientTestCase):
         """configure() calls set_custom_properties when configured."""
         client = self._client_with_settings(custom_properties={"team": "platform"})
         client.configure("repo")
-        self.api.assert_called_with(
-            "/orgs/acme/properties/values",
-            "PATCH",
-            data={
+        self.assertEqual(self.api.call_args.args, ("/orgs/acme/properties/values", "PATCH"))
+        self.assertEqual(
+            _payload(self.api.call_args),
+            {
                 "repository_names": ["repo"],
                 "properties": [{"property_name": "team", "value": "platform"}],
             },
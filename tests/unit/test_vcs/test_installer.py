@@ -6,6 +6,7 @@ from unittest.mock import MagicMock, call, create_autospec, patch
 from pydantic import ValidationError
 
 import nskit.vcs.installer as installer
+from nskit.common import process
 from nskit.common.contextmanagers import ChDir, Env
 from nskit.vcs.installer import ENTRYPOINT, Installer, PythonInstaller
 
@@ -156,25 +157,29 @@ class PythonInstallerTestCase(unittest.TestCase):
             installer = PythonInstaller(virtualenv_dir=venv_path.absolute())
             self.assertEqual(installer._get_executable(Path.cwd(), "abc"), "abc")
 
-    @patch.object(installer, "subprocess", autospec=True)
+    @patch.object(process, "subprocess", autospec=True)
     def test_install_setup_py_no_deps(self, sp):
         with ChDir():
             installer = PythonInstaller()
             with open("setup.py", "w") as f:
                 f.write("\n")
             installer.install(Path.cwd(), executable="abc", deps=False)
-            sp.check_call.assert_called_once_with(["abc", "-m", "pip", "install", "-e", ".[dev]", "--no-deps"])
+            sp.check_call.assert_called_once_with(
+                ["abc", "-m", "pip", "install", "-e", ".[dev]", "--no-deps"], cwd=Path.cwd()
+            )
 
-    @patch.object(installer, "subprocess", autospec=True)
+    @patch.object(process, "subprocess", autospec=True)
     def test_install_pyproject_toml_no_deps(self, sp):
         with ChDir():
             installer = PythonInstaller()
             with open("pyproject.toml", "w") as f:
                 f.write("\n")
             installer.install(Path.cwd(), executable="abc", deps=False)
-            sp.check_call.assert_called_once_with(["abc", "-m", "pip", "install", "-e", ".[dev]", "--no-deps"])
+            sp.check_call.assert_called_once_with(
+                ["abc", "-m", "pip", "install", "-e", ".[dev]", "--no-deps"], cwd=Path.cwd()
+            )
 
-    @patch.object(installer, "subprocess", autospec=True)
+    @patch.object(process, "subprocess", autospec=True)
     def test_install_requirements_txt_no_deps(self, sp):
         with ChDir():
             installer = PythonInstaller()
@@ -183,29 +188,31 @@ class PythonInstallerTestCase(unittest.TestCase):
             installer.install(Path.cwd(), executable="abc", deps=False)
             sp.check_call.assert_not_called()
 
-    @patch.object(installer, "subprocess", autospec=True)
+    @patch.object(process, "subprocess", autospec=True)
     def test_install_setup_py_no_deps(self, sp):
         with ChDir():
             installer = PythonInstaller()
             with open("setup.py", "w") as f:
                 f.write("\n")
             installer.install(Path.cwd(), executable="abc", deps=True)
-            sp.check_call.assert_called_once_with(["abc", "-m", "pip", "install", "-e", ".[dev]"])
+            sp.check_call.assert_called_once_with(["abc", "-m", "pip", "install", "-e", ".[dev]"], cwd=Path.cwd())
 
-    @patch.object(installer, "subprocess", autospec=True)
+    @patch.object(process, "subprocess", autospec=True)
     def test_install_pyproject_toml_no_deps(self, sp):
         with ChDir():
             installer = PythonInstaller()
             with open("pyproject.toml", "w") as f:
                 f.write("\n")
             installer.install(Path.cwd(), executable="abc", deps=True)
-            sp.check_call.assert_called_once_with(["abc", "-m", "pip", "install", "-e", ".[dev]"])
+            sp.check_call.assert_called_once_with(["abc", "-m", "pip", "install", "-e", ".[dev]"], cwd=Path.cwd())
 
-    @patch.object(installer, "subprocess", autospec=True)
+    @patch.object(process, "subprocess", autospec=True)
     def test_install_requirements_txt_deps(self, sp):
         with ChDir():
             installer = PythonInstaller()
             with open("requirements.txt", "w") as f:
                 f.write("\n")
             installer.install(Path.cwd(), executable="abc", deps=True)
-            sp.check_call.assert_called_once_with(["abc", "-m", "pip", "install", "-r", "requirements.txt"])
+            sp.check_call.assert_called_once_with(
+                ["abc", "-m", "pip", "install", "-r", "requirements.txt"], cwd=Path.cwd()
+            )
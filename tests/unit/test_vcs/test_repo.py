@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, NonCallableMagicMock, call, create_autospec
 import git
 from pydantic import ValidationError
 
+from nskit.common import process
 from nskit.common.contextmanagers import ChDir, Env, TestExtension
 from nskit.common.io import yaml
 from nskit.vcs import installer, repo
@@ -204,7 +205,7 @@ class _RepoTestCase(unittest.TestCase):
         r.pull(remote="random")
         r._git_repo.remotes.random.pull.assert_called_once_with()
 
-    @patch.object(repo, "subprocess", autospec=True)
+    @patch.object(process, "subprocess", autospec=True)
     @patch.object(RepoClient, "__abstractmethods__", set())
     def test_commit_no_paths(self, sp):
         r = _Repo(name="test", provider_client=RepoClient())
@@ -213,9 +214,14 @@ class _RepoTestCase(unittest.TestCase):
             Path("test").mkdir()
             r._git_repo.working_tree_dir = Path("test")
             r.commit("x")
-            sp.check_call.assert_has_calls([call(["git", "add", "*"]), call(["git", "commit", "-m", "x"])])
+            sp.check_call.assert_has_calls(
+                [
+                    call(["git", "add", "*"], cwd=Path("test")),
+                    call(["git", "commit", "-m", "x"], cwd=Path("test")),
+                ]
+            )
 
-    @patch.object(repo, "subprocess", autospec=True)
+    @patch.object(process, "subprocess", autospec=True)
     @patch.object(RepoClient, "__abstractmethods__", set())
     def test_commit_paths(self, sp):
         r = _Repo(name="test", provider_client=RepoClient())
@@ -224,9 +230,14 @@ class _RepoTestCase(unittest.TestCase):
             Path("test").mkdir()
             r._git_repo.working_tree_dir = Path("test")
             r.commit("x", "a*")
-            sp.check_call.assert_has_calls([call(["git", "add", "a*"]), call(["git", "commit", "-m", "x"])])
+            sp.check_call.assert_has_calls(
+                [
+                    call(["git", "add", "a*"], cwd=Path("test")),
+                    call(["git", "commit", "-m", "x"], cwd=Path("test")),
+                ]
+            )
 
-    @patch.object(repo, "subprocess", autospec=True)
+    @patch.object(process, "subprocess", autospec=True)
     @patch.object(RepoClient, "__abstractmethods__", set())
     def test_commit_paths_no_hooks(self, sp):
         r = _Repo(name="test", provider_client=RepoClient())
@@ -236,7 +247,10 @@ class _RepoTestCase(unittest.TestCase):
             r._git_repo.working_tree_dir = Path("test")
             r.commit("x", "a*", hooks=False)
             sp.check_call.assert_has_calls(
-                [call(["git", "add", "a*"]), call(["git", "commit", "--no-verify", "-m", "x"])]
+                [
+                    call(["git", "add", "a*"], cwd=Path("test")),
+                    call(["git", "commit", "--no-verify", "-m", "x"], cwd=Path("test")),
+                ]
             )
 
     @patch.object(RepoClient, "__abstractmethods__", set())
@@ -300,7 +314,7 @@ class _RepoTestCase(unittest.TestCase):
         r._git_repo.heads.abc.checkout.assert_called_once_with()
         r._git_repo.create_head.assert_not_called()
 
-    @patch.object(installer, "subprocess", autospec=True)
+    @patch.object(process, "subprocess", autospec=True)
     @patch.object(RepoClient, "__abstractmethods__", set())
     def test_install_no_content(self, sp):
         with ChDir():
@@ -309,7 +323,7 @@ class _RepoTestCase(unittest.TestCase):
             r.install()
             sp.check_call.assert_not_called()
 
-    @patch.object(installer, "subprocess", autospec=True)
+    @patch.object(process, "subprocess", autospec=True)
     @patch.object(RepoClient, "__abstractmethods__", set())
     def test_install_pyproject_toml(self, sp):
         with ChDir():
@@ -320,9 +334,11 @@ class _RepoTestCase(unittest.TestCase):
                 f.write("")
             r.install()
             expected = self._get_executable_path((Path.cwd() / ".venv").absolute())
-            sp.check_call.assert_called_once_with([str(expected), "-m", "pip", "install", "-e", ".[dev]"])
+            sp.check_call.assert_called_once_with(
+                [str(expected), "-m", "pip", "install", "-e", ".[dev]"], cwd=r.local_dir
+            )
 
-    @patch.object(installer, "subprocess", autospec=True)
+    @patch.object(process, "subprocess", autospec=True)
     @patch.object(RepoClient, "__abstractmethods__", set())
     def test_install_setup_py(self, sp):
         with ChDir():
@@ -333,9 +349,11 @@ class _RepoTestCase(unittest.TestCase):
                 f.write("")
             r.install()
             expected = self._get_executable_path((Path.cwd() / ".venv").absolute())
-            sp.check_call.assert_called_once_with([str(expected), "-m", "pip", "install", "-e", ".[dev]"])
+            sp.check_call.assert_called_once_with(
+                [str(expected), "-m", "pip", "install", "-e", ".[dev]"], cwd=r.local_dir
+            )
 
-    @patch.object(installer, "subprocess", autospec=True)
+    @patch.object(process, "subprocess", autospec=True)
     @patch.object(RepoClient, "__abstractmethods__", set())
     def test_install_no_deps_requirements(self, sp):
         with ChDir():
@@ -347,7 +365,7 @@ class _RepoTestCase(unittest.TestCase):
             r.install(deps=False)
             sp.check_call.assert_not_called()
 
-    @patch.object(installer, "subprocess", autospec=True)
+    @patch.object(process, "subprocess", autospec=True)
     @patch.object(RepoClient, "__abstractmethods__", set())
     def test_install_deps_requirements(self, sp):
         with ChDir():
@@ -358,9 +376,11 @@ class _RepoTestCase(unittest.TestCase):
                 f.write("")
             r.install(deps=True)
             expected = self._get_executable_path((Path.cwd() / ".venv").absolute())
-            sp.check_call.assert_called_once_with([str(expected), "-m", "pip", "install", "-r", "requirements.txt"])
+            sp.check_call.assert_called_once_with(
+                [str(expected), "-m", "pip", "install", "-r", "requirements.txt"], cwd=r.local_dir
+            )
 
-    @patch.object(installer, "subprocess", autospec=True)
+    @patch.object(process, "subprocess", autospec=True)
     @patch.object(RepoClient, "__abstractmethods__", set())
     def test_install_deps_pyproject_requirements(self, sp):
         with ChDir():
@@ -373,7 +393,9 @@ class _RepoTestCase(unittest.TestCase):
                 f.write("")
             r.install(deps=True)
             expected = self._get_executable_path((Path.cwd() / ".venv").absolute())
-            sp.check_call.assert_called_once_with([str(expected), "-m", "pip", "install", "-e", ".[dev]"])
+            sp.check_call.assert_called_once_with(
+                [str(expected), "-m", "pip", "install", "-e", ".[dev]"], cwd=r.local_dir
+            )
 
 
 class NamespaceValidationRepoTestCase(unittest.TestCase):
@@ -516,7 +538,7 @@ class NamespaceValidationRepoTestCase(unittest.TestCase):
             r._git_repo.heads.main.checkout.assert_called_once_with()
             r._git_repo.create_head.assert_not_called()
 
-    @patch.object(repo, "subprocess", autospec=True)
+    @patch.object(process, "subprocess", autospec=True)
     def test_create_from_validator(self, sp):
         with ChDir():
             nsv = NamespaceValidator(options=[{"a": ["b", "c"]}, "d"])
@@ -535,15 +557,15 @@ class NamespaceValidationRepoTestCase(unittest.TestCase):
             self.assertTrue(Path("README.md").exists())
             sp.check_call.assert_has_calls(
                 [
-                    call(["git", "add", "namespaces2.yaml", "README.md"]),
-                    call(["git", "commit", "-m", "Initial Namespaces Commit"]),
+                    call(["git", "add", "namespaces2.yaml", "README.md"], cwd=Path.cwd()),
+                    call(["git", "commit", "-m", "Initial Namespaces Commit"], cwd=Path.cwd()),
                 ]
             )
             with open("namespaces2.yaml") as f:
                 nsv2 = NamespaceValidator(**yaml.load(f))
             self.assertEqual(nsv, nsv2)
 
-    @patch.object(repo, "subprocess", autospec=True)
+    @patch.object(process, "subprocess", autospec=True)
     def test_create_from_validator_override(self, sp):
         with ChDir():
             nsv = NamespaceValidator(options=[{"a": ["b", "c"]}, "d"], delimiters=["."], repo_separator="/")
@@ -560,8 +582,8 @@ class NamespaceValidationRepoTestCase(unittest.TestCase):
             self.assertTrue(Path("README.md").exists())
             sp.check_call.assert_has_calls(
                 [
-                    call(["git", "add", "namespaces.yaml", "README.md"]),
-                    call(["git", "commit", "-m", "Initial Namespaces Commit"]),
+                    call(["git", "add", "namespaces.yaml", "README.md"], cwd=Path.cwd()),
+                    call(["git", "commit", "-m", "Initial Namespaces Commit"], cwd=Path.cwd()),
                 ]
             )
             with open("namespaces.yaml") as f:
@@ -573,7 +595,7 @@ class NamespaceValidationRepoTestCase(unittest.TestCase):
             self.assertEqual(nsv2.delimiters, [".", "-"])
             self.assertEqual(nsv2.repo_separator, "-")
 
-    @patch.object(repo, "subprocess", autospec=True)
+    @patch.object(process, "subprocess", autospec=True)
     def test_create_from_options_override(self, sp):
         with ChDir():
             options = [{"a": ["b", "c"]}, "d"]
@@ -590,8 +612,8 @@ class NamespaceValidationRepoTestCase(unittest.TestCase):
             self.assertTrue(Path("README.md").exists())
             sp.check_call.assert_has_calls(
                 [
-                    call(["git", "add", "namespaces.yaml", "README.md"]),
-                    call(["git", "commit", "-m", "Initial Namespaces Commit"]),
+                    call(["git", "add", "namespaces.yaml", "README.md"], cwd=Path.cwd()),
+                    call(["git", "commit", "-m", "Initial Namespaces Commit"], cwd=Path.cwd()),
                 ]
             )
             with open("namespaces.yaml") as f:
@@ -600,7 +622,7 @@ class NamespaceValidationRepoTestCase(unittest.TestCase):
             self.assertEqual(nsv2.delimiters, [".", "/"])
             self.assertEqual(nsv2.repo_separator, "/")
 
-    @patch.object(repo, "subprocess", autospec=True)
+    @patch.object(process, "subprocess", autospec=True)
     def test_create_from_options_default(self, sp):
         with ChDir():
             options = [{"a": ["b", "c"]}, "d"]
@@ -617,8 +639,8 @@ class NamespaceValidationRepoTestCase(unittest.TestCase):
             self.assertTrue(Path("README.md").exists())
             sp.check_call.assert_has_calls(
                 [
-                    call(["git", "add", "namespaces.yaml", "README.md"]),
-                    call(["git", "commit", "-m", "Initial Namespaces Commit"]),
+                    call(["git", "add", "namespaces.yaml", "README.md"], cwd=Path.cwd()),
+                    call(["git", "commit", "-m", "Initial Namespaces Commit"], cwd=Path.cwd()),
                 ]
             )
             with open("namespaces.yaml") as f:
@@ -645,7 +667,7 @@ class RepoTestCase(unittest.TestCase):
         self.assertEqual(repo.name, "abc")
         self.assertEqual(repo.validation_level, ValidationEnum.strict)
 
-    @patch.object(repo, "subprocess", autospec=True)
+    @patch.object(process, "subprocess", autospec=True)
     def test_validate_name_validation_ok(self, sp):
         with ChDir():
             options = [{"a": ["b", "c"]}, "d"]
@@ -661,7 +683,7 @@ class RepoTestCase(unittest.TestCase):
             )
             self.assertEqual(repo.name, "a-b-x")
 
-    @patch.object(repo, "subprocess", autospec=True)
+    @patch.object(process, "subprocess", autospec=True)
     def test_validate_name_validation_warn(self, sp):
         with ChDir():
             options = [{"a": ["b", "c"]}, "d"]
@@ -680,7 +702,7 @@ class RepoTestCase(unittest.TestCase):
                 Repo(name="abc", provider_client=cl, namespace_validation_repo=r, validation_level=ValidationEnum.warn)
         pass
 
-    @patch.object(repo, "subprocess", autospec=True)
+    @patch.object(process, "subprocess", autospec=True)
     def test_validate_name_validation_error(self, sp):
         with ChDir():
             options = [{"a": ["b", "c"]}, "d"]